@@ -0,0 +1,89 @@
+"""
+CPU time and peak memory of parsing large `get_tag_stream` response.
+"text + res.json()" reproduces the previous pipeline, which decoded body
+to str for logging and parsed it again from text. Other variants parse
+raw bytes once with given decoder.
+
+Run from repository root:
+
+    python -m benchmarks.bench_decode
+"""
+
+import importlib.util
+import json
+import time
+import tracemalloc
+from typing import Callable
+
+import requests
+
+from pywykop3.decoders import get_decoder
+
+PAGES = 50
+ENTRIES_PER_PAGE = 25
+RUNS = 20
+
+
+def _entry(entry_id: int) -> dict:
+    return {
+        "id": entry_id,
+        "author": {"username": f"user{entry_id % 97}", "rank": entry_id},
+        "content": "Zażółć gęślą jaźń #python " * 20,
+        "tags": ["python", "programowanie", "wykop"],
+        "votes": {"up": entry_id % 50, "down": 0, "users": []},
+        "comments": {
+            "count": 2,
+            "items": [
+                {"id": entry_id * 10 + i, "content": "komentarz " * 10}
+                for i in range(2)
+            ],
+        },
+    }
+
+
+def make_response() -> requests.Response:
+    data = [_entry(i) for i in range(PAGES * ENTRIES_PER_PAGE)]
+    payload = {"data": data, "pagination": {"next": "cursor"}}
+    res = requests.Response()
+    res.status_code = 200
+    res.encoding = None
+    res.headers["Content-Type"] = "application/json"
+    # pylint: disable=protected-access
+    res._content = json.dumps(payload).encode()
+    return res
+
+
+def text_then_json(res: requests.Response) -> object:
+    text = res.text
+    return res.json() if text else None
+
+
+def measure(parse: Callable[[requests.Response], object]) -> tuple:
+    res = make_response()
+    start = time.process_time()
+    for _ in range(RUNS):
+        parse(res)
+    cpu = (time.process_time() - start) / RUNS
+    tracemalloc.start()
+    parse(res)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu, peak
+
+
+def main() -> None:
+    variants = {"text + res.json()": text_then_json}
+    for name in ("json", "orjson", "msgspec"):
+        if name == "json" or importlib.util.find_spec(name) is not None:
+            decoder = get_decoder(name)
+            variants[f"{name} on bytes"] = lambda res, d=decoder: d(res.content)
+    size = len(make_response().content) / 2**20
+    print(f"payload: {size:.1f} MiB")
+    print(f"{'pipeline':<20}{'cpu [ms]':>12}{'peak memory [MiB]':>20}")
+    for name, parse in variants.items():
+        cpu, peak = measure(parse)
+        print(f"{name:<20}{1000 * cpu:>12.1f}{peak / 2**20:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
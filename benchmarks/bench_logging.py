@@ -0,0 +1,88 @@
+"""
+Logging overhead per large `get_tag_stream` page. "previous" reproduces
+the former pipeline: eager `str(params)` and `str(data)`, whole `res.text`
+decoded and logged at INFO and pagination printed to stdout. "current" is
+request logging and :meth:`WykopConnector._parse`. JSON parsing is
+replaced with a constant in both variants, so only logging is measured.
+
+Every variant is measured with logging disabled (WARNING) and enabled
+(DEBUG, records written to memory).
+
+Run from repository root:
+
+    python -m benchmarks.bench_logging
+"""
+
+import contextlib
+import io
+import json
+import logging
+import time
+from typing import Callable
+
+from pywykop3 import WykopConnector
+from pywykop3.testing import make_entry
+
+PER_PAGE = 500
+RUNS = 200
+PARSED = {"data": [], "pagination": {"next": 3}}
+PARAMS = {"sort": "all", "type": "entry", "page": 2}
+URL = "https://wykop.pl/api/v3/tags/python/stream"
+
+
+def previous(connector: WykopConnector, body: bytes) -> None:
+    logging.info(
+        "Executing %s - %s, params: %s, data: %s",
+        "GET",
+        URL,
+        str(PARAMS),
+        str(None),
+    )
+    text = body.decode()
+    logging.info("res.text='%s'", text)
+    res = connector._make_response(  # pylint: disable=protected-access
+        200, PARSED
+    )
+    print(f"{res.pagination=}")
+
+
+def current(connector: WykopConnector, body: bytes) -> None:
+    # pylint: disable=protected-access
+    connector._log_request("GET", URL, PARAMS, None)
+    connector._parse(200, body)
+
+
+def measure(parse: Callable, connector: WykopConnector, body: bytes) -> float:
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.process_time()
+        for _ in range(RUNS):
+            parse(connector, body)
+        return (time.process_time() - start) / RUNS
+
+
+def main() -> None:
+    data = [make_entry(i) for i in range(PER_PAGE)]
+    body = json.dumps({"data": data, "pagination": {"next": 3}}).encode()
+    connector = WykopConnector(
+        "key", "secret", url="http://localhost/", decoder=lambda _: PARSED
+    )
+    root = logging.getLogger()
+    stream = io.StringIO()
+    root.addHandler(logging.StreamHandler(stream))
+    print(f"page: {len(body) / 2**20:.1f} MiB")
+    print(f"{'variant':<12}{'level':<10}{'cpu [ms]':>10}{'log [KiB]':>12}")
+    for level in (logging.WARNING, logging.DEBUG):
+        root.setLevel(level)
+        for name, parse in (("previous", previous), ("current", current)):
+            stream.seek(0)
+            stream.truncate()
+            cpu = measure(parse, connector, body)
+            log_size = len(stream.getvalue()) / RUNS / 1024
+            print(
+                f"{name:<12}{logging.getLevelName(level):<10}"
+                f"{1000 * cpu:>10.2f}{log_size:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Memory held per crawled item, raw dictionaries vs compact models, for
+realistic `get_tag_stream` pages (25 entries with 2 comments each).
+
+Run from repository root:
+
+    python -m benchmarks.bench_models
+"""
+
+import json
+import tracemalloc
+from typing import Callable, List
+
+from pywykop3.decoders import get_decoder
+from pywykop3.models import Entry
+from pywykop3.testing import make_entry
+
+PAGES = 200
+PER_PAGE = 25
+
+
+def make_pages() -> List[bytes]:
+    return [
+        json.dumps(
+            {"data": [make_entry(page * PER_PAGE + i) for i in range(PER_PAGE)]}
+        ).encode()
+        for page in range(PAGES)
+    ]
+
+
+def held_memory(pages: List[bytes], parse: Callable[[bytes], list]) -> int:
+    """
+    Bytes still allocated after all pages are parsed and kept.
+    """
+    tracemalloc.start()
+    kept = []
+    for raw in pages:
+        kept.extend(parse(raw))
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+def main() -> None:
+    pages = make_pages()
+    decoder = get_decoder()
+    variants = {
+        "dict": lambda raw: decoder(raw)["data"],
+        "model": lambda raw: Entry.from_list(decoder(raw)["data"]),
+    }
+    items = PAGES * PER_PAGE
+    print(f"{'variant':<10}{'bytes per entry':>18}")
+    for name, parse in variants.items():
+        print(f"{name:<10}{held_memory(pages, parse) / items:>18.0f}")
+
+
+if __name__ == "__main__":
+    main()
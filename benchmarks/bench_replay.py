@@ -0,0 +1,92 @@
+"""
+Client overhead on recorded traffic. Interactions of a cassette are sent
+again through :meth:`WykopConnector.request` in replay mode, so measured
+time is spent in the client only: sessions, adapters, auth, parsing and
+response handling.
+
+Without arguments a cassette of typical calls is recorded first against
+:class:`FakeWykop`. Captured production traffic can be passed instead.
+
+Run from repository root:
+
+    python -m benchmarks.bench_replay
+    python -m benchmarks.bench_replay wykop.jsonl.gz
+"""
+
+import cProfile
+import pstats
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+from urllib.parse import parse_qsl, urlsplit
+
+from pywykop3 import Cassette, TransportConfig, WykopAPI, WykopConnector
+from pywykop3.testing import FakeWykop
+
+RUNS = 20
+
+
+def record(path: str) -> None:
+    fake = FakeWykop(stream_size=500)
+    with fake.server() as server:
+        transport = TransportConfig(cassette=path, cassette_mode="record")
+        connector = WykopConnector(
+            refresh_token="refresh", url=server.url, transport=transport
+        )
+        api = WykopAPI(connector=connector)
+        api.get_tag_stream("python", page_count=-1)
+        for entry_id in range(1, 201):
+            api.get_entry_by_id(entry_id)
+        api.get_entry_comments(5, page_count=-1)
+        connector.close()
+
+
+def replay(connector: WykopConnector, interactions: List[Dict]) -> None:
+    for interaction in interactions:
+        parts = urlsplit(interaction["url"])
+        endpoint = parts.path[len(urlsplit(connector.URL).path) :]
+        connector.request(
+            interaction["method"],
+            endpoint,
+            params=dict(parse_qsl(parts.query)),
+        )
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        if len(sys.argv) > 1:
+            path = sys.argv[1]
+        else:
+            path = str(Path(directory) / "bench.jsonl")
+            record(path)
+        cassette = Cassette(path)
+        interactions = [
+            interaction
+            for interaction in cassette.interactions()
+            if not interaction["url"].endswith(("/auth", "/refresh-token"))
+        ]
+        url = interactions[0]["url"]
+        url = url[: url.index("/api/v3/") + len("/api/v3/")]
+        connector = WykopConnector(
+            refresh_token="replay",
+            url=url,
+            transport=TransportConfig(cassette=path),
+        )
+        replay(connector, interactions)
+        start = time.perf_counter()
+        for _ in range(RUNS):
+            replay(connector, interactions)
+        elapsed = (time.perf_counter() - start) / RUNS
+        print(
+            f"{len(interactions)} requests: {1000 * elapsed:.1f} ms, "
+            f"{1e6 * elapsed / len(interactions):.0f} us per request"
+        )
+        profile = cProfile.Profile()
+        profile.runcall(replay, connector, interactions)
+        pstats.Stats(profile).sort_stats("cumulative").print_stats(15)
+
+
+if __name__ == "__main__":
+    main()
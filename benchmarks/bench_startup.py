@@ -0,0 +1,54 @@
+"""
+Time from connector construction to the first completed request, against
+local stand-in server with simulated network latency. "eager" reproduces
+the previous constructor, which authenticated and fetched connect url
+before returning.
+
+Run from repository root:
+
+    python -m benchmarks.bench_startup
+"""
+
+import time
+
+from pywykop3 import WykopAPI, WykopConnector
+from pywykop3.testing import MockWykopServer
+
+LATENCY = 0.05
+RUNS = 10
+
+
+def _popular(_) -> tuple:
+    return 200, {"data": [{"name": "python"}]}
+
+
+def time_to_first_request(url: str, eager: bool, token: str | None) -> float:
+    start = time.perf_counter()
+    connector = WykopConnector("key", "secret", url=url, token=token)
+    if eager:
+        connector.connect()
+    WykopAPI(connector=connector).get_tags_popular()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    routes = {("GET", "tags/popular"): _popular}
+    with MockWykopServer(routes, latency=LATENCY) as server:
+        cached = WykopConnector("key", "secret", url=server.url)
+        cached.connect()
+        variants = {
+            "eager (auth + connect)": (True, None),
+            "lazy": (False, None),
+            "lazy, cached token": (False, cached.token),
+        }
+        print(f"{'startup':<26}{'time to first request [ms]':>28}")
+        for name, (eager, token) in variants.items():
+            timings = [
+                time_to_first_request(server.url, eager, token)
+                for _ in range(RUNS)
+            ]
+            print(f"{name:<26}{1000 * sum(timings) / RUNS:>28.1f}")
+
+
+if __name__ == "__main__":
+    main()
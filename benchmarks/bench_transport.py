@@ -0,0 +1,61 @@
+"""
+Requests per second of small JSON calls (`get_tag_newer`) against local
+stand-in server, with and without pooled keep-alive transport.
+
+Run from repository root:
+
+    python -m benchmarks.bench_transport
+"""
+
+import time
+from typing import Callable
+
+import requests
+
+from pywykop3 import WykopAPI, WykopConnector
+from pywykop3.testing import MockWykopServer
+
+CALLS = 500
+
+
+def _newer(_) -> tuple:
+    return 200, {"data": {"count": 3}}
+
+
+def measure(function: Callable[[], None], calls: int = CALLS) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    routes = {("GET", "tags/python/newer"): _newer}
+    with MockWykopServer(routes) as server:
+        url = server.url + "tags/python/newer"
+
+        def unpooled() -> None:
+            requests.request("GET", url, timeout=10).json()
+
+        connections = server.connections
+        before = measure(unpooled)
+        unpooled_connections = server.connections - connections
+
+        connections = server.connections
+        connector = WykopConnector("key", "secret", url=server.url)
+        api = WykopAPI(connector=connector)
+
+        def pooled() -> None:
+            api.get_tag_newer("python")
+
+        after = measure(pooled)
+        pooled_connections = server.connections - connections
+
+    print(f"{'transport':<24}{'req/s':>10}{'connections':>14}")
+    print(f"{'requests.request':<24}{before:>10.0f}{unpooled_connections:>14}")
+    print(f"{'pooled session':<24}{after:>10.0f}{pooled_connections:>14}")
+    print(f"speedup: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
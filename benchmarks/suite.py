@@ -0,0 +1,192 @@
+"""
+Offline benchmark suite. Every case runs against :class:`FakeWykop` served
+locally with injected latency, so results are reproducible without access
+to wykop.pl. Pagination cases use latency of real network (50 ms by
+default), so gain of prefetching pages is visible.
+
+Results are compared with stored baselines (`benchmarks/baselines.json`),
+a case is reported as regression when its throughput drops by more than
+`--tolerance`. Baselines depend on the machine, store them again with
+`--save` before comparing on new hardware.
+
+Run from repository root:
+
+    python -m benchmarks.suite
+    python -m benchmarks.suite --save
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from pywykop3.testing import FakeWykop, make_api
+
+BASELINES = Path(__file__).with_name("baselines.json")
+PHOTO = b"\xff\xd8" + b"x" * (1024 * 1024)
+
+
+@dataclass
+class Result:
+    ops: int
+    seconds: float
+    throughput: float
+    p50_ms: float
+    p95_ms: float
+
+
+def run_case(operation: Callable[[], object], repeat: int) -> Result:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - start)
+    total = sum(timings)
+    timings.sort()
+    return Result(
+        ops=repeat,
+        seconds=round(total, 4),
+        throughput=round(repeat / total, 2),
+        p50_ms=round(1000 * statistics.median(timings), 3),
+        p95_ms=round(1000 * timings[int(0.95 * (repeat - 1))], 3),
+    )
+
+
+def run_cases(cases: Dict[str, tuple]) -> Dict[str, Result]:
+    results: Dict[str, Result] = {}
+    for name, (operation, repeat) in cases.items():
+        # Warm up connections and token
+        operation()
+        results[name] = run_case(operation, repeat)
+    return results
+
+
+def run_suite(latency: float, pagination_latency: float) -> Dict[str, Result]:
+    fake = FakeWykop(entry_count=10_000, stream_size=1000)
+    results: Dict[str, Result] = {}
+    with fake.server(latency=latency) as server:
+        anonymous = make_api(server)
+        logged_in = make_api(server, logged_in=True)
+        entry_ids = iter(range(1, 10_000))
+        results |= run_cases(
+            {
+                "single/get_entry_by_id": (
+                    lambda: anonymous.get_entry_by_id(next(entry_ids)),
+                    200,
+                ),
+                "single/get_tags_popular": (anonymous.get_tags_popular, 200),
+                "bulk/get_entries_by_ids_300": (
+                    lambda: anonymous.get_entries_by_ids(
+                        [next(entry_ids) for _ in range(300)], workers=8
+                    ),
+                    3,
+                ),
+                "media/post_media_photo_1mib": (
+                    lambda: logged_in.post_media_photo(
+                        "comments", PHOTO, "photo.jpg", "image/jpeg"
+                    ),
+                    20,
+                ),
+            }
+        )
+    # Deep pagination is bound by round trips, prefetch pays off only with
+    # latency of real network
+    with fake.server(latency=pagination_latency) as server:
+        anonymous = make_api(server)
+        prefetching = make_api(server, prefetch_pages=4)
+        prefetching_8 = make_api(server, prefetch_pages=8)
+        logged_in = make_api(server, logged_in=True)
+        results |= run_cases(
+            {
+                "pagination/numeric_40_pages": (
+                    lambda: anonymous.get_tag_stream("python", page_count=-1),
+                    3,
+                ),
+                "pagination/numeric_40_pages_prefetch": (
+                    lambda: prefetching.get_tag_stream("python", page_count=-1),
+                    3,
+                ),
+                "pagination/numeric_40_pages_prefetch_8": (
+                    lambda: prefetching_8.get_tag_stream(
+                        "python", page_count=-1
+                    ),
+                    3,
+                ),
+                "pagination/hash_40_pages": (
+                    lambda: logged_in.get_tag_stream("python", page_count=-1),
+                    3,
+                ),
+            }
+        )
+    return results
+
+
+def compare(
+    results: Dict[str, Result], baselines: Dict[str, Dict], tolerance: float
+) -> List[str]:
+    regressions = []
+    print(
+        f"{'case':<40}{'ops/s':>10}{'baseline':>10}{'p50 [ms]':>10}"
+        f"{'p95 [ms]':>10}"
+    )
+    for name, result in results.items():
+        baseline = baselines.get(name, {}).get("throughput")
+        status = ""
+        if baseline and result.throughput < baseline * (1 - tolerance):
+            status = "  REGRESSION"
+            regressions.append(name)
+        print(
+            f"{name:<40}{result.throughput:>10.2f}"
+            f"{baseline or float('nan'):>10.2f}"
+            f"{result.p50_ms:>10.2f}{result.p95_ms:>10.2f}{status}"
+        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.002,
+        help="Latency added to every response, in seconds",
+    )
+    parser.add_argument(
+        "--pagination-latency",
+        type=float,
+        default=0.05,
+        help="Latency added to every response of pagination cases, "
+        "in seconds",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative drop of throughput",
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="Store results as baselines"
+    )
+    args = parser.parse_args()
+    results = run_suite(args.latency, args.pagination_latency)
+    baselines = json.loads(BASELINES.read_text()) if BASELINES.exists() else {}
+    regressions = compare(results, baselines, args.tolerance)
+    if args.save:
+        BASELINES.write_text(
+            json.dumps(
+                {name: asdict(result) for name, result in results.items()},
+                indent=2,
+            )
+            + "\n"
+        )
+        print(f"Baselines saved to {BASELINES}")
+    elif regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,42 @@
-from pywykop3.api import ApiException, Comment, Entry, Photo, User, WykopAPI
-from pywykop3.connector import Methods, WykopConnector, WykopResponse
+from pywykop3.api import (
+    ApiException,
+    BulkResult,
+    Comment,
+    CommentTree,
+    Entry,
+    Photo,
+    UploadResult,
+    User,
+    WykopAPI,
+)
+from pywykop3.cache import CacheStats, ResponseCache
+from pywykop3.cassette import Cassette, CassetteError
+from pywykop3.coalesce import (
+    AsyncSingleFlight,
+    SingleFlight,
+    SingleFlightStats,
+)
+from pywykop3.connector import (
+    Methods,
+    PageIterator,
+    WykopConnector,
+    WykopResponse,
+)
+from pywykop3.crawler import Crawler, CrawlReport, CrawlResult, CrawlTask
+from pywykop3.decoders import get_decoder
+from pywykop3.export import ExportWriter, JsonlWriter, ParquetWriter
+from pywykop3.media_cache import MediaCache, MediaCacheStats
+from pywykop3.metrics import EndpointMetrics, Metrics
+from pywykop3.multipart import MultipartBody, PhotoSource
+from pywykop3.pool import AsyncConnectorPool, ConnectorPool, PoolMemberStats
+from pywykop3.ratelimit import Budget, RateLimiter, RateLimitStats
+from pywykop3.scheduler import TagSchedule, TagScheduler
+from pywykop3.sync import Mirror, SqliteStore
+from pywykop3.transport import TransportConfig, build_session
+from pywykop3.watcher import (
+    CursorStore,
+    JsonCursorStore,
+    TagCursor,
+    TagPoll,
+    TagWatcher,
+)
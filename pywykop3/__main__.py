@@ -0,0 +1,8 @@
+import logging
+import sys
+
+from pywykop3.crawler import main
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
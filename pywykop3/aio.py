@@ -0,0 +1,1099 @@
+# pylint: disable=too-many-lines
+import asyncio
+import functools
+import itertools
+import json
+import logging
+from collections import deque
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Set,
+    Tuple,
+)
+
+import aiohttp
+from requests.compat import urljoin
+
+from . import endpoints
+from .api import (
+    ApiException,
+    BaseWykopAPI,
+    BulkResult,
+    Comment,
+    CommentTree,
+    Entry,
+    Photo,
+    UploadResult,
+    User,
+)
+from .cache import ResponseCache
+from .coalesce import AsyncSingleFlight
+from .connector import BaseWykopConnector, Methods, WykopResponse
+from .decoders import Decoder
+from .endpoints import Call
+from .media_cache import MediaCache, content_digest
+from .metrics import Metrics
+from .multipart import CHUNK_SIZE, MultipartBody, PhotoSource
+from .ratelimit import RateLimiter
+from .transport import TransportConfig
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "ApiException",
+    "AsyncPageIterator",
+    "AsyncWykopAPI",
+    "AsyncWykopConnector",
+]
+
+
+class AsyncWykopConnector(BaseWykopConnector):
+    """
+    Asyncio counterpart of :class:`pywykop3.connector.WykopConnector`,
+    based on aiohttp. Requires `aiohttp` package.
+
+    Construction does not execute any request. Token is obtained with
+    first request. Session is created lazily inside running event loop,
+    so connector has to be closed with :meth:`close` or used as
+    `async with` context manager.
+
+    Args:
+        key (str | None, optional): Key. Defaults to None.
+        secret (str | None, optional): Secret. Defaults to None.
+        refresh_token (str | None, optional): Refresh token.
+            Defaults to None.
+        url (str | None, optional): Base url of API. Defaults to None.
+        session (aiohttp.ClientSession | None, optional): Session used for
+            all requests. Defaults to None.
+        transport (TransportConfig | None, optional): Configuration of
+            connection pool. `pool_maxsize` limits number of connections
+            to one host. Adapter retries are not supported.
+            Defaults to None.
+        prefetch_pages (int, optional): Number of numeric pages fetched
+            concurrently by :meth:`request_with_pagination`. Defaults to 1.
+        token (str | None, optional): Previously obtained token. It is used
+            until it expires. Defaults to None.
+        rate_limiter (RateLimiter | None, optional): Client side rate limiter.
+            Defaults to None.
+        cache (ResponseCache | None, optional): Cache of read-only
+            endpoints. Defaults to None.
+        decoder (Decoder | None, optional): Callable parsing raw response
+            body. Defaults to the fastest installed decoder.
+        metrics (Metrics | None, optional): Collects per endpoint metrics
+            and calls request hooks. Defaults to None.
+        coalesce (bool, optional): Share single response between identical
+            GET requests sent concurrently from many tasks. Defaults to False.
+    """
+
+    def __init__(  # pylint: disable=duplicate-code
+        self,
+        key: str | None = None,
+        secret: str | None = None,
+        refresh_token: str | None = None,
+        url: str | None = None,
+        session: aiohttp.ClientSession | None = None,
+        transport: TransportConfig | None = None,
+        prefetch_pages: int = 1,
+        token: str | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        decoder: Decoder | None = None,
+        metrics: Metrics | None = None,
+        coalesce: bool = False,
+    ) -> None:
+        super().__init__(
+            key,
+            secret,
+            refresh_token,
+            url,
+            prefetch_pages=prefetch_pages,
+            token=token,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            decoder=decoder,
+            metrics=metrics,
+            coalesce=coalesce,
+        )
+        self._token_lock = asyncio.Lock()
+        self.single_flight = AsyncSingleFlight()
+        self._session = session
+        self._transport = transport or TransportConfig()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._transport.pool_connections
+                * self._transport.pool_maxsize,
+                limit_per_host=self._transport.pool_maxsize,
+                force_close=not self._transport.keep_alive,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def _get_token(self) -> str:
+        url, payload = self._token_request()
+        async with self.session.post(
+            url,
+            json=payload,
+            headers=self.AUTH_HEADER,
+            timeout=aiohttp.ClientTimeout(total=15),
+        ) as res:
+            return self._set_token(await res.json(content_type=None))
+
+    async def _ensure_token(self) -> None:
+        if self._token_valid():
+            return
+        async with self._token_lock:
+            # Token could be obtained by other task in the meantime
+            if not self._token_valid():
+                await self._get_token()
+
+    async def _refresh_token(self, header: Dict) -> bool:
+        """
+        Async version of
+        :meth:`pywykop3.connector.WykopConnector._refresh_token`
+        """
+        if not self._can_refresh_token():
+            return False
+        async with self._token_lock:
+            if self.header is header:
+                logger.info("Token expired, obtaining new one")
+                await self._get_token()
+        return True
+
+    async def connect(self) -> str:
+        await self._ensure_token()
+        async with self.session.get(
+            urljoin(self.URL, "connect"),
+            headers=self.header,
+            timeout=aiohttp.ClientTimeout(total=15),
+        ) as res:
+            return (await res.json(content_type=None))["data"]["connect_url"]
+
+    async def close(self) -> None:
+        """
+        Close session and pooled connections.
+        """
+        if self._session is not None:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncWykopConnector":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    @staticmethod
+    def _body_kwargs(body: MultipartBody | None, headers: Dict) -> Dict:
+        """
+        Arguments of `send` streaming multipart `body` from its start.
+        Content-Length is set explicitly, so body is not sent chunked.
+        """
+        if body is None:
+            return {"headers": headers}
+        body.seek(0)
+
+        async def chunks() -> AsyncIterator[bytes]:
+            while chunk := body.read(CHUNK_SIZE):
+                yield chunk
+
+        return {
+            "headers": {
+                **headers,
+                "Content-Type": body.content_type,
+                "Content-Length": str(len(body)),
+            },
+            "data": chunks(),
+        }
+
+    async def request(  # pylint: disable=duplicate-code
+        self,
+        method: Methods,
+        endpoint: str,
+        data: Dict | None = None,
+        params: Dict | None = None,
+        timeout: int = 10,
+        files: Dict | None = None,
+    ) -> WykopResponse:
+        cached = self._cached(method, endpoint, params)
+        if cached is not None:
+            return cached
+        key = self._flight_key(method, endpoint, params, files)
+        send = functools.partial(
+            self._fetch, method, endpoint, data, params, timeout, files
+        )
+        if key is None:
+            code, body = await send()
+        else:
+            code, body = await self.single_flight.do(key, send)
+        return self._parse(code, body)
+
+    async def _fetch(  # pylint: disable=duplicate-code,too-many-arguments
+        self,
+        method: Methods,
+        endpoint: str,
+        data: Dict | None,
+        params: Dict | None,
+        timeout: int,
+        files: Dict | None,
+    ) -> Tuple[int, bytes]:
+        """
+        Async version of :meth:`pywykop3.connector.WykopConnector._fetch`
+        """
+        url = self._build_url(endpoint)
+        self._log_request(method, url, params, data)
+        send = functools.partial(
+            self.session.request,
+            method=Methods(method).value,
+            url=url,
+            json={"data": data} if data else None,
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        )
+        info = None
+        if self.metrics is not None:
+            info = self.metrics.before_request(Methods(method).value, endpoint)
+        multipart = MultipartBody(files) if files else None
+        try:
+            code, body = await self._send(endpoint, send, multipart)
+        finally:
+            if multipart is not None:
+                multipart.close()
+        if info is not None:
+            sent = json.dumps({"data": data}).encode() if data else b""
+            self.metrics.after_response(  # type: ignore
+                info, code, len(multipart or sent), len(body)
+            )
+        if self.cache is not None:
+            self.cache.store(
+                Methods(method).value,
+                endpoint,
+                params,
+                self._cache_identity,
+                code,
+                body,
+            )
+        return code, body
+
+    async def _send(  # pylint: disable=duplicate-code
+        self, endpoint: str, send: Callable, multipart: MultipartBody | None
+    ) -> Tuple[int, bytes]:
+        """
+        Async version of :meth:`pywykop3.connector.WykopConnector._send`
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async(endpoint)
+            await self._ensure_token()
+            header = self.header
+            async with send(**self._body_kwargs(multipart, header)) as res:
+                code, body = res.status, await res.read()
+                retry_after = res.headers.get("Retry-After")
+            if code == 401 and await self._refresh_token(header):
+                # Replay request with new token, within budget as well
+                self._retried(endpoint)
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire_async(endpoint)
+                kwargs = self._body_kwargs(multipart, self.header)
+                async with send(**kwargs) as res:
+                    code, body = res.status, await res.read()
+                    retry_after = res.headers.get("Retry-After")
+            if not self.rate_limiter:
+                return code, body
+            if code != 429:
+                self.rate_limiter.succeeded(endpoint)
+                return code, body
+            if not self.rate_limiter.throttled(endpoint, retry_after, attempt):
+                return code, body
+            logger.warning("Too many requests to %s, retrying", endpoint)
+            self._retried(endpoint)
+            attempt += 1
+
+    async def request_with_pagination(  # pylint: disable=duplicate-code
+        self,
+        method: Methods,
+        endpoint: str,
+        page: int | str | None = None,
+        data: Dict | None = None,
+        params: Dict | None = None,
+        timeout: int = 10,
+        page_count: int = 1,
+        prefetch: int | None = None,
+    ) -> WykopResponse:
+        """
+        Async version of
+        :meth:`pywykop3.connector.WykopConnector.request_with_pagination`
+        """
+        last_response: WykopResponse = None  # type: ignore
+        all_data: List[Dict] = []
+        async for res in self.iter_pages(
+            method, endpoint, page, data, params, timeout, page_count, prefetch
+        ):
+            last_response = res
+            all_data += res.data  # type: ignore
+        last_response.data = all_data
+        return last_response
+
+    def iter_pages(  # pylint: disable=duplicate-code
+        self,
+        method: Methods,
+        endpoint: str,
+        page: int | str | None = None,
+        data: Dict | None = None,
+        params: Dict | None = None,
+        timeout: int = 10,
+        page_count: int = 1,
+        prefetch: int | None = None,
+    ) -> AsyncIterator[WykopResponse]:
+        """
+        Async version of :meth:`pywykop3.connector.WykopConnector.iter_pages`
+        """
+        pages = self._iter_pages(
+            method, endpoint, page, data, params, timeout, page_count, prefetch
+        )
+        if self.metrics is None:
+            return pages
+        return self.metrics.track_pages_async(endpoint, pages)
+
+    async def _iter_pages(  # pylint: disable=duplicate-code
+        self,
+        method: Methods,
+        endpoint: str,
+        page: int | str | None,
+        data: Dict | None,
+        params: Dict | None,
+        timeout: int,
+        page_count: int,
+        prefetch: int | None,
+    ) -> AsyncIterator[WykopResponse]:
+        prefetch = prefetch or self.prefetch_pages
+        params = dict(params or {})
+        while page_count != 0:
+            page_count -= 1
+            if page:
+                params["page"] = page
+            res = await self.request(
+                method, endpoint, data, dict(params), timeout
+            )
+            next_page = self._next_page(res, page)
+            res.page = page
+            res.next = page if next_page is None else next_page
+            yield res
+            if next_page is None:
+                return
+            page = next_page
+            if prefetch > 1 and self._can_prefetch(res, next_page):
+                async for res in self._prefetch_pages(
+                    method,
+                    endpoint,
+                    page,  # type: ignore
+                    data,
+                    params,
+                    timeout,
+                    page_count,
+                    prefetch,
+                ):
+                    yield res
+                return
+
+    async def _prefetch_pages(  # pylint: disable=duplicate-code,too-many-locals
+        self,
+        method: Methods,
+        endpoint: str,
+        page: int,
+        data: Dict | None,
+        params: Dict,
+        timeout: int,
+        page_count: int,
+        prefetch: int,
+    ) -> AsyncIterator[WykopResponse]:
+        """
+        Async version of
+        :meth:`pywykop3.connector.WykopConnector._prefetch_pages`
+        """
+        in_flight: Deque[Tuple[int, asyncio.Task]] = deque()
+        to_submit = page
+
+        def submit() -> None:
+            nonlocal to_submit, page_count
+            if page_count == 0:
+                return
+            page_count -= 1
+            page_params = {**params, "page": to_submit}
+            task = asyncio.create_task(
+                self.request(method, endpoint, data, page_params, timeout)
+            )
+            in_flight.append((to_submit, task))
+            to_submit += 1
+
+        try:
+            for _ in range(prefetch):
+                submit()
+            while in_flight:
+                current_page, task = in_flight.popleft()
+                res = await task
+                next_page = self._next_page(res, current_page)
+                res.page = current_page
+                if next_page is None:
+                    res.next = current_page
+                    yield res
+                    return
+                res.next = current_page + 1
+                yield res
+                submit()
+        finally:
+            for _, task in in_flight:
+                task.cancel()
+
+
+class AsyncPageIterator:
+    """
+    Async version of :class:`pywykop3.connector.PageIterator`.
+    Supports `async for`.
+    """
+
+    def __init__(  # pylint: disable=duplicate-code
+        self,
+        pages: AsyncIterator[WykopResponse],
+        page: int | str | None = None,
+        check: Callable[[WykopResponse], None] | None = None,
+        transform: Callable[[Dict], Any] | None = None,
+    ) -> None:
+        self._pages = pages
+        self._check = check
+        self._transform = transform
+        self.cursor = page
+        self.finished = False
+        self.fetched_pages = 0
+
+    async def pages(self) -> AsyncIterator[WykopResponse]:
+        # pylint: disable=duplicate-code
+        async for res in self._pages:
+            if self._check:
+                self._check(res)
+            self.cursor = res.page
+            self.fetched_pages += 1
+            yield res
+            self.cursor = res.next
+        self.finished = True
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        async for res in self.pages():
+            for item in res.data:
+                yield self._transform(item) if self._transform else item
+
+    async def close(self) -> None:
+        await self._pages.aclose()  # type: ignore
+
+
+class AsyncWykopAPI(BaseWykopAPI):
+    """
+    Asyncio interface to communicate with Wykop. Every method is a
+    coroutine counterpart of method of :class:`pywykop3.api.WykopAPI`
+    with the same arguments, return values and :class:`ApiException`
+    semantics.
+
+    Args:
+        connector (AsyncWykopConnector | None, optional): Connector object.
+            Can be safely ignored. Defaults to None.
+        key (str | None, optional): Key. Defaults to None.
+        secret (str | None, optional): Secret. Defaults to None.
+        refresh_token (str | None, optional): Refresh token.
+            Defaults to None.
+        use_models (bool, optional): Return compact :mod:`pywykop3.models`
+            instead of raw dictionaries. Defaults to False.
+        media_cache (MediaCache | None, optional): Cache of uploaded photos.
+            Defaults to None.
+    """
+
+    def __init__(
+        self,
+        connector: AsyncWykopConnector | None = None,
+        key: str | None = None,
+        secret: str | None = None,
+        refresh_token: str | None = None,
+        use_models: bool = False,
+        media_cache: MediaCache | None = None,
+    ) -> None:
+        self.connector = connector or AsyncWykopConnector(
+            key, secret, refresh_token
+        )
+        self.use_models = use_models
+        self.media_cache = media_cache
+
+    async def close(self) -> None:
+        await self.connector.close()
+
+    async def __aenter__(self) -> "AsyncWykopAPI":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def connect(self) -> str:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.connect`
+        """
+        return await self.connector.connect()
+
+    async def _send(self, call: Call) -> WykopResponse:
+        return await self.connector.request(
+            call.method, call.endpoint, **self._request_kwargs(call)
+        )
+
+    async def _request(self, call: Call) -> Any:
+        return self._result(call, await self._send(call))
+
+    async def _request_pages(
+        self, call: Call, page: int | str | None, page_count: int
+    ) -> Any:
+        res = await self.connector.request_with_pagination(
+            **self._page_kwargs(call, page, page_count)
+        )
+        return self._result(call, res)
+
+    def _iter_pages(
+        self, call: Call, page: int | str | None, page_count: int
+    ) -> AsyncPageIterator:
+        pages = self.connector.iter_pages(
+            **self._page_kwargs(call, page, page_count)
+        )
+        return AsyncPageIterator(
+            pages, page, self._check(call), self._transform(call.model)
+        )
+
+    async def _cached(self, source: str | None, media_type: str) -> Any:
+        if source is None:
+            return None
+        # SQLite of media cache is not queried in event loop
+        return await asyncio.to_thread(self._cached_photo, source, media_type)
+
+    async def _upload(
+        self, call: Call, source: str | None, media_type: str
+    ) -> Any:
+        res = await self._send(call)
+        if source is None:
+            return self._result(call, res)
+        return await asyncio.to_thread(
+            self._uploaded_photo, call, res, source, media_type
+        )
+
+    # Users
+
+    async def get_users_autocomplete(self, query: str) -> List:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.get_users_autocomplete`
+        """
+        return await self._request(endpoints.get_users_autocomplete(query))
+
+    # Tags
+
+    async def get_tags_autocomplete(self, query: str) -> List:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.get_tags_autocomplete`
+        """
+        return await self._request(endpoints.get_tags_autocomplete(query))
+
+    async def get_tags_popular(self) -> List:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.get_tags_popular`
+        """
+        return await self._request(endpoints.get_tags_popular())
+
+    async def get_tags_popular_user_tags(self) -> List:
+        """
+        Async version of
+        :meth:`pywykop3.api.WykopAPI.get_tags_popular_user_tags`
+        """
+        return await self._request(endpoints.get_tags_popular_user_tags())
+
+    async def get_tags_related(self, tag_name: str) -> List:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.get_tags_related`
+        """
+        return await self._request(endpoints.get_tags_related(tag_name))
+
+    async def get_tag(self, tag_name: str) -> Dict:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.get_tag`
+        """
+        return await self._request(endpoints.get_tag(tag_name))
+
+    async def put_tag(self, tag_name: str, data: Dict) -> None:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.put_tag`
+        """
+        await self._request(endpoints.put_tag(tag_name, data))
+
+    async def get_tag_stream(
+        self,
+        tag_name: str,
+        page: int | str | None = None,
+        sort: str = "best",
+        type_of_content: str = "all",
+        year: int | None = None,
+        month: int | None = None,
+        page_count: int = 1,
+    ) -> List:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.get_tag_stream`
+        """
+        call = endpoints.get_tag_stream(
+            tag_name, sort, type_of_content, year, month
+        )
+        return await self._request_pages(call, page, page_count)
+
+    def iter_tag_stream(
+        self,
+        tag_name: str,
+        page: int | str | None = None,
+        sort: str = "best",
+        type_of_content: str = "all",
+        year: int | None = None,
+        month: int | None = None,
+        page_count: int = -1,
+    ) -> AsyncPageIterator:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.iter_tag_stream`
+        """
+        call = endpoints.get_tag_stream(
+            tag_name, sort, type_of_content, year, month
+        )
+        return self._iter_pages(call, page, page_count)
+
+    async def get_tag_newer(
+        self,
+        tag_name: str,
+        type_of_content: str = "all",
+        sort: str = "best",
+        date: datetime | None = None,
+        obj_id: str | None = None,
+    ) -> int:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.get_tag_newer`
+        """
+        res = await self._request(
+            endpoints.get_tag_newer(
+                tag_name, type_of_content, sort, date, obj_id
+            )
+        )
+        return res.get("count", 0)
+
+    async def get_tag_users(self, tag_name: str) -> List:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.get_tag_users`
+        """
+        return await self._request(endpoints.get_tag_users(tag_name))
+
+    async def post_tag_user(self, tag_name: str, username: str) -> None:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.post_tag_user`
+        """
+        await self._request(endpoints.post_tag_user(tag_name, username))
+
+    async def delete_tag_user(self, tag_name: str, username: str) -> None:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.delete_tag_user`
+        """
+        await self._request(endpoints.delete_tag_user(tag_name, username))
+
+    # Mikroblog
+
+    async def get_entries(
+        self,
+        sort: str = "hot",
+        last_update: int = 12,
+        page_count: int = 1,
+        page: int | str | None = None,
+        category: str | None = None,
+        bucket: str | None = None,
+    ) -> List[Entry]:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.get_entries`
+        """
+        call = endpoints.get_entries(sort, last_update, category, bucket)
+        return await self._request_pages(call, page, page_count)
+
+    def iter_entries(
+        self,
+        sort: str = "hot",
+        last_update: int = 12,
+        page_count: int = -1,
+        page: int | str | None = None,
+        category: str | None = None,
+        bucket: str | None = None,
+    ) -> AsyncPageIterator:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.iter_entries`
+        """
+        call = endpoints.get_entries(sort, last_update, category, bucket)
+        return self._iter_pages(call, page, page_count)
+
+    async def post_entry(
+        self,
+        content: str,
+        photo: str | None = None,
+        embed: str | None = None,
+        survey: str | None = None,
+        adult: bool = False,
+    ) -> Entry:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.post_entry`
+        """
+        call = endpoints.post_entry(content, photo, embed, survey, adult)
+        return await self._request(call)
+
+    async def get_entry_by_id(self, entry_id: int) -> Entry:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.get_entry_by_id`
+        """
+        return await self._request(endpoints.get_entry_by_id(entry_id))
+
+    async def get_entries_by_ids(
+        self, entry_ids: Iterable[int], workers: int = 8
+    ) -> List[BulkResult]:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.get_entries_by_ids`
+        """
+        entry_ids = list(entry_ids)
+        results = {
+            result.entry_id: result
+            async for result in self.iter_entries_by_ids(entry_ids, workers)
+        }
+        return [results[entry_id] for entry_id in entry_ids]
+
+    async def iter_entries_by_ids(
+        self, entry_ids: Iterable[int], workers: int = 8
+    ) -> AsyncIterator[BulkResult]:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.iter_entries_by_ids`
+        """
+        semaphore = asyncio.Semaphore(workers)
+
+        async def fetch(entry_id: int) -> BulkResult:
+            async with semaphore:
+                try:
+                    entry = await self.get_entry_by_id(entry_id)
+                except (
+                    ApiException,
+                    aiohttp.ClientError,
+                    asyncio.TimeoutError,
+                    ValueError,
+                ) as exc:
+                    return BulkResult(entry_id, error=exc)
+                return BulkResult(entry_id, entry)
+
+        tasks = [
+            asyncio.ensure_future(fetch(entry_id))
+            for entry_id in dict.fromkeys(entry_ids)
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def iter_comment_trees(
+        self,
+        entry_ids: Iterable[int],
+        workers: int = 8,
+        with_votes: bool = False,
+    ) -> AsyncIterator[CommentTree]:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.iter_comment_trees`.
+        Requests of all trees share `workers` slots, so votes of a single
+        entry are also fetched concurrently.
+        """
+        semaphore = asyncio.Semaphore(workers)
+        ids = iter(entry_ids)
+        pending: Set[asyncio.Future] = set()
+        try:
+            while True:
+                for entry_id in itertools.islice(
+                    ids, 2 * workers - len(pending)
+                ):
+                    tree = self._comment_tree(entry_id, with_votes, semaphore)
+                    pending.add(asyncio.ensure_future(tree))
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _comment_tree(
+        self, entry_id: int, with_votes: bool, semaphore: asyncio.Semaphore
+    ) -> CommentTree:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI._comment_tree`,
+        every request waits for a slot of `semaphore`.
+        """
+
+        async def call(method: Callable, *args, **kwargs) -> Any:
+            async with semaphore:
+                return await method(*args, **kwargs)
+
+        tree = CommentTree(entry_id)
+        try:
+            tree.entry, tree.comments = await asyncio.gather(
+                call(self.get_entry_by_id, entry_id),
+                call(self.get_entry_comments, entry_id, page_count=-1),
+            )
+            if with_votes:
+                comment_ids = self._voted_comments(tree.comments)
+                votes = await asyncio.gather(
+                    *(
+                        call(self.get_entry_comment_votes, entry_id, id_)
+                        for id_ in comment_ids
+                    )
+                )
+                tree.votes = dict(zip(comment_ids, votes))
+        except (
+            ApiException,
+            aiohttp.ClientError,
+            asyncio.TimeoutError,
+            ValueError,
+        ) as exc:
+            tree.error = exc
+        return tree
+
+    async def put_entry(
+        self,
+        entry_id: int,
+        content: str,
+        photo: str | None = None,
+        embed: str | None = None,
+        survey: str | None = None,
+        adult: bool = False,
+    ) -> Entry:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.put_entry`
+        """
+        call = endpoints.put_entry(
+            entry_id, content, photo, embed, survey, adult
+        )
+        return await self._request(call)
+
+    async def delete_entry_by_id(self, entry_id: int) -> None:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.delete_entry_by_id`
+        """
+        await self._request(endpoints.delete_entry_by_id(entry_id))
+
+    async def get_entry_votes(self, entry_id: int) -> List[User]:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.get_entry_votes`
+        """
+        return await self._request(endpoints.get_entry_votes(entry_id))
+
+    async def post_entry_vote(self, entry_id: int) -> None:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.post_entry_vote`
+        """
+        await self._request(endpoints.post_entry_vote(entry_id))
+
+    async def delete_entry_vote(self, entry_id: str) -> None:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.delete_entry_vote`
+        """
+        await self._request(endpoints.delete_entry_vote(entry_id))
+
+    async def get_entries_newer(
+        self, entry_id: int, category: str | None = None
+    ) -> int:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.get_entries_newer`
+        """
+        res = await self._request(
+            endpoints.get_entries_newer(entry_id, category)
+        )
+        return res["count"]
+
+    # Mikroblog - Komentarz
+
+    async def get_entry_comments(
+        self, entry_id: int, page: int = 1, page_count: int = 1
+    ) -> List[Comment]:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.get_entry_comments`
+        """
+        call = endpoints.get_entry_comments(entry_id)
+        return await self._request_pages(call, page, page_count)
+
+    def iter_entry_comments(
+        self, entry_id: int, page: int = 1, page_count: int = -1
+    ) -> AsyncPageIterator:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.iter_entry_comments`
+        """
+        call = endpoints.get_entry_comments(entry_id)
+        return self._iter_pages(call, page, page_count)
+
+    async def post_entry_comment(
+        self,
+        entry_id: int,
+        content: str,
+        embed: str | None = None,
+        photo: str | None = None,
+        adult: bool = False,
+    ) -> Comment:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.post_entry_comment`
+        """
+        call = endpoints.post_entry_comment(
+            entry_id, content, embed, photo, adult
+        )
+        return await self._request(call)
+
+    async def get_entry_comment(
+        self, entry_id: int, comment_id: int
+    ) -> Comment:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.get_entry_comment`
+        """
+        call = endpoints.get_entry_comment(entry_id, comment_id)
+        return await self._request(call)
+
+    async def put_entry_comment(
+        self,
+        entry_id: int,
+        comment_id: int,
+        content: str,
+        embed: str | None = None,
+        photo: str | None = None,
+        adult: bool = False,
+    ) -> Comment:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.put_entry_comment`
+        """
+        call = endpoints.put_entry_comment(
+            entry_id, comment_id, content, embed, photo, adult
+        )
+        return await self._request(call)
+
+    async def delete_entry_comment(
+        self, entry_id: int, comment_id: int
+    ) -> None:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.delete_entry_comment`
+        """
+        call = endpoints.delete_entry_comment(entry_id, comment_id)
+        await self._request(call)
+
+    async def get_entry_comment_votes(
+        self, entry_id: int, comment_id: int
+    ) -> List[User]:
+        """
+        Async version of
+        :meth:`pywykop3.api.WykopAPI.get_entry_comment_votes`
+        """
+        call = endpoints.get_entry_comment_votes(entry_id, comment_id)
+        return await self._request(call)
+
+    async def post_entry_comment_vote(
+        self, entry_id: int, comment_id: int
+    ) -> None:
+        """
+        Async version of
+        :meth:`pywykop3.api.WykopAPI.post_entry_comment_vote`
+        """
+        call = endpoints.post_entry_comment_vote(entry_id, comment_id)
+        await self._request(call)
+
+    async def delete_entry_comment_vote(
+        self, entry_id: int, comment_id: int
+    ) -> None:
+        """
+        Async version of
+        :meth:`pywykop3.api.WykopAPI.delete_entry_comment_vote`
+        """
+        call = endpoints.delete_entry_comment_vote(entry_id, comment_id)
+        await self._request(call)
+
+    # Media - Zdjęcia
+
+    async def post_media_photo(
+        self,
+        media_type: str,
+        photo: PhotoSource,
+        photo_name: str | None = None,
+        photo_type: str | None = None,
+    ) -> Photo:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.post_media_photo`
+        """
+        call = endpoints.post_media_photo(
+            media_type, photo, photo_name, photo_type
+        )
+        source = None
+        if self.media_cache is not None:
+            source = await asyncio.to_thread(content_digest, photo)
+        cached = await self._cached(source, media_type)
+        if cached is not None:
+            return cached
+        return await self._upload(call, source, media_type)
+
+    async def post_media_photos(
+        self, media_type: str, photos: Iterable[PhotoSource], workers: int = 4
+    ) -> List[UploadResult]:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.post_media_photos`
+        """
+        semaphore = asyncio.Semaphore(workers)
+
+        async def upload(photo: PhotoSource) -> UploadResult:
+            async with semaphore:
+                try:
+                    result = await self.post_media_photo(media_type, photo)
+                except (
+                    ApiException,
+                    aiohttp.ClientError,
+                    OSError,
+                    ValueError,
+                ) as exc:
+                    return UploadResult(photo, error=exc)
+                return UploadResult(photo, result)
+
+        return list(await asyncio.gather(*map(upload, photos)))
+
+    async def post_media_photo_by_url(
+        self, media_type: str, photo_url: str
+    ) -> Photo:
+        """
+        Async version of
+        :meth:`pywykop3.api.WykopAPI.post_media_photo_by_url`
+        """
+        source = self._url_source(photo_url)
+        cached = await self._cached(source, media_type)
+        if cached is not None:
+            return cached
+        return await self._upload(
+            endpoints.post_media_photo_by_url(media_type, photo_url),
+            source,
+            media_type,
+        )
+
+    async def delete_media_photo(self, photo_key: str) -> None:
+        """
+        Async version of :meth:`pywykop3.api.WykopAPI.delete_media_photo`
+        """
+        call = endpoints.delete_media_photo(photo_key)
+        res = await self._send(call)
+        if self.media_cache is not None:
+            # Key is not usable anymore, also when deletion failed
+            await asyncio.to_thread(self.media_cache.invalidate, photo_key)
+        self._result(call, res)
@@ -1,7 +1,33 @@
+# pylint: disable=too-many-lines
+import functools
+import itertools
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, NewType
-
-from .connector import Methods, WykopConnector, WykopResponse
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NewType,
+    Set,
+)
+
+import requests
+
+from . import endpoints, models
+from .connector import PageIterator, WykopConnector, WykopResponse
+from .endpoints import Call
+from .media_cache import MediaCache, content_digest, normalize_url
+from .multipart import PhotoSource
 from .utils import NotEmptyDict
 
 User = NewType("User", Dict)
@@ -32,7 +58,203 @@ class ApiException(Exception):
         super().__init__(f"CODE {self.code}: {api_msg}")
 
 
-class WykopAPI:
+@dataclass
+class BulkResult:
+    """
+    Result of single ID of bulk request, see
+    :meth:`WykopAPI.get_entries_by_ids`.
+
+    - entry_id - requested ID
+    - entry - fetched entry, None if request failed
+    - error - exception raised for this ID, None on success
+    """
+
+    entry_id: int
+    entry: Entry | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def not_found(self) -> bool:
+        return isinstance(self.error, ApiException) and self.error.code == 404
+
+
+@dataclass
+class CommentTree:
+    """
+    Comments of single entry, see :meth:`WykopAPI.iter_comment_trees`.
+
+    - entry_id - requested ID
+    - entry - fetched entry, None if request failed
+    - comments - all comments of entry
+    - votes - voters per comment ID, None if votes were not requested;
+      comments without votes are skipped
+    - error - first exception raised for this entry, None on success
+    """
+
+    entry_id: int
+    entry: Entry | None = None
+    comments: List[Comment] = field(default_factory=list)
+    votes: Dict[int, List[User]] | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class UploadResult:
+    """
+    Result of single file of bulk upload, see
+    :meth:`WykopAPI.post_media_photos`.
+
+    - source - uploaded file
+    - photo - uploaded photo, None if upload failed
+    - error - exception raised for this file, None on success
+    """
+
+    source: PhotoSource
+    photo: Photo | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BaseWykopAPI:
+    """
+    Transport independent part of API: errors and conversion of responses
+    described by :mod:`pywykop3.endpoints`. Shared by :class:`WykopAPI`
+    and :class:`pywykop3.aio.AsyncWykopAPI`.
+    """
+
+    use_models: bool = False
+    media_cache: MediaCache | None = None
+
+    def raise_error_if_needed(
+        self, res: WykopResponse, error_dict: Dict | None = None
+    ) -> None:
+        error_dict = error_dict or {}
+        for code, msg in error_dict.items():
+            if res.code == code:
+                raise ApiException(res.code, f"{msg} {res.error}")
+        if 200 > res.code or res.code > 299:
+            raise ApiException(res.code, str(res.error))
+
+    def _convert(self, data: Any, model: type[models.Model]) -> Any:
+        """
+        Convert response data to `model` if models are enabled.
+        """
+        return models.convert(data, model) if self.use_models else data
+
+    def _transform(
+        self, model: type[models.Model] | None
+    ) -> Callable[[Dict], Any] | None:
+        return model.from_dict if model and self.use_models else None
+
+    @staticmethod
+    def _request_kwargs(call: Call) -> Dict:
+        """
+        Optional arguments of connector request, defaults are skipped.
+        """
+        kwargs = NotEmptyDict()
+        kwargs["data"] = call.data
+        kwargs["params"] = call.params
+        kwargs["timeout"] = call.timeout
+        kwargs["files"] = call.files
+        return kwargs
+
+    @classmethod
+    def _page_kwargs(
+        cls, call: Call, page: int | str | None, page_count: int
+    ) -> Dict:
+        """
+        Arguments of connector paginated request.
+        """
+        return {
+            "method": call.method,
+            "endpoint": call.endpoint,
+            **cls._request_kwargs(call),
+            "page": page,
+            "page_count": page_count,
+        }
+
+    def _result(self, call: Call, res: WykopResponse) -> Any:
+        """
+        Raise error of failed `call`, return its converted data otherwise.
+        """
+        self.raise_error_if_needed(res, call.errors)
+        if call.model is None:
+            return res.data
+        return self._convert(res.data, call.model)
+
+    def _check(self, call: Call) -> Callable[[WykopResponse], None]:
+        """
+        Error check of single page of paginated `call`.
+        """
+        return functools.partial(
+            self.raise_error_if_needed, error_dict=call.errors
+        )
+
+    def _cached_photo(self, source: str | None, media_type: str) -> Any:
+        """
+        Photo uploaded before from `source`, None if it is not cached.
+        """
+        if source is None:
+            return None
+        cached = self.media_cache.get(source, media_type)  # type: ignore
+        return None if cached is None else self._convert(cached, models.Photo)
+
+    def _url_source(self, photo_url: str) -> str | None:
+        """
+        Cache key of photo uploaded by URL, None if cache is not used.
+        """
+        if self.media_cache is None:
+            return None
+        return f"url:{normalize_url(photo_url)}"
+
+    def _uploaded_photo(
+        self,
+        call: Call,
+        res: WykopResponse,
+        source: str | None,
+        media_type: str,
+    ) -> Any:
+        """
+        Result of upload `call`, stored in `media_cache` on success.
+        """
+        result = self._result(call, res)
+        if source is not None:
+            self.media_cache.store(source, media_type, res.data)  # type: ignore
+        return result
+
+    @staticmethod
+    def _voted_comments(comments: List) -> List[int]:
+        """
+        IDs of `comments`, raw or models, which have any votes.
+        """
+        if comments and isinstance(comments[0], models.Comment):
+            return [
+                comment.id
+                for comment in comments
+                if comment.votes_up or comment.votes_down
+            ]
+        return [
+            comment["id"]
+            for comment in comments
+            if any(
+                (comment.get("votes") or {}).get(kind)
+                for kind in ("up", "down")
+            )
+        ]
+
+
+class WykopAPI(BaseWykopAPI):
     """
     Main interface to communicate with Wykop
     You need to provide
@@ -60,6 +282,12 @@ class WykopAPI:
         secret (str | None, optional): Secret. Defaults to None.
         refresh_token (str | None, optional): Refresh token. To obtain it,
             see :meth:`connect()` method. Defaults to None.
+        use_models (bool, optional): Return entries, comments, users and photos
+            as compact :mod:`pywykop3.models` instead of raw dictionaries.
+            Defaults to False.
+        media_cache (MediaCache | None, optional): Cache of uploaded photos,
+            reused instead of uploading the same photo again.
+            Defaults to None.
     """
 
     def __init__(
@@ -68,8 +296,12 @@ class WykopAPI:
         key: str | None = None,
         secret: str | None = None,
         refresh_token: str | None = None,
+        use_models: bool = False,
+        media_cache: MediaCache | None = None,
     ) -> None:
         self.connector = connector or WykopConnector(key, secret, refresh_token)
+        self.use_models = use_models
+        self.media_cache = media_cache
 
     def connect(self) -> str:
         """
@@ -79,15 +311,35 @@ class WykopAPI:
         """
         return self.connector.connect()
 
-    def raise_error_if_needed(
-        self, res: WykopResponse, error_dict: Dict | None = None
-    ) -> None:
-        error_dict = error_dict or {}
-        for code, msg in error_dict.items():
-            if res.code == code:
-                raise ApiException(res.code, f"{msg} {res.error}")
-        if 200 > res.code or res.code > 299:
-            raise ApiException(res.code, str(res.error))
+    def _send(self, call: Call) -> WykopResponse:
+        return self.connector.request(
+            call.method, call.endpoint, **self._request_kwargs(call)
+        )
+
+    def _request(self, call: Call) -> Any:
+        return self._result(call, self._send(call))
+
+    def _request_pages(
+        self, call: Call, page: int | str | None, page_count: int
+    ) -> Any:
+        res = self.connector.request_with_pagination(
+            **self._page_kwargs(call, page, page_count)
+        )
+        return self._result(call, res)
+
+    def _iter_pages(
+        self, call: Call, page: int | str | None, page_count: int
+    ) -> PageIterator:
+        pages = self.connector.iter_pages(
+            **self._page_kwargs(call, page, page_count)
+        )
+        return PageIterator(
+            pages, page, self._check(call), self._transform(call.model)
+        )
+
+    def _upload(self, call: Call, source: str | None, media_type: str) -> Any:
+        res = self._send(call)
+        return self._uploaded_photo(call, res, source, media_type)
 
     # Users
 
@@ -101,13 +353,7 @@ class WykopAPI:
         Returns:
             List: Kolekcja wyszukanych użytkowników
         """
-        endpoint = "users/autocomplete"
-        data = {"query": query}
-        res = self.connector.request(Methods.GET, endpoint, params=data)
-        self.raise_error_if_needed(
-            res, {400: "Brak parametru query lub parametr zbyt krótki"}
-        )
-        return res.data  # type: ignore
+        return self._request(endpoints.get_users_autocomplete(query))
 
     # Tags
 
@@ -121,13 +367,7 @@ class WykopAPI:
         Returns:
             List: Kolekcja wyszukanych tagów (max do 10 wyników)
         """
-        endpoint = "tags/autocomplete"
-        data = {"query": query}
-        res = self.connector.request(Methods.GET, endpoint, params=data)
-        self.raise_error_if_needed(
-            res, {400: "Brak parametru query lub parametr zbyt krótki"}
-        )
-        return res.data  # type: ignore
+        return self._request(endpoints.get_tags_autocomplete(query))
 
     def get_tags_popular(self) -> List:
         """
@@ -136,10 +376,7 @@ class WykopAPI:
         Returns:
             List: Lista tagów
         """
-        endpoint = "tags/popular"
-        res = self.connector.request(Methods.GET, endpoint)
-        self.raise_error_if_needed(res)
-        return res.data  # type: ignore
+        return self._request(endpoints.get_tags_popular())
 
     def get_tags_popular_user_tags(self) -> List:
         """
@@ -148,10 +385,7 @@ class WykopAPI:
         Returns:
             List: Kolekcja popularnych tagów autorskich (max do 10 wyników)
         """
-        endpoint = "tags/popular-user-tags"
-        res = self.connector.request(Methods.GET, endpoint)
-        self.raise_error_if_needed(res)
-        return res.data  # type: ignore
+        return self._request(endpoints.get_tags_popular_user_tags())
 
     def get_tags_related(self, tag_name: str) -> List:
         """
@@ -163,30 +397,13 @@ class WykopAPI:
         Returns:
             List: Kolekcja powiązanych tagów (max do 10 wyników)
         """
-        endpoint = f"tags/{tag_name}/related"
-        res = self.connector.request(Methods.GET, endpoint)
-        self.raise_error_if_needed(
-            res, {400: "Brak tagu lub tag jest za krótki"}
-        )
-        return res.data  # type: ignore
+        return self._request(endpoints.get_tags_related(tag_name))
 
     def get_tag(self, tag_name: str) -> Dict:
-        endpoint = f"tags/{tag_name}"
-        res = self.connector.request(Methods.GET, endpoint)
-        self.raise_error_if_needed(res)
-        return res.data  # type: ignore
+        return self._request(endpoints.get_tag(tag_name))
 
     def put_tag(self, tag_name: str, data: Dict) -> None:
-        endpoint = f"tags/{tag_name}"
-        res = self.connector.request(Methods.PUT, endpoint, data=data)
-        self.raise_error_if_needed(
-            res,
-            {
-                400: "Brak uprawnień do usunięcia znaleziska.",
-                404: "Tag nie istnieje",
-                409: "Wystąpił błąd podczas walidacji formularza.",
-            },
-        )
+        self._request(endpoints.put_tag(tag_name, data))
 
     def get_tag_stream(
         self,
@@ -223,23 +440,46 @@ class WykopAPI:
         Returns:
             List: Lista wpisów i znalezisk
         """
-        endpoint = f"tags/{tag_name}/stream"
-        params: Dict[str, str | int | None] = NotEmptyDict()
-        params["sort"] = sort
-        params["type"] = type_of_content
-        params["year"] = year
-        params["month"] = month
-
-        res = self.connector.request_with_pagination(
-            Methods.GET, endpoint, page=page, page_count=page_count
+        call = endpoints.get_tag_stream(
+            tag_name, sort, type_of_content, year, month
         )
-        self.raise_error_if_needed(
-            res,
-            {
-                404: "Podany tag nie istnieje lub jego dane są niedostępne.",
-            },
+        return self._request_pages(call, page, page_count)
+
+    def iter_tag_stream(
+        self,
+        tag_name: str,
+        page: int | str | None = None,
+        sort: str = "best",
+        type_of_content: str = "all",
+        year: int | None = None,
+        month: int | None = None,
+        page_count: int = -1,
+    ) -> PageIterator:
+        """
+        Leniwa wersja :meth:`get_tag_stream`. Wpisy i znaleziska są zwracane
+        w trakcie pobierania kolejnych stron, bez trzymania całej historii
+        tagu w pamięci. Aktualna strona jest dostępna w `cursor`, można ją
+        przekazać jako `page`, żeby wznowić pobieranie.
+
+        Args:
+            tag_name (str): Nazwa tagu
+            page (int | str| None): Numer strony do pobrania. Defaults to None.
+            sort (str, optional): Rodzaj sortowania. Available values : "all",
+            "best". Defaults to "best".
+            type_of_content (str, optional): Rodzaj. Available values : "all",
+            "author", "link", "entry". Defaults to "all".
+            year (int | None, optional): Rok. Defaults to None.
+            month (int | None, optional): Miesiąc. Defaults to None.
+            page_count (int, optional): Liczba stron do pobrania.
+            Podaj -1, żeby pobrać wszystko. Defaults to -1.
+
+        Returns:
+            PageIterator: Iterator wpisów i znalezisk
+        """
+        call = endpoints.get_tag_stream(
+            tag_name, sort, type_of_content, year, month
         )
-        return res.data  # type: ignore
+        return self._iter_pages(call, page, page_count)
 
     def get_tag_newer(
         self,
@@ -266,19 +506,12 @@ class WykopAPI:
         Returns:
             int: Licznik nowych obiektów
         """
-
-        endpoint = f"tags/{tag_name}/newer"
-        params: Dict[str, str | int | None] = NotEmptyDict()
-        params["sort"] = sort
-        params["type"] = type_of_content
-        params["date"] = date.strftime("%Y-%m-%d %H:%M:%S") if date else None
-        params["id"] = obj_id
-
-        res = self.connector.request(Methods.GET, endpoint, params=params)
-        self.raise_error_if_needed(
-            res, {404: "Podany tag nie istnieje lub jego dane są niedostępne."}
+        res = self._request(
+            endpoints.get_tag_newer(
+                tag_name, type_of_content, sort, date, obj_id
+            )
         )
-        return res.data.get("count", 0)  # type: ignore
+        return res.get("count", 0)
 
     def get_tag_users(self, tag_name: str) -> List:
         """
@@ -290,15 +523,7 @@ class WykopAPI:
         Returns:
             List: Kolekcja autorów tagu (short profile)
         """
-        endpoint = f"tags/{tag_name}/users"
-        res = self.connector.request(Methods.GET, endpoint)
-        self.raise_error_if_needed(
-            res,
-            {
-                404: "Podany tag nie istnieje lub jego dane są niedostępne.",
-            },
-        )
-        return res.data  # type: ignore
+        return self._request(endpoints.get_tag_users(tag_name))
 
     def post_tag_user(self, tag_name: str, username: str) -> None:
         """
@@ -308,15 +533,7 @@ class WykopAPI:
             tag_name (str): Nazwa tagu
             username (str): Nazwa użytkownika
         """
-        endpoint = f"tags/{tag_name}/users/{username}"
-        res = self.connector.request(Methods.POST, endpoint)
-        self.raise_error_if_needed(
-            res,
-            {
-                400: "Brak wymaganych uprawnień.",
-                404: "Podany tag nie istnieje lub jego dane są niedostępne.",
-            },
-        )
+        self._request(endpoints.post_tag_user(tag_name, username))
 
     def delete_tag_user(self, tag_name: str, username: str) -> None:
         """
@@ -326,15 +543,7 @@ class WykopAPI:
             tag_name (str): Nazwa tagu
             username (str): Nazwa użytkownika
         """
-        endpoint = f"tags/{tag_name}/users/{username}"
-        res = self.connector.request(Methods.DELETE, endpoint)
-        self.raise_error_if_needed(
-            res,
-            {
-                400: "Brak wymaganych uprawnień.",
-                404: "Podany tag nie istnieje lub jego dane są niedostępne.",
-            },
-        )
+        self._request(endpoints.delete_tag_user(tag_name, username))
 
     # Mikroblog
 
@@ -371,25 +580,42 @@ class WykopAPI:
         Returns:
             List: Wpisy z mikrobloga.
         """
+        call = endpoints.get_entries(sort, last_update, category, bucket)
+        return self._request_pages(call, page, page_count)
 
-        endpoint = "entries"
+    def iter_entries(
+        self,
+        sort: str = "hot",
+        last_update: int = 12,
+        page_count: int = -1,
+        page: int | str | None = None,
+        category: str | None = None,
+        bucket: str | None = None,
+    ) -> PageIterator:
+        """
+        Leniwa wersja :meth:`get_entries`. Wpisy są zwracane w trakcie
+        pobierania kolejnych stron. Aktualna strona jest dostępna
+        w `cursor`, można ją przekazać jako `page`, żeby wznowić pobieranie.
 
-        params: Dict[str, str | int | None] = NotEmptyDict()
-        params["sort"] = sort
-        params["last_update"] = last_update
-        params["category"] = category
-        params["bucket"] = bucket
+        Args:
+            sort (str, optional): Rodzaj sortowania.
+                Available values : newest, active, hot. Defaults to "hot".
+            last_update (int, optional): Pokaż wyniki z ostatnich godzin
+                [1, 2, 3, 6, 12, 24]. Filtr dostępny tylko wraz z filtrem gorące.
+                Defaults to 12.
+            page_count (int, optional): Liczba stron do pobrania.
+                Podaj -1, żeby pobrać wszystko. Defaults to -1.
+            page (int | str | None, optional): Numer strony do pobrania.
+                Defaults to None.
+            category (str | None, optional): Kategoria.
+                Defaults to None.
+            bucket (str | None, optional): Hash kategorii użytkownika. Defaults to None.
 
-        res = self.connector.request_with_pagination(
-            Methods.GET, endpoint, page=page, page_count=page_count
-        )
-        self.raise_error_if_needed(
-            res,
-            {
-                400: "Osiągnięto limit paginacji.",
-            },
-        )
-        return res.data  # type: ignore
+        Returns:
+            PageIterator: Iterator wpisów z mikrobloga.
+        """
+        call = endpoints.get_entries(sort, last_update, category, bucket)
+        return self._iter_pages(call, page, page_count)
 
     def post_entry(
         self,
@@ -417,23 +643,8 @@ class WykopAPI:
         Returns:
             Dict: Dodany wpis
         """
-
-        endpoint = "entries"
-        data: Dict[str, str | int | None] = NotEmptyDict()
-        data["content"] = content
-        data["photo"] = photo
-        data["embed"] = embed
-        data["survey"] = survey
-        data["adult"] = adult
-        res = self.connector.request(Methods.POST, endpoint, data=data)
-        self.raise_error_if_needed(
-            res,
-            {
-                400: "Gdy użytkownik wykona niepoprawny request.",
-                409: "Wystąpił błąd podczas walidacji formularza.",
-            },
-        )
-        return res.data  # type: ignore
+        call = endpoints.post_entry(content, photo, embed, survey, adult)
+        return self._request(call)
 
     def get_entry_by_id(self, entry_id: int) -> Entry:
         """
@@ -445,15 +656,121 @@ class WykopAPI:
         Returns:
             Dict: Wpis z mikrobloga
         """
-        endpoint = f"/entries/{entry_id}"
-        res = self.connector.request(Methods.GET, endpoint)
-        self.raise_error_if_needed(
-            res,
-            {
-                404: "Nie odnaleziono wpisu.",
-            },
-        )
-        return res.data  # type: ignore
+        return self._request(endpoints.get_entry_by_id(entry_id))
+
+    def get_entries_by_ids(
+        self, entry_ids: Iterable[int], workers: int = 8
+    ) -> List[BulkResult]:
+        """
+        Zwraca wiele wpisów z mikrobloga, pobieranych równolegle.
+        Błąd pobrania jednego wpisu nie przerywa pobierania pozostałych.
+
+        Args:
+            entry_ids (Iterable[int]): Identyfikatory wpisów
+            workers (int, optional): Liczba równoległych zapytań. Nie powinna
+                być większa niż `pool_maxsize` połączenia. Defaults to 8.
+
+        Returns:
+            List[BulkResult]: Wyniki w kolejności identyfikatorów
+        """
+        entry_ids = list(entry_ids)
+        results = {
+            result.entry_id: result
+            for result in self.iter_entries_by_ids(entry_ids, workers)
+        }
+        return [results[entry_id] for entry_id in entry_ids]
+
+    def iter_entries_by_ids(
+        self, entry_ids: Iterable[int], workers: int = 8
+    ) -> Iterator[BulkResult]:
+        """
+        Jak :meth:`get_entries_by_ids`, ale zwraca wyniki w kolejności
+        pobrania. Przerwanie iteracji anuluje oczekujące zapytania.
+
+        Args:
+            entry_ids (Iterable[int]): Identyfikatory wpisów
+            workers (int, optional): Liczba równoległych zapytań.
+                Defaults to 8.
+
+        Yields:
+            Iterator[BulkResult]: Wyniki
+        """
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = [
+                pool.submit(self._get_entry_result, entry_id)
+                for entry_id in dict.fromkeys(entry_ids)
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_entry_result(self, entry_id: int) -> BulkResult:
+        try:
+            return BulkResult(entry_id, self.get_entry_by_id(entry_id))
+        except (ApiException, requests.RequestException, ValueError) as exc:
+            return BulkResult(entry_id, error=exc)
+
+    def iter_comment_trees(
+        self,
+        entry_ids: Iterable[int],
+        workers: int = 8,
+        with_votes: bool = False,
+    ) -> Iterator[CommentTree]:
+        """
+        Pobiera wpisy z mikrobloga razem ze wszystkimi komentarzami
+        i opcjonalnie listami głosujących na komentarze. Wpisy są
+        przetwarzane równolegle, a wyniki zwracane w kolejności ukończenia.
+        Identyfikatory są pobierane z `entry_ids` na bieżąco, więc mogą
+        pochodzić z długiego strumienia. Limit zapytań połączenia jest
+        wspólny dla wszystkich wątków.
+
+        Args:
+            entry_ids (Iterable[int]): Identyfikatory wpisów
+            workers (int, optional): Liczba równoległych zapytań.
+                Defaults to 8.
+            with_votes (bool, optional): Pobierz głosujących na komentarze,
+                które mają głosy. Defaults to False.
+
+        Yields:
+            Iterator[CommentTree]: Wyniki
+        """
+        ids = iter(entry_ids)
+        pool = ThreadPoolExecutor(max_workers=workers)
+        pending: Set[Future] = set()
+        try:
+            while True:
+                # Keep queue short, so IDs are consumed lazily
+                for entry_id in itertools.islice(
+                    ids, 2 * workers - len(pending)
+                ):
+                    pending.add(
+                        pool.submit(self._comment_tree, entry_id, with_votes)
+                    )
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _comment_tree(self, entry_id: int, with_votes: bool) -> CommentTree:
+        tree = CommentTree(entry_id)
+        try:
+            tree.entry = self.get_entry_by_id(entry_id)
+            tree.comments = self.get_entry_comments(entry_id, page_count=-1)
+            if with_votes:
+                tree.votes = {
+                    comment_id: self.get_entry_comment_votes(
+                        entry_id, comment_id
+                    )
+                    for comment_id in self._voted_comments(tree.comments)
+                }
+        except (ApiException, requests.RequestException, ValueError) as exc:
+            tree.error = exc
+        return tree
 
     def put_entry(
         self,
@@ -484,24 +801,10 @@ class WykopAPI:
         Returns:
             Dict: Dodany wpis
         """
-
-        endpoint = f"/entries/{entry_id}"
-        data: Dict[str, str | int | None] = NotEmptyDict()
-        data["content"] = content
-        data["photo"] = photo
-        data["embed"] = embed
-        data["survey"] = survey
-        data["adult"] = adult
-        res = self.connector.request(Methods.PUT, endpoint, data=data)
-        self.raise_error_if_needed(
-            res,
-            {
-                400: "Brak uprawnień do modyfikacji wpisu.",
-                404: "Nie odnaleziono wpisu.",
-                409: "Wystąpił błąd podczas walidacji formularza.",
-            },
+        call = endpoints.put_entry(
+            entry_id, content, photo, embed, survey, adult
         )
-        return res.data  # type: ignore
+        return self._request(call)
 
     def delete_entry_by_id(self, entry_id: int) -> None:
         """
@@ -511,15 +814,7 @@ class WykopAPI:
             entry_id (int): Identyfikator wpisu
 
         """
-        endpoint = f"/entries/{entry_id}"
-        res = self.connector.request(Methods.DELETE, endpoint)
-        self.raise_error_if_needed(
-            res,
-            {
-                400: "Brak uprawnień do usunięcia wpisu.",
-                404: "Nie odnaleziono wpisu.",
-            },
-        )
+        self._request(endpoints.delete_entry_by_id(entry_id))
 
     def get_entry_votes(self, entry_id: int) -> List[User]:
         """
@@ -531,15 +826,7 @@ class WykopAPI:
         Returns:
             List: Lista użytkowników, który oddali głos.
         """
-        endpoint = f"/entries/{entry_id}/votes"
-        res = self.connector.request(Methods.GET, endpoint)
-        self.raise_error_if_needed(
-            res,
-            {
-                404: "Nie odnaleziono wpisu.",
-            },
-        )
-        return res.data  # type: ignore
+        return self._request(endpoints.get_entry_votes(entry_id))
 
     def post_entry_vote(self, entry_id: int) -> None:
         """
@@ -548,15 +835,7 @@ class WykopAPI:
         Args:
             entry_id (int): Identyfikator wpisu
         """
-        endpoint = f"/entries/{entry_id}/votes"
-        res = self.connector.request(Methods.POST, endpoint)
-        self.raise_error_if_needed(
-            res,
-            {
-                400: "Użytkownik głosował wcześniej na wpis lub jest jego autorem.",
-                404: "Nie odnaleziono wpisu.",
-            },
-        )
+        self._request(endpoints.post_entry_vote(entry_id))
 
     def delete_entry_vote(self, entry_id: str) -> None:
         """
@@ -565,15 +844,7 @@ class WykopAPI:
         Args:
             entry_id (str): Identyfikator wpisu
         """
-        endpoint = f"/entries/{entry_id}/votes"
-        res = self.connector.request(Methods.DELETE, endpoint)
-        self.raise_error_if_needed(
-            res,
-            {
-                400: "Użytkownik nie głosował wcześniej na wpis.",
-                404: "Nie odnaleziono wpisu.",
-            },
-        )
+        self._request(endpoints.delete_entry_vote(entry_id))
 
     def get_entries_newer(
         self, entry_id: int, category: str | None = None
@@ -588,17 +859,8 @@ class WykopAPI:
         Returns:
             int: Liczba nowszych wpisów.
         """
-        endpoint = f"/entries/{entry_id}/newer"
-        params = NotEmptyDict()
-        params["category"] = category
-        res = self.connector.request(Methods.GET, endpoint, params=params)
-        self.raise_error_if_needed(
-            res,
-            {
-                404: "Nie odnaleziono wpisu.",
-            },
-        )
-        return res.data["count"]  # type: ignore
+        res = self._request(endpoints.get_entries_newer(entry_id, category))
+        return res["count"]
 
     # Mikroblog - Komentarz
 
@@ -618,13 +880,29 @@ class WykopAPI:
         Returns:
             List[Comment]: _description_
         """
+        call = endpoints.get_entry_comments(entry_id)
+        return self._request_pages(call, page, page_count)
 
-        endpoint = f"entries/{entry_id}/comments"
-        res = self.connector.request_with_pagination(
-            Methods.GET, endpoint, page=page, page_count=page_count
-        )
-        self.raise_error_if_needed(res)
-        return res.data  # type: ignore
+    def iter_entry_comments(
+        self, entry_id: int, page: int = 1, page_count: int = -1
+    ) -> PageIterator:
+        """
+        Leniwa wersja :meth:`get_entry_comments`. Komentarze są zwracane
+        w trakcie pobierania kolejnych stron. Aktualna strona jest dostępna
+        w `cursor`, można ją przekazać jako `page`, żeby wznowić pobieranie.
+
+        Args:
+            entry_id (int): Identyfikator wpisu
+            page (int, optional): Numer strony do pobrania.
+                Defaults to 1.
+            page_count (int, optional): Liczba stron do pobrania.
+                Podaj -1, żeby pobrać wszystko. Defaults to -1.
+
+        Returns:
+            PageIterator: Iterator komentarzy
+        """
+        call = endpoints.get_entry_comments(entry_id)
+        return self._iter_pages(call, page, page_count)
 
     def post_entry_comment(
         self,
@@ -654,22 +932,10 @@ class WykopAPI:
         Returns:
             Comment: Dodany komentarz
         """
-        endpoint = f"entries/{entry_id}/comments"
-
-        data = NotEmptyDict()
-        data["content"] = content
-        data["embed"] = embed
-        data["photo"] = photo
-        data["adult"] = adult
-        res = self.connector.request(Methods.POST, endpoint, data=data)
-        self.raise_error_if_needed(
-            res,
-            {
-                404: "Nie odnaleziono znaleziska lub komentarza",
-                409: "Wystąpił błąd podczas walidacji formularza.",
-            },
+        call = endpoints.post_entry_comment(
+            entry_id, content, embed, photo, adult
         )
-        return res.data  # type: ignore
+        return self._request(call)
 
     def get_entry_comment(self, entry_id: int, comment_id: int) -> Comment:
         """
@@ -682,15 +948,8 @@ class WykopAPI:
         Returns:
             Comment: Komentarz z mikroblogu
         """
-        endpoint = f"entries/{entry_id}/comments/{comment_id}"
-        res = self.connector.request(Methods.GET, endpoint)
-        self.raise_error_if_needed(
-            res,
-            {
-                404: "Nie odnaleziono wpisu lub komentarza.",
-            },
-        )
-        return res.data  # type: ignore
+        call = endpoints.get_entry_comment(entry_id, comment_id)
+        return self._request(call)
 
     def put_entry_comment(
         self,
@@ -724,23 +983,10 @@ class WykopAPI:
         Returns:
             Comment: Zmodyfikowany komentarz
         """
-        endpoint = f"entries/{entry_id}/comments/{comment_id}"
-
-        data = NotEmptyDict()
-        data["content"] = content
-        data["embed"] = embed
-        data["photo"] = photo
-        data["adult"] = adult
-        res = self.connector.request(Methods.PUT, endpoint, data=data)
-        self.raise_error_if_needed(
-            res,
-            {
-                400: "Brak uprawnień do modyfikacji komentarza.",
-                404: "Nie odnaleziono wpisu lub komentarza.",
-                409: "Wystąpił błąd podczas walidacji formularza.",
-            },
+        call = endpoints.put_entry_comment(
+            entry_id, comment_id, content, embed, photo, adult
         )
-        return res.data  # type: ignore
+        return self._request(call)
 
     def delete_entry_comment(self, entry_id: int, comment_id: int) -> None:
         """
@@ -752,15 +998,8 @@ class WykopAPI:
             entry_id (int): Identyfikator wpisu
             comment_id (int): Identyfikator komentarza
         """
-        endpoint = f"entries/{entry_id}/comments/{comment_id}"
-        res = self.connector.request(Methods.DELETE, endpoint)
-        self.raise_error_if_needed(
-            res,
-            {
-                400: "Brak uprawnień do usunięcia komentarza.",
-                404: "Nie odnaleziono wpisu lub komentarza.",
-            },
-        )
+        call = endpoints.delete_entry_comment(entry_id, comment_id)
+        self._request(call)
 
     def get_entry_comment_votes(
         self, entry_id: int, comment_id: int
@@ -775,15 +1014,8 @@ class WykopAPI:
         Returns:
             List[User]: Lista głosujących użytkowników
         """
-        endpoint = f"entries/{entry_id}/comments/{comment_id}/votes"
-        res = self.connector.request(Methods.GET, endpoint)
-        self.raise_error_if_needed(
-            res,
-            {
-                404: "Nie odnaleziono wpisu lub komentarza.",
-            },
-        )
-        return res.data  # type: ignore
+        call = endpoints.get_entry_comment_votes(entry_id, comment_id)
+        return self._request(call)
 
     def post_entry_comment_vote(self, entry_id: int, comment_id: int) -> None:
         """
@@ -793,16 +1025,8 @@ class WykopAPI:
             entry_id (int): Identyfikator wpisu
             comment_id (int): Identyfikator komentarza
         """
-        endpoint = f"entries/{entry_id}/comments/{comment_id}/votes"
-        res = self.connector.request(Methods.POST, endpoint)
-        self.raise_error_if_needed(
-            res,
-            {
-                400: "Użytkownik głosował wcześniej na komentarz"
-                "lub jest jego autorem.",
-                404: "Nie odnaleziono wpisu lub komentarza.",
-            },
-        )
+        call = endpoints.post_entry_comment_vote(entry_id, comment_id)
+        self._request(call)
 
     def delete_entry_comment_vote(self, entry_id: int, comment_id: int) -> None:
         """
@@ -812,19 +1036,16 @@ class WykopAPI:
             entry_id (int): Identyfikator wpisu
             comment_id (int): Identyfikator komentarza
         """
-        endpoint = f"entries/{entry_id}/comments/{comment_id}/votes"
-        res = self.connector.request(Methods.DELETE, endpoint)
-        self.raise_error_if_needed(
-            res,
-            {
-                400: "Użytkownik nie głosował wcześniej na komentarz.",
-                404: "Nie odnaleziono wpisu lub komentarza.",
-            },
-        )
+        call = endpoints.delete_entry_comment_vote(entry_id, comment_id)
+        self._request(call)
 
     # Media - Zdjęcia
     def post_media_photo(
-        self, media_type: str, photo: bytes, photo_name: str, photo_type: str
+        self,
+        media_type: str,
+        photo: PhotoSource,
+        photo_name: str | None = None,
+        photo_type: str | None = None,
     ) -> Photo:
         """
         Wgrywanie nowego pliku na serwer
@@ -832,35 +1053,76 @@ class WykopAPI:
         mimetype: 'image/jpeg', 'image/jpg', 'image/pjpeg', 'image/gif',
         'image/png', 'image/x-png'. Maksymalny rozmiar pliku to 10 MB.
 
+        Plik podany jako ścieżka lub obiekt pliku jest wysyłany strumieniowo,
+        bez wczytywania całości do pamięci.
+
+        Jeśli ustawiono `media_cache`, ten sam plik nie jest wysyłany
+        ponownie, zwracane jest wcześniej wgrane zdjęcie.
+
         Args:
             media_type (str): Nazwa obszaru z plikami na serwerze
                 [settings, comments, links, content]
-            photo (bytes): Plik do wysłania
-            photo_name (str): Nazwa pliku
-            photo_type (str): mimetype
-        """
-        endpoint = "media/photos/upload"
-        data = NotEmptyDict()
-        data["type"] = media_type
-        files = {
-            "file": (photo_name, photo, photo_type),
-        }
-        res = self.connector.request(
-            Methods.POST,
-            endpoint,
-            params=data,
-            files=files,
+            photo (PhotoSource): Plik do wysłania: zawartość, ścieżka lub
+                obiekt pliku otwarty w trybie binarnym
+            photo_name (str | None, optional): Nazwa pliku. Domyślnie nazwa
+                pliku ze ścieżki.
+            photo_type (str | None, optional): mimetype. Domyślnie zgadywany
+                na podstawie nazwy pliku.
+        """
+        call = endpoints.post_media_photo(
+            media_type, photo, photo_name, photo_type
         )
-        self.raise_error_if_needed(
-            res,
-            {
-                400: "Nie załączono pliku.",
-                413: "Za duży plik.",
-                415: "Nieobsługiwane mime type.",
-                429: "Za dużo prób dodania zdjęcia w którtkim okresie czasu.",
-            },
-        )
-        return res.data  # type: ignore
+        source = None
+        if self.media_cache is not None:
+            source = content_digest(photo)
+        cached = self._cached_photo(source, media_type)
+        if cached is not None:
+            return cached
+        return self._upload(call, source, media_type)
+
+    def post_media_photos(
+        self, media_type: str, photos: Iterable[PhotoSource], workers: int = 4
+    ) -> List[UploadResult]:
+        """
+        Wgrywanie wielu plików na serwer, równolegle. Pliki są wysyłane
+        strumieniowo, więc zużycie pamięci nie zależy od ich liczby
+        i rozmiaru. Błąd wysłania jednego pliku nie przerywa wysyłania
+        pozostałych.
+
+        Args:
+            media_type (str): Nazwa obszaru z plikami na serwerze
+                [settings, comments, links, content]
+            photos (Iterable[PhotoSource]): Pliki do wysłania, najlepiej
+                ścieżki
+            workers (int, optional): Liczba równoległych zapytań.
+                Defaults to 4.
+
+        Returns:
+            List[UploadResult]: Wyniki w kolejności plików
+        """
+        photos = list(photos)
+        results: List[UploadResult] = [None] * len(photos)  # type: ignore
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(self._upload_result, media_type, photo): index
+                for index, photo in enumerate(photos)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        return results
+
+    def _upload_result(
+        self, media_type: str, photo: PhotoSource
+    ) -> UploadResult:
+        try:
+            return UploadResult(photo, self.post_media_photo(media_type, photo))
+        except (
+            ApiException,
+            requests.RequestException,
+            OSError,
+            ValueError,
+        ) as exc:
+            return UploadResult(photo, error=exc)
 
     def post_media_photo_by_url(self, media_type: str, photo_url: str) -> Photo:
         """
@@ -875,28 +1137,15 @@ class WykopAPI:
             photo_url (str): Adres na jakim znajduję się obrazek
 
         """
-        endpoint = "media/photos"
-        params = NotEmptyDict()
-        params["type"] = media_type
-        data = NotEmptyDict()
-        data["url"] = photo_url
-        res = self.connector.request(
-            Methods.POST,
-            endpoint,
-            params=params,
-            data=data,
-        )
-        self.raise_error_if_needed(
-            res,
-            {
-                400: "Nie załączono pliku.",
-                409: "Wystąpił błąd podczas walidacji formularza",
-                413: "Za duży plik.",
-                415: "Nieobsługiwane mime type.",
-                429: "Za dużo prób dodania zdjęcia w którtkim okresie czasu.",
-            },
+        source = self._url_source(photo_url)
+        cached = self._cached_photo(source, media_type)
+        if cached is not None:
+            return cached
+        return self._upload(
+            endpoints.post_media_photo_by_url(media_type, photo_url),
+            source,
+            media_type,
         )
-        return res.data  # type: ignore
 
     def delete_media_photo(self, photo_key: str) -> None:
         """
@@ -907,13 +1156,9 @@ class WykopAPI:
             photo_key (str): Identyfikator pliku
 
         """
-        endpoint = f"media/photos/{photo_key}"
-        res = self.connector.request(Methods.DELETE, endpoint, timeout=30)
-        self.raise_error_if_needed(
-            res,
-            {
-                400: "Brak uprawnień do usunięcia pliku.",
-                404: "Plik nie został odnaleziony lub neleży "
-                "do innego użytkownika.",
-            },
-        )
+        call = endpoints.delete_media_photo(photo_key)
+        res = self._send(call)
+        if self.media_cache is not None:
+            # Key is not usable anymore, also when deletion failed
+            self.media_cache.invalidate(photo_key)
+        self._result(call, res)
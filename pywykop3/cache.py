@@ -0,0 +1,218 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Tuple
+
+from .coalesce import request_key
+from .utils import match_template
+
+# Time to live, in seconds, of read-only endpoints cached by default
+DEFAULT_TTLS = {
+    "tags/popular": 300.0,
+    "tags/popular-user-tags": 300.0,
+    "tags/{}": 60.0,
+    "tags/{}/related": 300.0,
+    "entries/{}": 30.0,
+    "users/autocomplete": 120.0,
+}
+
+# Rough memory used by single entry besides response body, in bytes
+ENTRY_OVERHEAD = 200
+
+
+@dataclass
+class CacheStats:
+    """
+    Statistics of endpoint template.
+
+    - hits - number of requests served from cache
+    - misses - number of cacheable requests sent to server
+    - evictions - number of entries removed to fit in memory budget
+    - invalidations - number of entries removed by mutating requests
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class _Entry:
+    template: str
+    endpoint: str
+    code: int
+    body: bytes
+    expires_at: float
+    size: int
+
+
+class ResponseCache:
+    """
+    Opt-in TTL/LRU cache of GET responses used by :class:`WykopConnector`.
+
+    Only endpoints matching one of `ttls` templates are cached (`{}` matches
+    single path segment). Entries are keyed by method, endpoint, params and
+    identity of the connector, so logged in and anonymous sessions never
+    share responses. Only 2xx responses are stored.
+
+    Successful PUT, POST and DELETE requests invalidate entries sharing the
+    first two path segments with their endpoint, e.g. `put_entry` on
+    `entries/1` drops cached `entries/1` and `entries/1/comments`.
+
+    Args:
+        ttls (Dict[str, float] | None, optional): Time to live in seconds
+            per endpoint template. Defaults to :data:`DEFAULT_TTLS`.
+        max_bytes (int, optional): Approximate memory budget. Least recently
+            used entries are evicted when it is exceeded.
+            Defaults to 16 MiB.
+    """
+
+    def __init__(
+        self,
+        ttls: Dict[str, float] | None = None,
+        max_bytes: int = 16 * 1024 * 1024,
+    ) -> None:
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._stats: Dict[str, CacheStats] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    _key = staticmethod(request_key)
+
+    def _template(self, method: str, endpoint: str) -> str | None:
+        if method != "GET":
+            return None
+        return match_template(endpoint, self.ttls)
+
+    def _group_stats(self, template: str) -> CacheStats:
+        if template not in self._stats:
+            self._stats[template] = CacheStats()
+        return self._stats[template]
+
+    def _remove(self, key: Hashable) -> _Entry:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        return entry
+
+    def get(
+        self, method: str, endpoint: str, params: Dict | None, identity: str
+    ) -> Tuple[int, bytes] | None:
+        """
+        Cached response of request.
+
+        Returns:
+            Tuple[int, bytes] | None: Status code and raw body, None if request
+                is not cached or its entry has expired.
+        """
+        template = self._template(method, endpoint)
+        if template is None:
+            return None
+        key = self._key(method, endpoint, params, identity)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._group_stats(template).misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._group_stats(template).hits += 1
+            return entry.code, entry.body
+
+    def store(
+        self,
+        method: str,
+        endpoint: str,
+        params: Dict | None,
+        identity: str,
+        code: int,
+        body: bytes,
+    ) -> None:
+        """
+        Register response. Cacheable 2xx responses are stored, successful
+        mutating requests invalidate related entries.
+        """
+        if 200 > code or code > 299:
+            return
+        if method != "GET":
+            self.invalidate(endpoint)
+            return
+        template = self._template(method, endpoint)
+        if template is None:
+            return
+        key = self._key(method, endpoint, params, identity)
+        size = len(body) + ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        entry = _Entry(
+            template,
+            endpoint.strip("/"),
+            code,
+            body,
+            time.monotonic() + self.ttls[template],
+            size,
+        )
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._group_stats(evicted.template).evictions += 1
+
+    def invalidate(self, endpoint: str) -> int:
+        """
+        Remove entries sharing first two path segments with `endpoint`.
+
+        Returns:
+            int: Number of removed entries.
+        """
+        prefix = "/".join(endpoint.strip("/").split("/")[:2])
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if entry.endpoint == prefix
+                or entry.endpoint.startswith(prefix + "/")
+            ]
+            for key in keys:
+                entry = self._remove(key)
+                self._group_stats(entry.template).invalidations += 1
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def size(self) -> int:
+        """
+        Approximate memory used by cached responses, in bytes.
+        """
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, CacheStats]:
+        """
+        Statistics per endpoint template.
+        """
+        with self._lock:
+            return {
+                template: CacheStats(**stats.__dict__)
+                for template, stats in self._stats.items()
+            }
@@ -0,0 +1,227 @@
+import base64
+import gzip
+import json
+import threading
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import IO, Any, Deque, Dict, Hashable, Iterator, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Response headers kept in cassette
+RECORDED_HEADERS = ("Content-Type", "Retry-After")
+
+# Credentials replaced with :data:`REDACTED` in recorded requests
+REQUEST_SECRETS = ("key", "secret", "token", "refresh_token")
+
+# Tokens replaced with :data:`REDACTED` in recorded responses, rotated
+# refresh token comes back as `refresh-token`
+RESPONSE_SECRETS = ("token", "refresh_token", "refresh-token")
+
+REDACTED = "<redacted>"
+
+
+class CassetteError(Exception):
+    """
+    Raised in replay mode when request was not recorded.
+    """
+
+
+def _key(method: str, url: str) -> Hashable:
+    """
+    Key of interaction: method, path and sorted query params. Request body
+    is not a part of the key.
+    """
+    parts = urlsplit(url)
+    params = tuple(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return method.upper(), parts.path.rstrip("/"), params
+
+
+def _redact(value: Any, secrets: Tuple[str, ...]) -> Any:
+    """
+    Copy of JSON `value` with values of `secrets` fields replaced, at any
+    depth.
+    """
+    if isinstance(value, dict):
+        return {
+            name: REDACTED if name in secrets else _redact(item, secrets)
+            for name, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact(item, secrets) for item in value]
+    return value
+
+
+def _redact_body(body: str, secrets: Tuple[str, ...]) -> str:
+    """
+    JSON `body` with `secrets` redacted, other bodies as they are.
+    """
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body
+    redacted = _redact(data, secrets)
+    if redacted == data:
+        return body
+    return json.dumps(redacted, ensure_ascii=False)
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")  # type: ignore
+    return open(path, mode, encoding="utf-8")
+
+
+class Cassette:
+    """
+    Recorded request/response pairs, stored as JSON Lines, gzipped when
+    path ends with `.gz`. Every line is a single interaction; text bodies
+    are stored as they are, binary bodies base64 encoded.
+
+    JSON request bodies are kept for reference. Their credentials and
+    tokens of auth responses are replaced with :data:`REDACTED`, so
+    cassettes can be shared. Replayed connector gets the placeholder as
+    its token.
+
+    On load interactions are indexed by method, path and query params.
+    Repeated requests are answered with consecutive recorded responses,
+    the last one is repeated when they run out.
+
+    Args:
+        path (str | Path): Cassette file.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._index: Dict[Hashable, Deque[Dict]] = defaultdict(deque)
+        self._lock = threading.Lock()
+        self._file: IO[str] | None = None
+
+    def load(self) -> "Cassette":
+        for interaction in self.interactions():
+            key = _key(interaction["method"], interaction["url"])
+            self._index[key].append(interaction)
+        return self
+
+    def interactions(self) -> Iterator[Dict]:
+        """
+        Recorded interactions in order of recording, e.g. to replay
+        captured traffic for profiling.
+        """
+        with _open(self.path, "r") as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self._index.values())
+
+    def find(self, method: str, url: str) -> Dict:
+        key = _key(method, url)
+        with self._lock:
+            responses = self._index.get(key)
+            if not responses:
+                raise CassetteError(f"Request {method} {url} not recorded")
+            if len(responses) > 1:
+                return responses.popleft()
+            return responses[0]
+
+    def record(self, response: requests.Response) -> None:
+        request = response.request
+        interaction: Dict = {
+            "method": request.method,
+            "url": request.url,
+            "status": response.status_code,
+            "headers": {
+                name: response.headers[name]
+                for name in RECORDED_HEADERS
+                if name in response.headers
+            },
+        }
+        if request.body and "json" in request.headers.get("Content-Type", ""):
+            body = request.body
+            interaction["request_body"] = _redact_body(
+                body.decode() if isinstance(body, bytes) else body,
+                REQUEST_SECRETS,
+            )
+        try:
+            interaction["body"] = _redact_body(
+                response.content.decode(), RESPONSE_SECRETS
+            )
+        except UnicodeDecodeError:
+            interaction["body_b64"] = base64.b64encode(
+                response.content
+            ).decode()
+        line = json.dumps(interaction, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = _open(self.path, "w")
+            self._file.write(line)
+            self._file.flush()
+            self._index[_key(interaction["method"], interaction["url"])].append(
+                interaction
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class RecordingAdapter(HTTPAdapter):
+    """
+    Adapter sending requests to network and recording them in `cassette`.
+    """
+
+    def __init__(self, cassette: Cassette, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request, *args, **kwargs) -> requests.Response:
+        response = super().send(request, *args, **kwargs)
+        self.cassette.record(response)
+        return response
+
+    def close(self) -> None:
+        super().close()
+        self.cassette.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Adapter answering requests from `cassette`, without network.
+    """
+
+    def __init__(self, cassette: Cassette) -> None:
+        super().__init__()
+        self.cassette = cassette
+
+    def send(  # pylint: disable=too-many-positional-arguments
+        self,
+        request,
+        stream=False,
+        timeout=None,
+        verify=True,
+        cert=None,
+        proxies=None,
+    ) -> requests.Response:
+        interaction = self.cassette.find(request.method, request.url)
+        response = requests.Response()
+        response.status_code = interaction["status"]
+        response.headers = CaseInsensitiveDict(interaction["headers"])
+        if "body_b64" in interaction:
+            content = base64.b64decode(interaction["body_b64"])
+        else:
+            content = interaction["body"].encode()
+        response._content = content  # pylint: disable=protected-access
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None: ...
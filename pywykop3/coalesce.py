@@ -0,0 +1,93 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+def request_key(
+    method: str, endpoint: str, params: Dict | None, identity: str
+) -> Hashable:
+    """
+    Key of request: identical requests of the same identity share it.
+    """
+    params = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return method, endpoint.strip("/"), params, identity
+
+
+@dataclass
+class SingleFlightStats:
+    """
+    - sent - calls which were executed
+    - shared - calls which waited for result of identical call in flight
+    """
+
+    sent: int = 0
+    shared: int = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls: the first caller of a key runs
+    the function, callers arriving while it is in flight wait for it and
+    get the same result or exception. Key is released when call finishes,
+    so later calls are executed again.
+    """
+
+    def __init__(self) -> None:
+        self.stats = SingleFlightStats()
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                self.stats.sent += 1
+            else:
+                self.stats.shared += 1
+        if not leader:
+            return future.result()  # type: ignore
+        try:
+            result = function()
+        except BaseException as exc:
+            future.set_exception(exc)  # type: ignore
+            raise
+        else:
+            future.set_result(result)  # type: ignore
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio version of :class:`SingleFlight`. Call runs in its own task,
+    so cancelled waiter, including the first one, does not cancel it for
+    the others.
+    """
+
+    def __init__(self) -> None:
+        self.stats = SingleFlightStats()
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(
+        self, key: Hashable, function: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(function())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+            self.stats.sent += 1
+        else:
+            self.stats.shared += 1
+        return await asyncio.shield(task)
@@ -1,11 +1,67 @@
+import functools
+import hashlib
 import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Tuple,
+)
 
 import requests
 from requests.compat import urljoin
 
+from .cache import ResponseCache
+from .coalesce import SingleFlight, request_key
+from .decoders import Decoder, get_decoder
+from .metrics import Metrics
+from .multipart import MultipartBody
+from .ratelimit import RateLimiter
+from .transport import TransportConfig, build_session
+from .utils import token_expiry
+
+logger = logging.getLogger(__name__)
+
+# Token is treated as expired that many seconds before its `exp` claim
+TOKEN_EXPIRY_MARGIN = 60
+
+# Maximal number of characters of request and response bodies in logs
+LOG_PREVIEW_LENGTH = 300
+
+
+class LogPreview:
+    """
+    Truncated representation of body for DEBUG logs. Formatting happens
+    only when the record is emitted, and only the beginning of bytes
+    is decoded.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: bytes | Dict | None) -> None:
+        self.value = value
+
+    def __str__(self) -> str:
+        if isinstance(self.value, bytes):
+            size = len(self.value)
+            text = self.value[: LOG_PREVIEW_LENGTH + 1].decode(errors="replace")
+        else:
+            text = str(self.value)
+            size = len(text)
+        if len(text) <= LOG_PREVIEW_LENGTH:
+            return text
+        return f"{text[:LOG_PREVIEW_LENGTH]}... ({size} total)"
+
 
 class WykopConnectorException(Exception): ...
 
@@ -24,17 +80,294 @@ class WykopResponse:
     error: Dict
     pagination: Dict
     next: str | int | None = None
+    page: str | int | None = None
+
+
+class PageIterator:
+    """
+    Lazy iterator over items of paginated endpoint. Items are yielded as
+    soon as their page arrives, previous pages are not kept.
 
+    Pagination cursor is exposed with `cursor` attribute. It is the page
+    of currently yielded item, and changes to the next page once the whole
+    page is consumed, so passing it as `page` resumes iteration without
+    losing items (items of partially consumed page are yielded again).
+    `finished` is set when there are no more pages to fetch,
+    `fetched_pages` counts received pages.
 
-class WykopConnector:
+    Args:
+        pages (Iterator[WykopResponse]): Responses of consecutive pages,
+            see :meth:`WykopConnector.iter_pages`.
+        page (int | str | None, optional): First page. Defaults to None.
+        check (Callable[[WykopResponse], None] | None, optional): Called for
+            every response before its items are yielded, e.g. to raise
+            an exception. Defaults to None.
+        transform (Callable[[Dict], Any] | None, optional): Applied to
+            every yielded item. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        pages: Iterator[WykopResponse],
+        page: int | str | None = None,
+        check: Callable[[WykopResponse], None] | None = None,
+        transform: Callable[[Dict], Any] | None = None,
+    ) -> None:
+        self._pages = pages
+        self._check = check
+        self._transform = transform
+        self.cursor = page
+        self.finished = False
+        self.fetched_pages = 0
+
+    def pages(self) -> Iterator[WykopResponse]:
+        """
+        Yield whole pages instead of single items. Cursor is moved to the
+        next page when the following page is requested.
+        """
+        for res in self._pages:
+            if self._check:
+                self._check(res)
+            self.cursor = res.page
+            self.fetched_pages += 1
+            yield res
+            self.cursor = res.next
+        self.finished = True
+
+    def __iter__(self) -> Iterator[Any]:
+        for res in self.pages():
+            if self._transform:
+                yield from map(self._transform, res.data)  # type: ignore
+            else:
+                yield from res.data  # type: ignore
+
+    def close(self) -> None:
+        """
+        Stop iteration and cancel pages in flight.
+        """
+        self._pages.close()  # type: ignore
+
+
+class BaseWykopConnector:  # pylint: disable=too-many-instance-attributes
+    """
+    Transport independent part of connector: credentials, url building
+    and response parsing. Shared by :class:`WykopConnector` and
+    :class:`pywykop3.aio.AsyncWykopConnector`.
+    """
 
     URL = "https://wykop.pl/api/v3/"
+    AUTH_HEADER = {
+        "accept": "application/json",
+        "Content-Type": "application/json",
+    }
 
     def __init__(
         self,
         key: str | None = None,
         secret: str | None = None,
         refresh_token: str | None = None,
+        url: str | None = None,
+        prefetch_pages: int = 1,
+        token: str | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        decoder: Decoder | None = None,
+        metrics: Metrics | None = None,
+        coalesce: bool = False,
+    ) -> None:
+        if url:
+            self.URL = url  # pylint: disable=invalid-name
+        self.prefetch_pages = prefetch_pages
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.decoder = decoder or get_decoder()
+        self.metrics = metrics
+        self.coalesce = coalesce
+        # Cached responses are shared only between connectors of the same
+        # application key or user session
+        self._cache_identity = hashlib.sha1(
+            str(key or refresh_token or token).encode()
+        ).hexdigest()
+        self._key = key
+        self._secret = secret
+        self.refresh_token = refresh_token
+        self._token: str | None = None
+        self._token_expires_at: float | None = None
+        self.header = {"accept": "application/json"}
+        if token:
+            self._set_token({"data": {"token": token}})
+
+    @property
+    def token(self) -> str | None:
+        """
+        Current bearer token. Can be stored and passed as `token` to new
+        connector to skip authentication while it is still valid.
+        """
+        return self._token
+
+    def _token_valid(self) -> bool:
+        if self._token is None:
+            return False
+        if self._token_expires_at is None:
+            return True
+        return self._token_expires_at - TOKEN_EXPIRY_MARGIN > time.time()
+
+    def _token_request(self) -> Tuple[str, Dict]:
+        """
+        Url and payload of request used to obtain new token.
+        """
+        if self._key and self._secret:
+            # Auth
+            url = urljoin(self.URL, "auth")
+            data = {"key": self._key, "secret": self._secret}
+        elif self.refresh_token:
+            # Refresh token
+            url = urljoin(self.URL, "refresh-token")
+            data = {"refresh_token": self.refresh_token}
+
+        else:
+            raise WykopConnectorException(
+                "You need to provide key and secret OR refresh_token"
+            )
+        return url, {"data": data}
+
+    def _set_token(self, res: Dict) -> str:
+        if "refresh_token" in res["data"]:
+            self.refresh_token = res["data"]["refresh_token"]
+        self._token = res["data"]["token"]
+        self._token_expires_at = token_expiry(self._token)  # type: ignore
+        # New dict, so requests sent with previous token can detect change
+        self.header = {**self.header, "Authorization": f"Bearer {self._token}"}
+        return self._token  # type: ignore
+
+    def _can_refresh_token(self) -> bool:
+        return bool(self._key and self._secret or self.refresh_token)
+
+    def _build_url(self, endpoint: str) -> str:
+        # Remove trailing slash if necessary
+        endpoint = endpoint.lstrip("/")
+        return urljoin(self.URL, endpoint)
+
+    @staticmethod
+    def _make_response(code: int, res_json: Dict | None) -> WykopResponse:
+        res_data = res_json.get("data", []) if res_json else []
+        res_error = res_json.get("error", {}) if res_json else {}
+        res_pagination = res_json.get("pagination", {}) if res_json else {}
+        return WykopResponse(code, res_data, res_error, res_pagination)
+
+    def _cached(
+        self, method: Methods, endpoint: str, params: Dict | None
+    ) -> WykopResponse | None:
+        """
+        Response served from cache, or None if request has to be sent.
+        """
+        if self.cache is None:
+            return None
+        cached = self.cache.get(
+            Methods(method).value, endpoint, params, self._cache_identity
+        )
+        if cached is None:
+            return None
+        code, body = cached
+        logger.debug("Cache hit %s %s", method, endpoint)
+        return self._parse(code, body)
+
+    def _flight_key(
+        self, method: Methods, endpoint: str, params: Dict | None, files: Any
+    ) -> Hashable | None:
+        """
+        Key under which request is coalesced with identical requests in
+        flight, None if it has to be sent on its own. Only GET requests
+        are coalesced.
+        """
+        if not self.coalesce or files or Methods(method) != Methods.GET:
+            return None
+        return request_key(
+            Methods.GET.value, endpoint, params, self._cache_identity
+        )
+
+    def _retried(self, endpoint: str) -> None:
+        if self.metrics is not None:
+            self.metrics.retried(endpoint)
+
+    @staticmethod
+    def _log_request(
+        method: Methods, url: str, params: Dict | None, data: Dict | None
+    ) -> None:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Executing %s %s, params: %s, data: %s",
+                Methods(method).value,
+                url,
+                params,
+                LogPreview(data),
+                extra={"method": Methods(method).value, "url": url},
+            )
+
+    def _parse(self, code: int, body: bytes) -> WykopResponse:
+        """
+        Decode raw body once, without building intermediate str.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Response %s, %s bytes: %s",
+                code,
+                len(body),
+                LogPreview(body),
+                extra={"status": code},
+            )
+        return self._make_response(code, self.decoder(body) if body else None)
+
+    @staticmethod
+    def _next_page(
+        res: WykopResponse, page: int | str | None
+    ) -> int | str | None:
+        """
+        Page which should be requested after `res`, or None if there is
+        no more pages.
+        """
+        # Break if there is no more data
+        if not res.data:
+            return None
+        # Break if wrong status code
+        if 200 > res.code or res.code > 299:
+            return None
+        # Get next page
+        if res.pagination.get("next"):
+            return res.pagination["next"]
+        if page is None:
+            # If page is none, and user is not logged in
+            return 2
+        if isinstance(page, int):
+            return page + 1
+        return None
+
+    @staticmethod
+    def _can_prefetch(res: WykopResponse, next_page: int | str | None) -> bool:
+        """
+        Only numeric pagination (anonymous sessions) can be fetched ahead.
+        Hash cursors are known only after previous page is fetched.
+        """
+        return isinstance(next_page, int) and not res.pagination.get("next")
+
+
+class WykopConnector(BaseWykopConnector):
+
+    def __init__(
+        self,
+        key: str | None = None,
+        secret: str | None = None,
+        refresh_token: str | None = None,
+        url: str | None = None,
+        session: requests.Session | None = None,
+        transport: TransportConfig | None = None,
+        prefetch_pages: int = 1,
+        token: str | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        decoder: Decoder | None = None,
+        metrics: Metrics | None = None,
+        coalesce: bool = False,
     ) -> None:
         """
         Wykop Connector constructor.
@@ -44,64 +377,117 @@ class WykopConnector:
         and login to your Wykop account.
         Refresh token will be shown in url in 'rtoken' variable.
 
+        Constructor does not execute any request. Token is obtained
+        with the first request.
+
         Args:
             key (str | None, optional): Key. Defaults to None.
             secret (str | None, optional): Secret. Defaults to None.
             refresh_token (str | None, optional): Refresh token.
             Defaults to None.
+            url (str | None, optional): Base url of API. Defaults to None.
+            session (requests.Session | None, optional): Session used for
+            all requests. If not provided, pooled session is created
+            from `transport`. Defaults to None.
+            transport (TransportConfig | None, optional): Configuration of
+            connection pool and adapter retries. Defaults to None.
+            prefetch_pages (int, optional): Number of numeric pages fetched
+            concurrently by :meth:`request_with_pagination`. Should not be
+            greater than `transport.pool_maxsize`. Defaults to 1.
+            token (str | None, optional): Previously obtained token
+            (see :attr:`token`). It is used until it expires.
+            Defaults to None.
+            rate_limiter (RateLimiter | None, optional): Client side rate
+            limiter. When set, requests wait for their budget and 429
+            responses are retried after `Retry-After`. Defaults to None.
+            cache (ResponseCache | None, optional): Cache of read-only
+            endpoints. Defaults to None.
+            decoder (Decoder | None, optional): Callable parsing raw
+            response body. Defaults to the fastest installed decoder,
+            see :func:`pywykop3.decoders.get_decoder`.
+            metrics (Metrics | None, optional): Collects per endpoint
+            metrics and calls request hooks. Defaults to None.
+            coalesce (bool, optional): Share single response between
+            identical GET requests sent concurrently from many threads.
+            Defaults to False.
         """
-        self._key = key
-        self._secret = secret
-        self.refresh_token = refresh_token
-        self._token: str | None = self._get_token()
-        self.header = {
-            "accept": "application/json",
-            "Authorization": f"Bearer {self._token}",
-        }
-        self.connect()
+        super().__init__(
+            key,
+            secret,
+            refresh_token,
+            url,
+            prefetch_pages=prefetch_pages,
+            token=token,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            decoder=decoder,
+            metrics=metrics,
+            coalesce=coalesce,
+        )
+        self.session = session or build_session(transport)
+        self._token_lock = threading.Lock()
+        self.single_flight = SingleFlight()
 
     def _get_new_refresh_token(self):
-        header = {
-            "accept": "application/json",
-            "Content-Type": "application/json",
-        }
         url = urljoin(self.URL, "refresh-token")
         data = {"refresh_token": self.refresh_token}
-        res = requests.post(url, json={"data": data}, headers=header, timeout=15)
+        res = self.session.post(
+            url, json={"data": data}, headers=self.AUTH_HEADER, timeout=15
+        )
         self.refresh_token = res.json()["data"]["refresh-token"]
 
     # pylint disable=method-cache-max-size-none
     def _get_token(self) -> str:
-        header = {
-            "accept": "application/json",
-            "Content-Type": "application/json",
-        }
-        if self._key and self._secret:
-            # Auth
-            url = urljoin(self.URL, "auth")
-            data = {"key": self._key, "secret": self._secret}
-        elif self.refresh_token:
-            # Refresh token
-            url = urljoin(self.URL, "refresh-token")
-            data = {"refresh_token": self.refresh_token}
+        url, payload = self._token_request()
+        res = self.session.post(
+            url, json=payload, headers=self.AUTH_HEADER, timeout=15
+        ).json()
+        return self._set_token(res)
 
-        else:
-            raise WykopConnectorException(
-                "You need to provide key and secret OR refresh_token"
-            )
+    def _ensure_token(self) -> None:
+        if self._token_valid():
+            return
+        with self._token_lock:
+            # Token could be obtained by other thread in the meantime
+            if not self._token_valid():
+                self._get_token()
 
-        res = requests.post(url, json={"data": data}, headers=header, timeout=15).json()
+    def _refresh_token(self, header: Dict) -> bool:
+        """
+        Obtain new token after request sent with `header` was rejected with
+        401. When many threads get 401 at once, only one of them refreshes
+        the token, others wait for it and reuse new token.
 
-        if "refresh_token" in res["data"]:
-            self.refresh_token = res["data"]["refresh_token"]
-        return res["data"]["token"]
+        Returns:
+            bool: True if request should be replayed with new token.
+        """
+        if not self._can_refresh_token():
+            return False
+        with self._token_lock:
+            if self.header is header:
+                logger.info("Token expired, obtaining new one")
+                self._get_token()
+        return True
 
     def connect(self) -> str:
-        res = requests.get(
-            "https://wykop.pl/api/v3/connect", headers=self.header, timeout=15
+        self._ensure_token()
+        res = self.session.get(
+            urljoin(self.URL, "connect"), headers=self.header, timeout=15
         )
         return res.json()["data"]["connect_url"]
 
+    def close(self) -> None:
+        """
+        Close pooled connections.
+        """
+        self.session.close()
+
+    def __enter__(self) -> "WykopConnector":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
     def request(
         self,
         method: Methods,
@@ -111,32 +497,117 @@ class WykopConnector:
         timeout: int = 10,
         files: Dict | None = None,
     ) -> WykopResponse:
-        # Remove trailing slash if necessary
-        endpoint = endpoint.lstrip("/")
-        url = urljoin(self.URL, endpoint)
-        logging.info(
-            "Executing %s - %s, params: %s, data: %s",
-            method,
-            url,
-            str(params),
-            str(data),
+        cached = self._cached(method, endpoint, params)
+        if cached is not None:
+            return cached
+        key = self._flight_key(method, endpoint, params, files)
+        send = functools.partial(
+            self._fetch, method, endpoint, data, params, timeout, files
         )
-        res = requests.request(
+        if key is None:
+            code, body = send()
+        else:
+            code, body = self.single_flight.do(key, send)
+        return self._parse(code, body)
+
+    def _fetch(  # pylint: disable=too-many-arguments
+        self,
+        method: Methods,
+        endpoint: str,
+        data: Dict | None,
+        params: Dict | None,
+        timeout: int,
+        files: Dict | None,
+    ) -> Tuple[int, bytes]:
+        """
+        Send request, returns status code and raw body.
+        """
+        url = self._build_url(endpoint)
+        self._log_request(method, url, params, data)
+        body = MultipartBody(files) if files else None
+        send = functools.partial(
+            self.session.request,
             method=method,
             url=url,
             json={"data": data} if data else None,
             params=params,
-            headers=self.header,
             timeout=timeout,
-            files=files,
+            data=body,
         )
-        logging.info("res.text='%s'", res.text)
-        res_json = res.json() if res.text else None
-        res_data = res_json.get("data", []) if res_json else []
-        res_error = res_json.get("error", {}) if res_json else {}
-        res_pagination = res_json.get("pagination", {}) if res_json else {}
+        if body is not None:
+            send = self._with_body(send, body)
+        info = None
+        if self.metrics is not None:
+            info = self.metrics.before_request(Methods(method).value, endpoint)
+        try:
+            res = self._send(endpoint, send)
+        finally:
+            if body is not None:
+                body.close()
+        if info is not None:
+            self.metrics.after_response(  # type: ignore
+                info,
+                res.status_code,
+                len(res.request.body or b""),
+                len(res.content),
+            )
+        if self.cache is not None:
+            self.cache.store(
+                Methods(method).value,
+                endpoint,
+                params,
+                self._cache_identity,
+                res.status_code,
+                res.content,
+            )
+        return res.status_code, res.content
+
+    @staticmethod
+    def _with_body(
+        send: Callable[..., requests.Response], body: MultipartBody
+    ) -> Callable[..., requests.Response]:
+        """
+        Wrap `send` to stream multipart `body` from its start on every
+        call, including replays.
+        """
+
+        def send_body(headers: Dict) -> requests.Response:
+            body.seek(0)
+            return send(headers={**headers, "Content-Type": body.content_type})
 
-        return WykopResponse(res.status_code, res_data, res_error, res_pagination)
+        return send_body
+
+    def _send(
+        self, endpoint: str, send: Callable[..., requests.Response]
+    ) -> requests.Response:
+        """
+        Send request with current token. Handles token expiration and,
+        if rate limiter is set, budget and 429 retries.
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire(endpoint)
+            self._ensure_token()
+            header = self.header
+            res = send(headers=header)
+            if res.status_code == 401 and self._refresh_token(header):
+                # Replay request with new token, within budget as well
+                self._retried(endpoint)
+                if self.rate_limiter:
+                    self.rate_limiter.acquire(endpoint)
+                res = send(headers=self.header)
+            if not self.rate_limiter:
+                return res
+            if res.status_code != 429:
+                self.rate_limiter.succeeded(endpoint)
+                return res
+            retry_after = res.headers.get("Retry-After")
+            if not self.rate_limiter.throttled(endpoint, retry_after, attempt):
+                return res
+            logger.warning("Too many requests to %s, retrying", endpoint)
+            self._retried(endpoint)
+            attempt += 1
 
     def request_with_pagination(
         self,
@@ -147,35 +618,149 @@ class WykopConnector:
         params: Dict | None = None,
         timeout: int = 10,
         page_count: int = 1,
+        prefetch: int | None = None,
     ) -> WykopResponse:
-        params = params or {}
+        """
+        Execute request for `page_count` pages (-1 for all pages) and merge
+        their data. Iteration stops on first empty page or wrong status code.
+
+        Args:
+            prefetch (int | None, optional): Number of numeric pages kept in
+                flight at once. Defaults to `self.prefetch_pages`.
+
+        Returns:
+            WykopResponse: Last response with data of all pages.
+                `next` is the page to request to continue.
+        """
         last_response: WykopResponse = None  # type: ignore
         all_data: List[Dict] = []
-        while page_count > 0:
-            page_count -= 1
-            if page:
-                params["page"] = page
-            res = self.request(method, endpoint, data, params, timeout)
-            print(f"{res.pagination=}")
+        for res in self.iter_pages(
+            method, endpoint, page, data, params, timeout, page_count, prefetch
+        ):
             last_response = res
             all_data += res.data  # type: ignore
-
-            # Break if there is no more data
-            if not res.data:
-                break
-            # Break if wrong status code
-            if 200 > res.code or res.code > 299:
-                break
-            # Get next page
-            if res.pagination.get("next"):
-                page = res.pagination["next"]
-            elif page is None:
-                # If page is none, and user is not logged in
-                page = 2
-            elif isinstance(page, int):
-                page += 1
-            else:
-                break
         last_response.data = all_data
-        last_response.next = page
         return last_response
+
+    def iter_pages(
+        self,
+        method: Methods,
+        endpoint: str,
+        page: int | str | None = None,
+        data: Dict | None = None,
+        params: Dict | None = None,
+        timeout: int = 10,
+        page_count: int = 1,
+        prefetch: int | None = None,
+    ) -> Iterator[WykopResponse]:
+        """
+        Lazily execute request for `page_count` pages (-1 for all pages)
+        and yield response of each page. Only pages in flight are kept in
+        memory. Iteration stops on first empty page or wrong status code.
+
+        Args:
+            prefetch (int | None, optional): Number of numeric pages kept in
+                flight at once. Defaults to `self.prefetch_pages`.
+
+        Yields:
+            WykopResponse: Response of page. `page` is the requested page,
+                `next` is the page to request to continue.
+        """
+        pages = self._iter_pages(
+            method, endpoint, page, data, params, timeout, page_count, prefetch
+        )
+        if self.metrics is None:
+            return pages
+        return self.metrics.track_pages(endpoint, pages)
+
+    def _iter_pages(
+        self,
+        method: Methods,
+        endpoint: str,
+        page: int | str | None,
+        data: Dict | None,
+        params: Dict | None,
+        timeout: int,
+        page_count: int,
+        prefetch: int | None,
+    ) -> Iterator[WykopResponse]:
+        prefetch = prefetch or self.prefetch_pages
+        params = dict(params or {})
+        while page_count != 0:
+            page_count -= 1
+            if page:
+                params["page"] = page
+            res = self.request(method, endpoint, data, dict(params), timeout)
+            next_page = self._next_page(res, page)
+            res.page = page
+            res.next = page if next_page is None else next_page
+            yield res
+            if next_page is None:
+                return
+            page = next_page
+            if prefetch > 1 and self._can_prefetch(res, next_page):
+                yield from self._prefetch_pages(
+                    method,
+                    endpoint,
+                    page,  # type: ignore
+                    data,
+                    params,
+                    timeout,
+                    page_count,
+                    prefetch,
+                )
+                return
+
+    def _prefetch_pages(  # pylint: disable=too-many-locals
+        self,
+        method: Methods,
+        endpoint: str,
+        page: int,
+        data: Dict | None,
+        params: Dict,
+        timeout: int,
+        page_count: int,
+        prefetch: int,
+    ) -> Iterator[WykopResponse]:
+        """
+        Fetch numeric pages starting from `page` with `prefetch` requests in
+        flight. Responses are yielded in page order. Pages submitted after
+        the last one are cancelled or discarded.
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=prefetch, thread_name_prefix="wykop-prefetch"
+        )
+        in_flight: Deque[Tuple[int, Future]] = deque()
+        to_submit = page
+
+        def submit() -> None:
+            nonlocal to_submit, page_count
+            if page_count == 0:
+                return
+            page_count -= 1
+            page_params = {**params, "page": to_submit}
+            future = executor.submit(
+                self.request, method, endpoint, data, page_params, timeout
+            )
+            in_flight.append((to_submit, future))
+            to_submit += 1
+
+        try:
+            for _ in range(prefetch):
+                submit()
+            while in_flight:
+                current_page, future = in_flight.popleft()
+                res = future.result()
+                next_page = self._next_page(res, current_page)
+                res.page = current_page
+                if next_page is None:
+                    res.next = current_page
+                    yield res
+                    return
+                res.next = current_page + 1
+                yield res
+                submit()
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,417 @@
+import argparse
+import gzip
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from .api import WykopAPI
+from .connector import WykopConnector, WykopResponse
+
+logger = logging.getLogger(__name__)
+
+# Number of pages written between checkpoints
+CHECKPOINT_PAGES = 10
+
+
+@dataclass(frozen=True)
+class CrawlTask:
+    """
+    Tag stream to crawl, optionally limited to a month.
+    """
+
+    tag: str
+    year: int | None = None
+    month: int | None = None
+
+    @property
+    def name(self) -> str:
+        if self.year is None:
+            return self.tag
+        if self.month is None:
+            return f"{self.tag}-{self.year}"
+        return f"{self.tag}-{self.year}-{self.month:02d}"
+
+
+@dataclass
+class Checkpoint:
+    """
+    Progress of a task, stored next to its output.
+
+    - page - page to request next, None for the first one
+    - size - size of output file, in bytes, when checkpoint was written
+    - items, pages - numbers of written items and pages
+    - elapsed - crawling time, in seconds
+    - finished - last page was written
+    """
+
+    page: int | str | None = None
+    size: int = 0
+    items: int = 0
+    pages: int = 0
+    elapsed: float = 0.0
+    finished: bool = False
+
+
+@dataclass
+class CrawlResult:
+    """
+    Result of a task crawled by worker process `pid`. `items` and
+    `elapsed` cover only this run, not runs resumed from. `error` is the
+    exception which stopped the task, pid and counters of failed task are
+    0 as its worker did not report them.
+    """
+
+    task: CrawlTask
+    pid: int
+    items: int
+    pages: int
+    elapsed: float
+    finished: bool
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass
+class CrawlReport:
+    """
+    Results of all tasks, `elapsed` is wall time of the crawl.
+    """
+
+    results: List[CrawlResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def items(self) -> int:
+        return sum(result.items for result in self.results)
+
+    @property
+    def failed(self) -> List[CrawlResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.elapsed if self.elapsed else 0.0
+
+    def per_worker(self) -> Dict[int, float]:
+        """
+        Items per second of every worker process.
+        """
+        totals: Dict[int, List[float]] = {}
+        for result in self.results:
+            if not result.ok:
+                continue
+            items, elapsed = totals.setdefault(result.pid, [0, 0.0])
+            totals[result.pid] = [
+                items + result.items,
+                elapsed + result.elapsed,
+            ]
+        return {
+            pid: items / elapsed if elapsed else 0.0
+            for pid, (items, elapsed) in totals.items()
+        }
+
+
+def month_range(start: str, end: str) -> List[Tuple[int, int]]:
+    """
+    (year, month) pairs from `start` to `end` inclusive, both as YYYY-MM.
+    """
+    year, month = map(int, start.split("-"))
+    end_year, end_month = map(int, end.split("-"))
+    months = []
+    while (year, month) <= (end_year, end_month):
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def make_tasks(
+    tags: Iterable[str], start: str | None = None, end: str | None = None
+) -> List[CrawlTask]:
+    """
+    Tasks crawling `tags`, split by months from `start` to `end` (YYYY-MM)
+    when given.
+    """
+    if start is None:
+        return [CrawlTask(tag) for tag in tags]
+    months = month_range(start, end or time.strftime("%Y-%m"))
+    return [
+        CrawlTask(tag, year, month) for tag in tags for year, month in months
+    ]
+
+
+def output_path(out_dir: str | Path, task: CrawlTask) -> Path:
+    return Path(out_dir) / f"{task.name}.jsonl.gz"
+
+
+def checkpoint_path(out_dir: str | Path, task: CrawlTask) -> Path:
+    return Path(out_dir) / f"{task.name}.checkpoint.json"
+
+
+def load_checkpoint(out_dir: str | Path, task: CrawlTask) -> Checkpoint:
+    path = checkpoint_path(out_dir, task)
+    if not path.exists():
+        return Checkpoint()
+    return Checkpoint(**json.loads(path.read_text(encoding="utf-8")))
+
+
+def _save_checkpoint(
+    out_dir: str | Path, task: CrawlTask, checkpoint: Checkpoint
+) -> None:
+    path = checkpoint_path(out_dir, task)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(asdict(checkpoint)), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _is_last(res: WykopResponse) -> bool:
+    return not res.data or res.next == res.page
+
+
+def crawl_task(  # pylint: disable=too-many-arguments,too-many-locals
+    task: CrawlTask,
+    out_dir: str | Path,
+    connector_kwargs: Dict[str, Any],
+    sort: str = "all",
+    type_of_content: str = "all",
+    checkpoint_pages: int = CHECKPOINT_PAGES,
+    max_pages: int = -1,
+) -> CrawlResult:
+    """
+    Crawl tag stream of `task` to gzipped JSONL file, resuming from its
+    checkpoint. Runs in worker process with its own :class:`WykopAPI`.
+
+    Every checkpoint closes gzip member of output file and stores its
+    size. Output is truncated to that size on resume, so items written
+    after the last checkpoint are not duplicated.
+
+    Args:
+        task (CrawlTask): Crawled tag and month.
+        out_dir (str | Path): Directory of output and checkpoint files.
+        connector_kwargs (Dict[str, Any]): Arguments of
+            :class:`WykopConnector` of worker, e.g. key and secret.
+        sort (str, optional): Sort of stream. Defaults to "all".
+        type_of_content (str, optional): "all", "entry" or "link".
+            Defaults to "all".
+        checkpoint_pages (int, optional): Pages between checkpoints.
+            Defaults to :data:`CHECKPOINT_PAGES`.
+        max_pages (int, optional): Limit of pages crawled in this call,
+            -1 for no limit. Defaults to -1.
+    """
+    checkpoint = load_checkpoint(out_dir, task)
+    result = CrawlResult(task, os.getpid(), 0, 0, 0.0, checkpoint.finished)
+    if checkpoint.finished:
+        return result
+    path = output_path(out_dir, task)
+    with open(path, "ab") as raw:
+        raw.truncate(checkpoint.size)
+    api = WykopAPI(connector=WykopConnector(**connector_kwargs))
+    started = time.monotonic()
+    stream = api.iter_tag_stream(
+        task.tag,
+        page=checkpoint.page,
+        sort=sort,
+        type_of_content=type_of_content,
+        year=task.year,
+        month=task.month,
+        page_count=max_pages,
+    )
+    # Gzip member of pages written since the last checkpoint
+    output: gzip.GzipFile | None = None
+
+    def save() -> None:
+        nonlocal output
+        if output is not None:
+            output.close()
+            output = None
+        elapsed = time.monotonic() - started
+        checkpoint.size = path.stat().st_size
+        checkpoint.elapsed += elapsed - result.elapsed
+        result.elapsed = elapsed
+        _save_checkpoint(out_dir, task, checkpoint)
+        logger.info(
+            "%s: %s items, %.1f items/s",
+            task.name,
+            checkpoint.items,
+            result.items_per_second,
+        )
+
+    unsaved = 0
+    try:
+        for res in stream.pages():
+            if output is None:
+                # pylint: disable-next=consider-using-with
+                output = gzip.GzipFile(path, "ab")
+            output.write(
+                b"".join(
+                    json.dumps(item, ensure_ascii=False).encode() + b"\n"
+                    for item in res.data  # type: ignore
+                )
+            )
+            checkpoint.page = res.next
+            checkpoint.items += len(res.data)
+            checkpoint.pages += 1
+            checkpoint.finished = _is_last(res)
+            result.items += len(res.data)
+            result.pages += 1
+            unsaved += 1
+            if checkpoint.finished or unsaved == checkpoint_pages:
+                save()
+                unsaved = 0
+        if unsaved:
+            save()
+    finally:
+        if output is not None:
+            # Unsaved pages are dropped on resume
+            output.close()
+        stream.close()
+        api.connector.close()
+    result.finished = checkpoint.finished
+    return result
+
+
+class Crawler:
+    """
+    Crawls tag streams in a pool of processes. Tasks are sharded across
+    `processes` workers, each with its own :class:`WykopAPI`. Every task
+    is written to `<out_dir>/<task>.jsonl.gz` with a checkpoint file, so
+    a killed crawl resumes where it stopped when run again.
+
+    Args:
+        tasks (Sequence[CrawlTask]): Crawled tags, see :func:`make_tasks`.
+        out_dir (str | Path): Output directory, created when missing.
+        connector_kwargs (Dict[str, Any]): Arguments of
+            :class:`WykopConnector` of every worker.
+        processes (int, optional): Number of worker processes.
+            Defaults to 4.
+        **kwargs: Passed to :func:`crawl_task`.
+    """
+
+    def __init__(
+        self,
+        tasks: Sequence[CrawlTask],
+        out_dir: str | Path,
+        connector_kwargs: Dict[str, Any],
+        processes: int = 4,
+        **kwargs,
+    ) -> None:
+        self.tasks = list(tasks)
+        self.out_dir = Path(out_dir)
+        self.connector_kwargs = connector_kwargs
+        self.processes = processes
+        self.kwargs = kwargs
+
+    def run(self) -> CrawlReport:
+        """
+        Crawl all tasks. Failed task does not stop the others, its
+        exception is logged and kept in :attr:`CrawlResult.error`; it is
+        resumed from its last checkpoint when run again.
+        """
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        report = CrawlReport()
+        started = time.monotonic()
+        with ProcessPoolExecutor(self.processes) as executor:
+            futures = {
+                executor.submit(
+                    crawl_task,
+                    task,
+                    self.out_dir,
+                    self.connector_kwargs,
+                    **self.kwargs,
+                ): task
+                for task in self.tasks
+            }
+            for future in as_completed(futures):
+                task = futures[future]
+                try:
+                    result = future.result()
+                # pylint: disable-next=broad-exception-caught
+                except Exception as exc:
+                    logger.error("%s failed: %r", task.name, exc)
+                    result = CrawlResult(task, 0, 0, 0, 0.0, False, exc)
+                else:
+                    logger.info(
+                        "%s done by %s: %s items, %.1f items/s",
+                        task.name,
+                        result.pid,
+                        result.items,
+                        result.items_per_second,
+                    )
+                report.results.append(result)
+        report.elapsed = time.monotonic() - started
+        for pid, rate in report.per_worker().items():
+            logger.info("Worker %s: %.1f items/s", pid, rate)
+        logger.info(
+            "Crawled %s items, %.1f items/s, %s tasks failed",
+            report.items,
+            report.items_per_second,
+            len(report.failed),
+        )
+        return report
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m pywykop3",
+        description="Crawl Wykop tag streams to gzipped JSONL files.",
+    )
+    parser.add_argument("tags", nargs="+", help="Crawled tags")
+    parser.add_argument("--out", default="crawl", help="Output directory")
+    parser.add_argument("--from", dest="start", help="First month, YYYY-MM")
+    parser.add_argument("--to", dest="end", help="Last month, YYYY-MM")
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument(
+        "--checkpoint-pages", type=int, default=CHECKPOINT_PAGES
+    )
+    parser.add_argument("--type", dest="type_of_content", default="all")
+    parser.add_argument("--key", default=os.environ.get("WYKOP_KEY"))
+    parser.add_argument("--secret", default=os.environ.get("WYKOP_SECRET"))
+    parser.add_argument(
+        "--refresh-token", default=os.environ.get("WYKOP_REFRESH_TOKEN")
+    )
+    parser.add_argument("--url", help="Base url of API")
+    return parser.parse_args(argv)
+
+
+def run(argv: Sequence[str] | None = None) -> CrawlReport:
+    """
+    Crawl tasks described by command line arguments `argv`.
+    """
+    args = parse_args(argv)
+    connector_kwargs = {
+        "key": args.key,
+        "secret": args.secret,
+        "refresh_token": args.refresh_token,
+        "url": args.url,
+    }
+    crawler = Crawler(
+        make_tasks(args.tags, args.start, args.end),
+        args.out,
+        connector_kwargs,
+        processes=args.processes,
+        type_of_content=args.type_of_content,
+        checkpoint_pages=args.checkpoint_pages,
+    )
+    return crawler.run()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Command line entry point, see `python -m pywykop3 --help`.
+
+    Returns:
+        int: Exit status, 1 if any task failed.
+    """
+    report = run(argv)
+    return 1 if report.failed else 0
@@ -0,0 +1,74 @@
+import json
+from typing import Any, Callable, Dict
+
+# Parses raw response body into Python objects, raises ValueError
+# on malformed body
+Decoder = Callable[[bytes], Any]
+
+
+def stdlib_decoder(raw: bytes) -> Any:
+    """
+    Decoder based on standard `json` module. Bytes are parsed directly,
+    without decoding them to str first.
+    """
+    return json.loads(raw)
+
+
+def _orjson_decoder() -> Decoder | None:
+    try:
+        import orjson  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    return orjson.loads  # pylint: disable=no-member
+
+
+def _msgspec_decoder() -> Decoder | None:
+    try:
+        import msgspec  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    decode = msgspec.json.Decoder().decode
+
+    def decoder(raw: bytes) -> Any:
+        # Not every msgspec release derives DecodeError from ValueError
+        try:
+            return decode(raw)
+        except msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+
+    return decoder
+
+
+_FACTORIES: Dict[str, Callable[[], Decoder | None]] = {
+    "orjson": _orjson_decoder,
+    "msgspec": _msgspec_decoder,
+    "json": lambda: stdlib_decoder,
+}
+
+
+def get_decoder(name: str | None = None) -> Decoder:
+    """
+    Get JSON decoder used to parse responses.
+
+    Args:
+        name (str | None, optional): One of `orjson`, `msgspec` or `json`.
+            If not provided, the fastest installed decoder is used, in
+            that order. Defaults to None.
+
+    Raises:
+        ValueError: Decoder is unknown or its package is not installed.
+
+    Returns:
+        Decoder: Callable parsing bytes
+    """
+    if name is None:
+        for factory in _FACTORIES.values():
+            decoder = factory()
+            if decoder is not None:
+                return decoder
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown decoder {name}")
+    decoder = _FACTORIES[name]()
+    if decoder is None:
+        raise ValueError(f"Decoder {name} is not installed")
+    return decoder
@@ -0,0 +1,477 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Type
+
+from . import models
+from .connector import Methods
+from .multipart import PhotoSource, guess_type, source_name
+from .utils import NotEmptyDict
+
+TAG_NOT_FOUND = "Podany tag nie istnieje lub jego dane są niedostępne."
+ENTRY_NOT_FOUND = "Nie odnaleziono wpisu."
+COMMENT_NOT_FOUND = "Nie odnaleziono wpisu lub komentarza."
+INVALID_FORM = "Wystąpił błąd podczas walidacji formularza."
+INVALID_QUERY = "Brak parametru query lub parametr zbyt krótki"
+NO_PERMISSIONS = "Brak wymaganych uprawnień."
+UPLOAD_ERRORS = {
+    400: "Nie załączono pliku.",
+    413: "Za duży plik.",
+    415: "Nieobsługiwane mime type.",
+    429: "Za dużo prób dodania zdjęcia w którtkim okresie czasu.",
+}
+
+
+@dataclass(frozen=True)
+class Call:  # pylint: disable=too-many-instance-attributes
+    """
+    Request of single API method, shared by :class:`pywykop3.api.WykopAPI`
+    and :class:`pywykop3.aio.AsyncWykopAPI`, so both send the same request
+    and raise the same errors.
+
+    - method, endpoint - sent request
+    - params, data, files - query params, JSON body and uploaded files
+    - errors - messages of :class:`pywykop3.api.ApiException` by status
+    - model - model of response data, used when models are enabled
+    - timeout - request timeout in seconds, None for connector default
+    """
+
+    method: Methods
+    endpoint: str
+    params: Dict | None = None
+    data: Dict | None = None
+    files: Dict | None = None
+    errors: Dict[int, str] = field(default_factory=dict)
+    model: Type[models.Model] | None = None
+    timeout: int | None = None
+
+
+def _entry_content(
+    content: str,
+    photo: str | None,
+    embed: str | None,
+    survey: str | None,
+    adult: bool,
+) -> Dict:
+    """
+    Body of added or edited entry.
+    """
+    data: Dict[str, str | int | None] = NotEmptyDict()
+    data["content"] = content
+    data["photo"] = photo
+    data["embed"] = embed
+    data["survey"] = survey
+    data["adult"] = adult
+    return data
+
+
+def _comment_content(
+    content: str, embed: str | None, photo: str | None, adult: bool
+) -> Dict:
+    """
+    Body of added or edited comment.
+    """
+    data = NotEmptyDict()
+    data["content"] = content
+    data["embed"] = embed
+    data["photo"] = photo
+    data["adult"] = adult
+    return data
+
+
+# Users
+
+
+def get_users_autocomplete(query: str) -> Call:
+    return Call(
+        Methods.GET,
+        "users/autocomplete",
+        params={"query": query},
+        errors={400: INVALID_QUERY},
+        model=models.User,
+    )
+
+
+# Tags
+
+
+def get_tags_autocomplete(query: str) -> Call:
+    return Call(
+        Methods.GET,
+        "tags/autocomplete",
+        params={"query": query},
+        errors={400: INVALID_QUERY},
+    )
+
+
+def get_tags_popular() -> Call:
+    return Call(Methods.GET, "tags/popular")
+
+
+def get_tags_popular_user_tags() -> Call:
+    return Call(Methods.GET, "tags/popular-user-tags")
+
+
+def get_tags_related(tag_name: str) -> Call:
+    return Call(
+        Methods.GET,
+        f"tags/{tag_name}/related",
+        errors={400: "Brak tagu lub tag jest za krótki"},
+    )
+
+
+def get_tag(tag_name: str) -> Call:
+    return Call(Methods.GET, f"tags/{tag_name}")
+
+
+def put_tag(tag_name: str, data: Dict) -> Call:
+    return Call(
+        Methods.PUT,
+        f"tags/{tag_name}",
+        data=data,
+        errors={
+            400: "Brak uprawnień do usunięcia znaleziska.",
+            404: "Tag nie istnieje",
+            409: INVALID_FORM,
+        },
+    )
+
+
+def get_tag_stream(
+    tag_name: str,
+    sort: str,
+    type_of_content: str,
+    year: int | None,
+    month: int | None,
+) -> Call:
+    params: Dict[str, str | int | None] = NotEmptyDict()
+    params["sort"] = sort
+    params["type"] = type_of_content
+    params["year"] = year
+    params["month"] = month
+    return Call(
+        Methods.GET,
+        f"tags/{tag_name}/stream",
+        params=params,
+        errors={404: TAG_NOT_FOUND},
+        model=models.Entry,
+    )
+
+
+def get_tag_newer(
+    tag_name: str,
+    type_of_content: str,
+    sort: str,
+    date: datetime | None,
+    obj_id: str | None,
+) -> Call:
+    params: Dict[str, str | int | None] = NotEmptyDict()
+    params["sort"] = sort
+    params["type"] = type_of_content
+    params["date"] = date.strftime("%Y-%m-%d %H:%M:%S") if date else None
+    params["id"] = obj_id
+    return Call(
+        Methods.GET,
+        f"tags/{tag_name}/newer",
+        params=params,
+        errors={404: TAG_NOT_FOUND},
+    )
+
+
+def get_tag_users(tag_name: str) -> Call:
+    return Call(
+        Methods.GET,
+        f"tags/{tag_name}/users",
+        errors={404: TAG_NOT_FOUND},
+        model=models.User,
+    )
+
+
+def post_tag_user(tag_name: str, username: str) -> Call:
+    return Call(
+        Methods.POST,
+        f"tags/{tag_name}/users/{username}",
+        errors={400: NO_PERMISSIONS, 404: TAG_NOT_FOUND},
+    )
+
+
+def delete_tag_user(tag_name: str, username: str) -> Call:
+    return Call(
+        Methods.DELETE,
+        f"tags/{tag_name}/users/{username}",
+        errors={400: NO_PERMISSIONS, 404: TAG_NOT_FOUND},
+    )
+
+
+# Mikroblog
+
+
+def get_entries(
+    sort: str, last_update: int, category: str | None, bucket: str | None
+) -> Call:
+    params: Dict[str, str | int | None] = NotEmptyDict()
+    params["sort"] = sort
+    params["last_update"] = last_update
+    params["category"] = category
+    params["bucket"] = bucket
+    return Call(
+        Methods.GET,
+        "entries",
+        params=params,
+        errors={400: "Osiągnięto limit paginacji."},
+        model=models.Entry,
+    )
+
+
+def post_entry(
+    content: str,
+    photo: str | None,
+    embed: str | None,
+    survey: str | None,
+    adult: bool,
+) -> Call:
+    return Call(
+        Methods.POST,
+        "entries",
+        data=_entry_content(content, photo, embed, survey, adult),
+        errors={
+            400: "Gdy użytkownik wykona niepoprawny request.",
+            409: INVALID_FORM,
+        },
+    )
+
+
+def get_entry_by_id(entry_id: int) -> Call:
+    return Call(
+        Methods.GET,
+        f"/entries/{entry_id}",
+        errors={404: ENTRY_NOT_FOUND},
+        model=models.Entry,
+    )
+
+
+def put_entry(
+    entry_id: int,
+    content: str,
+    photo: str | None,
+    embed: str | None,
+    survey: str | None,
+    adult: bool,
+) -> Call:
+    return Call(
+        Methods.PUT,
+        f"/entries/{entry_id}",
+        data=_entry_content(content, photo, embed, survey, adult),
+        errors={
+            400: "Brak uprawnień do modyfikacji wpisu.",
+            404: ENTRY_NOT_FOUND,
+            409: INVALID_FORM,
+        },
+    )
+
+
+def delete_entry_by_id(entry_id: int) -> Call:
+    return Call(
+        Methods.DELETE,
+        f"/entries/{entry_id}",
+        errors={
+            400: "Brak uprawnień do usunięcia wpisu.",
+            404: ENTRY_NOT_FOUND,
+        },
+    )
+
+
+def get_entry_votes(entry_id: int) -> Call:
+    return Call(
+        Methods.GET,
+        f"/entries/{entry_id}/votes",
+        errors={404: ENTRY_NOT_FOUND},
+        model=models.User,
+    )
+
+
+def post_entry_vote(entry_id: int) -> Call:
+    return Call(
+        Methods.POST,
+        f"/entries/{entry_id}/votes",
+        errors={
+            400: "Użytkownik głosował wcześniej na wpis lub jest jego autorem.",
+            404: ENTRY_NOT_FOUND,
+        },
+    )
+
+
+def delete_entry_vote(entry_id: int | str) -> Call:
+    return Call(
+        Methods.DELETE,
+        f"/entries/{entry_id}/votes",
+        errors={
+            400: "Użytkownik nie głosował wcześniej na wpis.",
+            404: ENTRY_NOT_FOUND,
+        },
+    )
+
+
+def get_entries_newer(entry_id: int, category: str | None) -> Call:
+    params = NotEmptyDict()
+    params["category"] = category
+    return Call(
+        Methods.GET,
+        f"/entries/{entry_id}/newer",
+        params=params,
+        errors={404: ENTRY_NOT_FOUND},
+    )
+
+
+# Mikroblog - Komentarz
+
+
+def get_entry_comments(entry_id: int) -> Call:
+    return Call(
+        Methods.GET, f"entries/{entry_id}/comments", model=models.Comment
+    )
+
+
+def post_entry_comment(
+    entry_id: int,
+    content: str,
+    embed: str | None,
+    photo: str | None,
+    adult: bool,
+) -> Call:
+    return Call(
+        Methods.POST,
+        f"entries/{entry_id}/comments",
+        data=_comment_content(content, embed, photo, adult),
+        errors={
+            404: "Nie odnaleziono znaleziska lub komentarza",
+            409: INVALID_FORM,
+        },
+    )
+
+
+def get_entry_comment(entry_id: int, comment_id: int) -> Call:
+    return Call(
+        Methods.GET,
+        f"entries/{entry_id}/comments/{comment_id}",
+        errors={404: COMMENT_NOT_FOUND},
+        model=models.Comment,
+    )
+
+
+def put_entry_comment(
+    entry_id: int,
+    comment_id: int,
+    content: str,
+    embed: str | None,
+    photo: str | None,
+    adult: bool,
+) -> Call:
+    return Call(
+        Methods.PUT,
+        f"entries/{entry_id}/comments/{comment_id}",
+        data=_comment_content(content, embed, photo, adult),
+        errors={
+            400: "Brak uprawnień do modyfikacji komentarza.",
+            404: COMMENT_NOT_FOUND,
+            409: INVALID_FORM,
+        },
+    )
+
+
+def delete_entry_comment(entry_id: int, comment_id: int) -> Call:
+    return Call(
+        Methods.DELETE,
+        f"entries/{entry_id}/comments/{comment_id}",
+        errors={
+            400: "Brak uprawnień do usunięcia komentarza.",
+            404: COMMENT_NOT_FOUND,
+        },
+    )
+
+
+def get_entry_comment_votes(entry_id: int, comment_id: int) -> Call:
+    return Call(
+        Methods.GET,
+        f"entries/{entry_id}/comments/{comment_id}/votes",
+        errors={404: COMMENT_NOT_FOUND},
+        model=models.User,
+    )
+
+
+def post_entry_comment_vote(entry_id: int, comment_id: int) -> Call:
+    return Call(
+        Methods.POST,
+        f"entries/{entry_id}/comments/{comment_id}/votes",
+        errors={
+            400: "Użytkownik głosował wcześniej na komentarz"
+            "lub jest jego autorem.",
+            404: COMMENT_NOT_FOUND,
+        },
+    )
+
+
+def delete_entry_comment_vote(entry_id: int, comment_id: int) -> Call:
+    return Call(
+        Methods.DELETE,
+        f"entries/{entry_id}/comments/{comment_id}/votes",
+        errors={
+            400: "Użytkownik nie głosował wcześniej na komentarz.",
+            404: COMMENT_NOT_FOUND,
+        },
+    )
+
+
+# Media - Zdjęcia
+
+
+def post_media_photo(
+    media_type: str,
+    photo: PhotoSource,
+    photo_name: str | None,
+    photo_type: str | None,
+) -> Call:
+    params = NotEmptyDict()
+    params["type"] = media_type
+    photo_name = photo_name or source_name(photo)
+    files = {
+        "file": (photo_name, photo, photo_type or guess_type(photo_name)),
+    }
+    return Call(
+        Methods.POST,
+        "media/photos/upload",
+        params=params,
+        files=files,
+        errors=UPLOAD_ERRORS,
+        model=models.Photo,
+    )
+
+
+def post_media_photo_by_url(media_type: str, photo_url: str) -> Call:
+    params = NotEmptyDict()
+    params["type"] = media_type
+    data = NotEmptyDict()
+    data["url"] = photo_url
+    return Call(
+        Methods.POST,
+        "media/photos",
+        params=params,
+        data=data,
+        errors={
+            **UPLOAD_ERRORS,
+            409: "Wystąpił błąd podczas walidacji formularza",
+        },
+        model=models.Photo,
+    )
+
+
+def delete_media_photo(photo_key: str) -> Call:
+    return Call(
+        Methods.DELETE,
+        f"media/photos/{photo_key}",
+        errors={
+            400: "Brak uprawnień do usunięcia pliku.",
+            404: "Plik nie został odnaleziony lub neleży "
+            "do innego użytkownika.",
+        },
+        timeout=30,
+    )
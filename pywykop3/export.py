@@ -0,0 +1,277 @@
+import abc
+import gzip
+import json
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, List
+
+from .models import Entry
+
+# Number of items buffered before they are written
+BATCH_SIZE = 1000
+
+# Compression of JSONL files by suffix
+COMPRESSIONS = {".gz": "gzip", ".zst": "zstd"}
+
+# Columns of :class:`ParquetWriter`
+COLUMNS = (
+    "id",
+    "resource",
+    "parent_id",
+    "author",
+    "created_at",
+    "content",
+    "tags",
+    "votes_up",
+    "votes_down",
+    "comments_count",
+    "adult",
+    "data",
+)
+
+
+def _default(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def dump_item(item: Any) -> bytes:
+    """
+    Item (dict or model) as single JSON line.
+    """
+    return (
+        json.dumps(item, ensure_ascii=False, default=_default).encode() + b"\n"
+    )
+
+
+def flatten_item(item: Any, keep_data: bool = True) -> Dict:
+    """
+    Row of :class:`ParquetWriter` for entry, link or comment given as dict
+    or model. Whole item is kept as JSON in `data` column if `keep_data`
+    is set.
+    """
+    model = Entry.from_dict(item) if isinstance(item, dict) else item
+    author = getattr(model, "author", None)
+    parent = item.get("parent") if isinstance(item, dict) else None
+    return {
+        "id": model.id,
+        "resource": getattr(model, "resource", None),
+        "parent_id": (parent or {}).get("id"),
+        "author": author.username if author else None,
+        "created_at": model.created_at,
+        "content": model.content,
+        "tags": list(getattr(model, "tags", ())),
+        "votes_up": model.votes_up,
+        "votes_down": model.votes_down,
+        "comments_count": getattr(model, "comments_count", None),
+        "adult": model.adult,
+        "data": dump_item(item)[:-1].decode() if keep_data else None,
+    }
+
+
+class ExportWriter(abc.ABC):
+    """
+    Base of export sinks. Items are buffered and written in batches of
+    `batch_size`, so memory use does not depend on number of exported
+    items. Writer is closed, and buffered items written, when leaving
+    `with` block, also on exception or KeyboardInterrupt.
+
+    Args:
+        path (str | Path): Output file.
+        batch_size (int, optional): Items per batch.
+            Defaults to :data:`BATCH_SIZE`.
+    """
+
+    def __init__(self, path: str | Path, batch_size: int = BATCH_SIZE) -> None:
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.items = 0
+        self.closed = False
+        self._batch: List[Any] = []
+
+    def write(self, item: Any) -> None:
+        self._batch.append(item)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def write_many(self, items: Iterable[Any]) -> int:
+        """
+        Write items of iterable, e.g. :class:`PageIterator`, as they
+        arrive. Returns number of written items.
+        """
+        count = 0
+        for item in items:
+            self.write(item)
+            count += 1
+        return count
+
+    def flush(self) -> None:
+        """
+        Write buffered items.
+        """
+        if self._batch:
+            self._write_batch(self._batch)
+            self.items += len(self._batch)
+            self._batch = []
+
+    @abc.abstractmethod
+    def _write_batch(self, batch: List[Any]) -> None:
+        """
+        Write buffered items to output.
+        """
+
+    @abc.abstractmethod
+    def _close(self) -> None:
+        """
+        Close output, called once after the last batch.
+        """
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.flush()
+        finally:
+            self._close()
+
+    def __enter__(self) -> "ExportWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def _open_zstd(path: Path, level: int | None) -> IO[bytes]:
+    try:
+        import zstandard  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ValueError("zstd compression requires zstandard package") from exc
+    compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+    # pylint: disable-next=consider-using-with
+    return compressor.stream_writer(open(path, "wb"), closefd=True)
+
+
+class JsonlWriter(ExportWriter):
+    """
+    Writes items as JSON lines, optionally compressed. Every batch is
+    flushed to disk, so items of written batches survive a crash.
+
+    Args:
+        path (str | Path): Output file.
+        compression (str | None, optional): "gzip", "zstd" or "none".
+            Defaults to None: inferred from suffix (`.gz`, `.zst`).
+        level (int | None, optional): Compression level. Defaults to None:
+            6 for gzip, 3 for zstd.
+        batch_size (int, optional): Items per batch.
+            Defaults to :data:`BATCH_SIZE`.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        compression: str | None = None,
+        level: int | None = None,
+        batch_size: int = BATCH_SIZE,
+    ) -> None:
+        super().__init__(path, batch_size)
+        if compression is None:
+            compression = COMPRESSIONS.get(self.path.suffix, "none")
+        self.compression = compression
+        # pylint: disable=consider-using-with
+        if compression == "gzip":
+            self._file: IO[bytes] = gzip.open(
+                self.path, "wb", compresslevel=6 if level is None else level
+            )
+        elif compression == "zstd":
+            self._file = _open_zstd(self.path, level)
+        elif compression == "none":
+            self._file = open(self.path, "wb")
+        else:
+            raise ValueError(f"Unknown compression {compression}")
+
+    def _write_batch(self, batch: List[Any]) -> None:
+        self._file.write(b"".join(dump_item(item) for item in batch))
+        self._file.flush()
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+class ParquetWriter(ExportWriter):
+    """
+    Writes entries, links or comments to columnar Parquet file, one row
+    group per batch. Commonly queried fields get own columns (see
+    :data:`COLUMNS`), whole item is kept as JSON in `data` column unless
+    `keep_data` is False. Requires `pyarrow` package.
+
+    Parquet footer is written by :meth:`close`, so file is readable only
+    after writer is closed.
+
+    Args:
+        path (str | Path): Output file.
+        batch_size (int, optional): Rows per row group. Defaults to 10000.
+        keep_data (bool, optional): Store whole items in `data` column.
+            Defaults to True.
+        compression (str, optional): Parquet codec. Defaults to "zstd".
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        batch_size: int = 10_000,
+        keep_data: bool = True,
+        compression: str = "zstd",
+    ) -> None:
+        try:
+            # pylint: disable-next=import-outside-toplevel
+            import pyarrow as pa
+
+            # pylint: disable-next=import-outside-toplevel
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ValueError("ParquetWriter requires pyarrow package") from exc
+        super().__init__(path, batch_size)
+        self.keep_data = keep_data
+        self._pa = pa
+        self.schema = pa.schema(
+            [
+                ("id", pa.int64()),
+                ("resource", pa.string()),
+                ("parent_id", pa.int64()),
+                ("author", pa.string()),
+                ("created_at", pa.string()),
+                ("content", pa.string()),
+                ("tags", pa.list_(pa.string())),
+                ("votes_up", pa.int64()),
+                ("votes_down", pa.int64()),
+                ("comments_count", pa.int64()),
+                ("adult", pa.bool_()),
+                ("data", pa.string()),
+            ]
+        )
+        self._writer = pq.ParquetWriter(
+            str(self.path), self.schema, compression=compression
+        )
+
+    def _write_batch(self, batch: List[Any]) -> None:
+        rows = [flatten_item(item, self.keep_data) for item in batch]
+        columns = {name: [row[name] for row in rows] for name in COLUMNS}
+        table = self._pa.table(columns, schema=self.schema)
+        self._writer.write_table(table)
+
+    def _close(self) -> None:
+        self._writer.close()
+
+
+def export(items: Iterable[Any], writer: ExportWriter) -> int:
+    """
+    Write `items` to `writer` as they arrive and close it, also when
+    iteration is interrupted. Returns number of written items, e.g.::
+
+        export(api.iter_tag_stream("python"), JsonlWriter("python.jsonl.gz"))
+    """
+    with writer:
+        writer.write_many(items)
+    return writer.items
@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .multipart import CHUNK_SIZE, PhotoSource
+
+# Default time, in seconds, for which uploaded photo key is reused
+DEFAULT_TTL = 24 * 3600.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS photos (
+    source TEXT NOT NULL,
+    media_type TEXT NOT NULL,
+    photo_key TEXT NOT NULL,
+    data TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (source, media_type)
+);
+CREATE INDEX IF NOT EXISTS photos_photo_key ON photos (photo_key);
+"""
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def content_digest(photo: PhotoSource) -> str:
+    """
+    SHA-256 of photo content. Paths and file objects are hashed in
+    chunks, file objects are rewound to their position afterwards.
+    """
+    digest = hashlib.sha256()
+    if isinstance(photo, (bytes, bytearray, memoryview)):
+        digest.update(photo)
+    elif isinstance(photo, (str, os.PathLike)):
+        with open(photo, "rb") as file:
+            while chunk := file.read(CHUNK_SIZE):
+                digest.update(chunk)
+    else:
+        start = photo.tell()
+        while chunk := photo.read(CHUNK_SIZE):
+            digest.update(chunk)
+        photo.seek(start)
+    return f"sha256:{digest.hexdigest()}"
+
+
+def normalize_url(url: str) -> str:
+    """
+    URL with lowercase scheme and host, without default port, fragment
+    and with sorted query params.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+@dataclass
+class MediaCacheStats:
+    """
+    - hits - uploads skipped thanks to cached key
+    - misses - uploads sent to server
+    - invalidations - keys removed after deletion
+    """
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
+class MediaCache:
+    """
+    Opt-in persistent cache of uploaded photos, used by
+    :meth:`pywykop3.api.WykopAPI.post_media_photo` and
+    :meth:`pywykop3.api.WykopAPI.post_media_photo_by_url`. Photos are
+    keyed by SHA-256 of content or normalized source URL, and media type.
+    Cached photo is reused for `ttl` seconds and forgotten once it is
+    deleted with :meth:`pywykop3.api.WykopAPI.delete_media_photo`.
+
+    Uploaded photos belong to the account which uploaded them, so cache
+    file should not be shared between accounts.
+
+    Args:
+        path (str | Path, optional): SQLite database file.
+            Defaults to ":memory:".
+        ttl (float | None, optional): Time, in seconds, for which photo is
+            reused, None for no limit. Defaults to :data:`DEFAULT_TTL`.
+    """
+
+    def __init__(
+        self, path: str | Path = ":memory:", ttl: float | None = DEFAULT_TTL
+    ) -> None:
+        self.ttl = ttl
+        self.stats = MediaCacheStats()
+        self.connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self.connection:
+            self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def get(self, source: str, media_type: str) -> Dict | None:
+        """
+        Cached photo of `source` digest or URL, None if missing or expired.
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT data, created_at FROM photos"
+                " WHERE source = ? AND media_type = ?",
+                (source, media_type),
+            ).fetchone()
+            if row is None or (
+                self.ttl is not None and time.time() - row[1] > self.ttl
+            ):
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+        return json.loads(row[0])
+
+    def store(self, source: str, media_type: str, photo: Dict) -> None:
+        with self._lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO photos VALUES (?, ?, ?, ?, ?)",
+                (
+                    source,
+                    media_type,
+                    photo["key"],
+                    json.dumps(photo),
+                    time.time(),
+                ),
+            )
+
+    def invalidate(self, photo_key: str) -> None:
+        """
+        Stop reusing photo with `photo_key`, e.g. after it was deleted.
+        """
+        with self._lock, self.connection:
+            removed = self.connection.execute(
+                "DELETE FROM photos WHERE photo_key = ?", (photo_key,)
+            ).rowcount
+            self.stats.invalidations += removed
+
+    def clear(self) -> None:
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM photos")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.connection.execute(
+                "SELECT COUNT(*) FROM photos"
+            ).fetchone()[0]
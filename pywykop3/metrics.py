@@ -0,0 +1,390 @@
+import bisect
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    TypeVar,
+)
+
+from .utils import match_template
+
+T = TypeVar("T")
+
+# Endpoint templates of Wykop API v3 used by :class:`pywykop3.api.WykopAPI`
+ROUTES = (
+    "users/autocomplete",
+    "tags/autocomplete",
+    "tags/popular",
+    "tags/popular-user-tags",
+    "tags/{tag}",
+    "tags/{tag}/related",
+    "tags/{tag}/stream",
+    "tags/{tag}/newer",
+    "tags/{tag}/users",
+    "tags/{tag}/users/{username}",
+    "entries",
+    "entries/{id}",
+    "entries/{id}/votes",
+    "entries/{id}/newer",
+    "entries/{id}/comments",
+    "entries/{id}/comments/{comment_id}",
+    "entries/{id}/comments/{comment_id}/votes",
+    "media/photos",
+    "media/photos/upload",
+    "media/photos/{key}",
+)
+
+# Upper bounds of latency buckets, in seconds
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+# Upper bounds of pagination depth buckets, in pages
+DEPTH_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+class Histogram:
+    """
+    Histogram with fixed buckets, as in Prometheus. Quantiles are estimated
+    by linear interpolation inside the bucket.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        # Last slot counts values greater than the last bucket
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate `q` quantile, e.g. 0.95 for p95. Returns 0 when histogram
+        is empty.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if seen + count >= rank and count:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+    def cumulative(self) -> Iterator[Tuple[str, int]]:
+        """
+        Yield `le` label and cumulative count of every bucket.
+        """
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield f"{bound:g}", total
+        yield "+Inf", self.count
+
+    def copy(self) -> "Histogram":
+        histogram = Histogram(self.buckets)
+        histogram.counts = list(self.counts)
+        histogram.count = self.count
+        histogram.sum = self.sum
+        return histogram
+
+
+@dataclass
+class EndpointMetrics:
+    """
+    Metrics of endpoint template.
+
+    - responses - number of responses per (method, status code)
+    - latency - request duration in seconds, including retries
+    - request_bytes, response_bytes - total size of bodies
+    - retries - number of replayed requests (401 and 429)
+    - pagination_depth - number of pages fetched by paginated calls
+    """
+
+    responses: Counter = field(default_factory=Counter)
+    latency: Histogram = field(default_factory=Histogram)
+    request_bytes: int = 0
+    response_bytes: int = 0
+    retries: int = 0
+    pagination_depth: Histogram = field(
+        default_factory=lambda: Histogram(DEPTH_BUCKETS)
+    )
+
+    @property
+    def requests(self) -> int:
+        return sum(self.responses.values())
+
+    def percentiles(self) -> Dict[str, float]:
+        """
+        Estimated p50, p95 and p99 latency in seconds.
+        """
+        return {
+            "p50": self.latency.quantile(0.5),
+            "p95": self.latency.quantile(0.95),
+            "p99": self.latency.quantile(0.99),
+        }
+
+    def copy(self) -> "EndpointMetrics":
+        return EndpointMetrics(
+            Counter(self.responses),
+            self.latency.copy(),
+            self.request_bytes,
+            self.response_bytes,
+            self.retries,
+            self.pagination_depth.copy(),
+        )
+
+
+@dataclass
+class RequestInfo:
+    """
+    Request passed to hooks.
+    """
+
+    method: str
+    endpoint: str
+    template: str
+    started: float
+
+
+@dataclass
+class ResponseInfo:
+    """
+    Response passed to `after_response` hooks.
+    """
+
+    status: int
+    elapsed: float
+    request_bytes: int
+    response_bytes: int
+
+
+BeforeRequest = Callable[[RequestInfo], None]
+AfterResponse = Callable[[RequestInfo, ResponseInfo], None]
+
+
+class Metrics:
+    """
+    Instrumentation of :class:`WykopConnector`. Requests are aggregated
+    per endpoint template, e.g. `entries/{id}/comments`, so number of
+    series stays bounded. Endpoints not matching any of `routes` are
+    aggregated by their first path segment.
+
+    Args:
+        routes (Iterable[str], optional): Endpoint templates.
+            Defaults to :data:`ROUTES`.
+        before_request (BeforeRequest | None, optional): Hook called before
+            every request. Defaults to None.
+        after_response (AfterResponse | None, optional): Hook called after
+            every response. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        routes: Iterable[str] = ROUTES,
+        before_request: BeforeRequest | None = None,
+        after_response: AfterResponse | None = None,
+    ) -> None:
+        self.routes = tuple(routes)
+        self.before_request_hooks: List[BeforeRequest] = []
+        self.after_response_hooks: List[AfterResponse] = []
+        self.add_hooks(before_request, after_response)
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+        self._templates: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def add_hooks(
+        self,
+        before_request: BeforeRequest | None = None,
+        after_response: AfterResponse | None = None,
+    ) -> None:
+        if before_request:
+            self.before_request_hooks.append(before_request)
+        if after_response:
+            self.after_response_hooks.append(after_response)
+
+    def template(self, endpoint: str) -> str:
+        """
+        Normalized template of `endpoint`.
+        """
+        endpoint = endpoint.strip("/")
+        template = self._templates.get(endpoint)
+        if template is None:
+            template = match_template(endpoint, self.routes) or (
+                f"{endpoint.split('/', 1)[0]}/{{other}}"
+            )
+            # Bound the lookup table, templates are cheap to compute again
+            if len(self._templates) < 10_000:
+                self._templates[endpoint] = template
+        return template
+
+    def _endpoint(self, template: str) -> EndpointMetrics:
+        if template not in self._endpoints:
+            self._endpoints[template] = EndpointMetrics()
+        return self._endpoints[template]
+
+    def before_request(self, method: str, endpoint: str) -> RequestInfo:
+        info = RequestInfo(
+            method, endpoint, self.template(endpoint), time.perf_counter()
+        )
+        for hook in self.before_request_hooks:
+            hook(info)
+        return info
+
+    def after_response(
+        self,
+        info: RequestInfo,
+        status: int,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+    ) -> None:
+        response = ResponseInfo(
+            status,
+            time.perf_counter() - info.started,
+            request_bytes,
+            response_bytes,
+        )
+        with self._lock:
+            metrics = self._endpoint(info.template)
+            metrics.responses[(info.method, status)] += 1
+            metrics.latency.observe(response.elapsed)
+            metrics.request_bytes += request_bytes
+            metrics.response_bytes += response_bytes
+        for hook in self.after_response_hooks:
+            hook(info, response)
+
+    def retried(self, endpoint: str) -> None:
+        template = self.template(endpoint)
+        with self._lock:
+            self._endpoint(template).retries += 1
+
+    def paginated(self, endpoint: str, depth: int) -> None:
+        template = self.template(endpoint)
+        with self._lock:
+            self._endpoint(template).pagination_depth.observe(depth)
+
+    def track_pages(self, endpoint: str, pages: Iterator[T]) -> Iterator[T]:
+        """
+        Pass `pages` through, recording pagination depth when iteration
+        ends.
+        """
+        depth = 0
+        try:
+            for page in pages:
+                depth += 1
+                yield page
+        finally:
+            pages.close()  # type: ignore
+            self.paginated(endpoint, depth)
+
+    async def track_pages_async(
+        self, endpoint: str, pages: AsyncIterator[T]
+    ) -> AsyncIterator[T]:
+        """
+        Async version of :meth:`track_pages`.
+        """
+        depth = 0
+        try:
+            async for page in pages:
+                depth += 1
+                yield page
+        finally:
+            await pages.aclose()  # type: ignore
+            self.paginated(endpoint, depth)
+
+    def snapshot(self) -> Dict[str, EndpointMetrics]:
+        """
+        Copy of metrics per endpoint template.
+        """
+        with self._lock:
+            return {
+                template: metrics.copy()
+                for template, metrics in self._endpoints.items()
+            }
+
+    def to_prometheus(self, prefix: str = "wykop") -> str:
+        """
+        Export metrics in Prometheus text format.
+        """
+        lines: List[str] = []
+
+        def header(name: str, kind: str, text: str) -> None:
+            lines.append(f"# HELP {prefix}_{name} {text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        def histogram(name: str, labels: str, values: Histogram) -> None:
+            for bound, count in values.cumulative():
+                lines.append(
+                    f'{prefix}_{name}_bucket{{{labels},le="{bound}"}} {count}'
+                )
+            lines.append(f"{prefix}_{name}_sum{{{labels}}} {values.sum:g}")
+            lines.append(f"{prefix}_{name}_count{{{labels}}} {values.count}")
+
+        snapshot = sorted(self.snapshot().items())
+        header("requests_total", "counter", "Responses by status code.")
+        for template, metrics in snapshot:
+            for (method, status), count in sorted(metrics.responses.items()):
+                lines.append(
+                    f'{prefix}_requests_total{{endpoint="{template}",'
+                    f'method="{method}",status="{status}"}} {count}'
+                )
+        header(
+            "request_duration_seconds",
+            "histogram",
+            "Request duration including retries.",
+        )
+        for template, metrics in snapshot:
+            histogram(
+                "request_duration_seconds",
+                f'endpoint="{template}"',
+                metrics.latency,
+            )
+        counters = (
+            ("request_bytes_total", "request_bytes", "Sent body bytes."),
+            ("response_bytes_total", "response_bytes", "Received body bytes."),
+            ("retries_total", "retries", "Replayed requests."),
+        )
+        for name, attr, text in counters:
+            header(name, "counter", text)
+            for template, metrics in snapshot:
+                lines.append(
+                    f'{prefix}_{name}{{endpoint="{template}"}} '
+                    f"{getattr(metrics, attr)}"
+                )
+        header("pagination_depth", "histogram", "Pages per paginated call.")
+        for template, metrics in snapshot:
+            if metrics.pagination_depth.count:
+                histogram(
+                    "pagination_depth",
+                    f'endpoint="{template}"',
+                    metrics.pagination_depth,
+                )
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,192 @@
+import abc
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple, Type, TypeVar
+
+T = TypeVar("T", bound="Model")
+
+
+def _intern(value: str | None) -> str | None:
+    return sys.intern(value) if value else value
+
+
+class Model(abc.ABC):
+    """
+    Base of compact models of Wykop resources. Models use `__slots__` and
+    keep only commonly used fields, so they take a fraction of memory of
+    nested dictionaries returned by API. Repeated strings (usernames, tags)
+    are interned.
+
+    Models are returned by :class:`pywykop3.api.WykopAPI` created with
+    `use_models=True`.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    @abc.abstractmethod
+    def from_dict(cls: Type[T], data: Dict) -> T:
+        """
+        Model of API dictionary `data`.
+        """
+
+    @classmethod
+    def from_list(cls: Type[T], data: List[Dict]) -> List[T]:
+        return [cls.from_dict(item) for item in data]
+
+
+@dataclass(slots=True)
+class User(Model):  # pylint: disable=too-many-instance-attributes
+    username: str
+    gender: str | None = None
+    avatar: str | None = None
+    color: str | None = None
+    status: str | None = None
+    verified: bool = False
+    online: bool = False
+    rank: int | None = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "User":
+        return cls(
+            username=_intern(data.get("username")),  # type: ignore
+            gender=_intern(data.get("gender")),
+            avatar=data.get("avatar"),
+            color=_intern(data.get("color")),
+            status=_intern(data.get("status")),
+            verified=bool(data.get("verified")),
+            online=bool(data.get("online")),
+            rank=(data.get("rank") or {}).get("position"),
+        )
+
+
+@dataclass(slots=True)
+class Photo(Model):
+    key: str
+    url: str | None = None
+    label: str | None = None
+    mime_type: str | None = None
+    size: int | None = None
+    width: int | None = None
+    height: int | None = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Photo":
+        return cls(
+            key=data.get("key"),  # type: ignore
+            url=data.get("url"),
+            label=data.get("label"),
+            mime_type=_intern(data.get("mime_type")),
+            size=data.get("size"),
+            width=data.get("width"),
+            height=data.get("height"),
+        )
+
+
+def _photo(data: Dict) -> Photo | None:
+    photo = (data.get("media") or {}).get("photo")
+    return Photo.from_dict(photo) if photo else None
+
+
+def _embed(data: Dict) -> Dict | None:
+    return (data.get("media") or {}).get("embed") or None
+
+
+def _author(data: Dict) -> User | None:
+    author = data.get("author")
+    return User.from_dict(author) if author else None
+
+
+@dataclass(slots=True)
+class Comment(Model):  # pylint: disable=too-many-instance-attributes
+    id: int
+    author: User | None = None
+    content: str | None = None
+    created_at: str | None = None
+    votes_up: int = 0
+    votes_down: int = 0
+    photo: Photo | None = None
+    embed: Dict | None = None
+    adult: bool = False
+    deleted: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Comment":
+        votes = data.get("votes") or {}
+        return cls(
+            id=data.get("id"),  # type: ignore
+            author=_author(data),
+            content=data.get("content"),
+            created_at=data.get("created_at"),
+            votes_up=votes.get("up", 0),
+            votes_down=votes.get("down", 0),
+            photo=_photo(data),
+            embed=_embed(data),
+            adult=bool(data.get("adult")),
+            deleted=data.get("deleted"),
+        )
+
+
+@dataclass(slots=True)
+class Entry(Model):  # pylint: disable=too-many-instance-attributes
+    """
+    Entry of mikroblog. Links returned by tag stream are also represented
+    as entries, with `resource` set to `link` and `title` and `source_url`
+    filled.
+    """
+
+    id: int
+    resource: str | None = None
+    slug: str | None = None
+    author: User | None = None
+    content: str | None = None
+    created_at: str | None = None
+    tags: Tuple[str, ...] = ()
+    votes_up: int = 0
+    votes_down: int = 0
+    comments_count: int = 0
+    comments: Tuple[Comment, ...] = ()
+    photo: Photo | None = None
+    embed: Dict | None = None
+    adult: bool = False
+    deleted: str | None = None
+    title: str | None = None
+    source_url: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Entry":
+        votes = data.get("votes") or {}
+        comments = data.get("comments") or {}
+        source = data.get("source") or {}
+        return cls(
+            id=data.get("id"),  # type: ignore
+            resource=_intern(data.get("resource")),
+            slug=data.get("slug"),
+            author=_author(data),
+            content=data.get("content") or data.get("description"),
+            created_at=data.get("created_at"),
+            tags=tuple(sys.intern(tag) for tag in data.get("tags") or ()),
+            votes_up=votes.get("up", 0),
+            votes_down=votes.get("down", 0),
+            comments_count=comments.get("count", 0),
+            comments=tuple(
+                Comment.from_dict(item) for item in comments.get("items") or ()
+            ),
+            photo=_photo(data),
+            embed=_embed(data),
+            adult=bool(data.get("adult")),
+            deleted=data.get("deleted"),
+            title=data.get("title"),
+            source_url=source.get("url"),
+        )
+
+
+def convert(data: Any, model: Type[Model]) -> Any:
+    """
+    Convert single item or list of items to `model`.
+    """
+    if isinstance(data, list):
+        return model.from_list(data)
+    if isinstance(data, dict):
+        return model.from_dict(data)
+    return data
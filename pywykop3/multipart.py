@@ -0,0 +1,165 @@
+import mimetypes
+import os
+import uuid
+from typing import IO, BinaryIO, Dict, List, Tuple, Union
+
+# Photo passed to upload methods: content, path or binary file object
+PhotoSource = Union[bytes, str, os.PathLike, BinaryIO]
+
+# Size of chunks read from files
+CHUNK_SIZE = 64 * 1024
+
+
+# Extensions of image types recognized by their first bytes
+SIGNATURES = ((b"\xff\xd8", ".jpg"), (b"\x89PNG", ".png"), (b"GIF8", ".gif"))
+
+
+def _extension(source: bytes | BinaryIO) -> str:
+    """
+    Extension of image type of `source` recognized by its first bytes,
+    empty when type is unknown. File objects are rewound afterwards.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        head = bytes(source[:4])
+    else:
+        start = source.tell()
+        head = source.read(4)
+        source.seek(start)
+    for signature, extension in SIGNATURES:
+        if head.startswith(signature):
+            return extension
+    return ""
+
+
+def source_name(source: PhotoSource) -> str:
+    """
+    File name of `source`. Sources without name are called "photo", with
+    extension of JPEG, PNG or GIF content, so they are not sent as
+    `application/octet-stream`.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.basename(os.fspath(source))
+    name = getattr(source, "name", None)
+    if isinstance(name, str):
+        return os.path.basename(name)
+    return "photo" + _extension(source)
+
+
+def guess_type(file_name: str) -> str:
+    return mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+
+
+class _FilePart:
+    """
+    Part of multipart body read from file, starting at `start`.
+    """
+
+    def __init__(self, file: IO[bytes], start: int, size: int) -> None:
+        self.file = file
+        self.start = start
+        self.size = size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def read(self, offset: int, size: int) -> bytes:
+        self.file.seek(self.start + offset)
+        return self.file.read(min(size, self.size - offset))
+
+
+class MultipartBody:
+    """
+    File-like `multipart/form-data` body streamed from files. Photos given
+    as paths or file objects are read in chunks while sending, so memory
+    use does not depend on their size. Body has known length, so it is
+    sent with Content-Length, and can be rewound with `seek(0)` to replay
+    the request.
+
+    Files opened from paths are closed by :meth:`close`.
+
+    Args:
+        files (Dict[str, Tuple[str, PhotoSource, str]]): Fields as in
+            `files` of `requests`: name to (file name, source, mimetype).
+    """
+
+    def __init__(self, files: Dict[str, Tuple[str, PhotoSource, str]]) -> None:
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self._opened: List[IO[bytes]] = []
+        self._parts: List[memoryview | _FilePart] = []
+        for name, (file_name, source, content_type) in files.items():
+            header = (
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="{name}"; '
+                f'filename="{file_name}"\r\n'
+                f"Content-Type: {content_type}\r\n\r\n"
+            )
+            self._parts.append(memoryview(header.encode()))
+            self._parts.append(self._part(source))
+            self._parts.append(memoryview(b"\r\n"))
+        self._parts.append(memoryview(f"--{boundary}--\r\n".encode()))
+        self._length = sum(len(part) for part in self._parts)
+        self._position = 0
+        self._index = 0
+        self._offset = 0
+
+    def _part(self, source: PhotoSource) -> memoryview | _FilePart:
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return memoryview(source)
+        if isinstance(source, (str, os.PathLike)):
+            file: IO[bytes] = open(source, "rb")  # pylint: disable=R1732
+            self._opened.append(file)
+        else:
+            file = source
+        start = file.tell()
+        size = file.seek(0, os.SEEK_END) - start
+        return _FilePart(file, start, size)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, position: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            position += self._position
+        elif whence == os.SEEK_END:
+            position += self._length
+        self._position = max(0, min(position, self._length))
+        # Find part containing new position
+        self._index, self._offset = 0, self._position
+        while self._index < len(self._parts) and self._offset >= len(
+            self._parts[self._index]
+        ):
+            self._offset -= len(self._parts[self._index])
+            self._index += 1
+        return self._position
+
+    def read(self, size: int | None = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._length - self._position
+        chunks = []
+        while size > 0 and self._index < len(self._parts):
+            part = self._parts[self._index]
+            if self._offset >= len(part):
+                self._index += 1
+                self._offset = 0
+                continue
+            if isinstance(part, _FilePart):
+                chunk = part.read(self._offset, min(size, CHUNK_SIZE))
+            else:
+                chunk = part[self._offset : self._offset + size].tobytes()
+            if not chunk:
+                # File got shorter than when body was created
+                raise OSError("Unexpected end of file")
+            chunks.append(chunk)
+            size -= len(chunk)
+            self._position += len(chunk)
+            self._offset += len(chunk)
+        return b"".join(chunks)
+
+    def close(self) -> None:
+        for file in self._opened:
+            file.close()
+        self._opened.clear()
@@ -0,0 +1,315 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Generic, Iterator, TypeVar
+
+from .connector import (
+    BaseWykopConnector,
+    Methods,
+    WykopConnector,
+    WykopConnectorException,
+    WykopResponse,
+)
+from .utils import token_expiry
+
+# Seconds for which member which answered with 429 is skipped
+DEFAULT_COOLDOWN = 30.0
+
+ConnectorT = TypeVar("ConnectorT", bound=BaseWykopConnector)
+
+
+@dataclass
+class PoolMemberStats:
+    """
+    - requests - number of requests routed to member
+    - in_flight - requests and page iterations in progress
+    - throttled - number of 429 responses
+    - cooldown - seconds left until member is used for reads again
+    - token_expires_at - expiry of current token, None if unknown
+    """
+
+    requests: int = 0
+    in_flight: int = 0
+    throttled: int = 0
+    cooldown: float = 0.0
+    token_expires_at: float | None = None
+
+
+class _Member(Generic[ConnectorT]):
+    def __init__(self, name: str, connector: ConnectorT) -> None:
+        self.name = name
+        self.connector = connector
+        self.requests = 0
+        self.in_flight = 0
+        self.throttled = 0
+        self.cooldown_until = 0.0
+
+
+class _BasePool(Generic[ConnectorT]):
+    """
+    Member selection shared by :class:`ConnectorPool` and
+    :class:`AsyncConnectorPool`.
+    """
+
+    def __init__(
+        self,
+        connectors: Dict[str, ConnectorT],
+        writer: str | None = None,
+        cooldown: float = DEFAULT_COOLDOWN,
+    ) -> None:
+        if not connectors:
+            raise WykopConnectorException("Pool needs at least one connector")
+        self._members = {
+            name: _Member(name, connector)
+            for name, connector in connectors.items()
+        }
+        self.writer = next(iter(connectors)) if writer is None else writer
+        self.member(self.writer)
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+
+    def member(self, name: str) -> ConnectorT:
+        """
+        Connector of credential `name`, e.g. to pin an API to it.
+        """
+        if name not in self._members:
+            raise WykopConnectorException(f"Unknown pool member: {name}")
+        return self._members[name].connector
+
+    def set_writer(self, name: str) -> None:
+        """
+        Send write requests with credential `name`.
+        """
+        self.member(name)
+        self.writer = name
+
+    @property
+    def token(self) -> str | None:
+        return self.member(self.writer).token
+
+    @staticmethod
+    def _is_read(method: Methods, files: Dict | None) -> bool:
+        return Methods(method) == Methods.GET and not files
+
+    def _acquire(
+        self, read: bool, exclude: frozenset = frozenset()
+    ) -> _Member[ConnectorT]:
+        """
+        Member which should send request: writer for writes, least loaded
+        member out of cooldown for reads.
+        """
+        with self._lock:
+            if read:
+                now = time.monotonic()
+                candidates = [
+                    member
+                    for name, member in self._members.items()
+                    if name not in exclude
+                ] or list(self._members.values())
+                member = min(
+                    candidates,
+                    key=lambda member: (
+                        member.cooldown_until > now,
+                        member.in_flight,
+                        member.requests,
+                    ),
+                )
+            else:
+                member = self._members[self.writer]
+            member.requests += 1
+            member.in_flight += 1
+            return member
+
+    def _release(self, member: _Member, res: WykopResponse | None) -> bool:
+        """
+        Finish request of `member`. Returns True if read should be retried
+        with other member after 429 response.
+        """
+        with self._lock:
+            member.in_flight -= 1
+            if res is None or res.code != 429:
+                return False
+            member.throttled += 1
+            member.cooldown_until = time.monotonic() + self.cooldown
+            now = time.monotonic()
+            return any(
+                other.cooldown_until <= now for other in self._members.values()
+            )
+
+    def stats(self) -> Dict[str, PoolMemberStats]:
+        """
+        Load and rate limit state per credential.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                name: PoolMemberStats(
+                    member.requests,
+                    member.in_flight,
+                    member.throttled,
+                    max(0.0, member.cooldown_until - now),
+                    (
+                        token_expiry(member.connector.token)
+                        if member.connector.token
+                        else None
+                    ),
+                )
+                for name, member in self._members.items()
+            }
+
+
+class ConnectorPool(_BasePool[WykopConnector]):
+    """
+    Connector spreading traffic over several credentials, each with its own
+    token and rate limiter. Can be used wherever :class:`WykopConnector`
+    is accepted, e.g. `WykopAPI(connector=pool)`.
+
+    Reads (GET requests) are routed to the least loaded member. Member
+    which answered with 429 is skipped for `cooldown` seconds and the
+    request is retried with another one. Paginated reads stay on one
+    member, as page cursors are bound to the session. Writes (POST, PUT,
+    DELETE and uploads), e.g. entries, votes and media, are always sent
+    with the `writer` credential.
+
+    Args:
+        connectors (Dict[str, WykopConnector]): Connectors by credential
+            name.
+        writer (str | None, optional): Name of credential used for writes.
+            Defaults to the first one.
+        cooldown (float, optional): Seconds for which throttled member is
+            not used for reads. Defaults to :data:`DEFAULT_COOLDOWN`.
+    """
+
+    def connect(self) -> str:
+        return self.member(self.writer).connect()
+
+    def close(self) -> None:
+        for member in self._members.values():
+            member.connector.close()
+
+    def __enter__(self) -> "ConnectorPool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def request(
+        self,
+        method: Methods,
+        endpoint: str,
+        data: Dict | None = None,
+        params: Dict | None = None,
+        timeout: int = 10,
+        files: Dict | None = None,
+    ) -> WykopResponse:
+        read = self._is_read(method, files)
+        tried: frozenset = frozenset()
+        while True:
+            member = self._acquire(read, tried)
+            res = None
+            try:
+                res = member.connector.request(
+                    method, endpoint, data, params, timeout, files
+                )
+            finally:
+                retry = self._release(member, res)
+            if not (read and retry) or member.name in tried:
+                return res
+            tried |= {member.name}
+
+    def request_with_pagination(
+        self, method: Methods, endpoint: str, *args, **kwargs
+    ) -> WykopResponse:
+        member = self._acquire(self._is_read(method, None))
+        res = None
+        try:
+            res = member.connector.request_with_pagination(
+                method, endpoint, *args, **kwargs
+            )
+            return res
+        finally:
+            self._release(member, res)
+
+    def iter_pages(
+        self, method: Methods, endpoint: str, *args, **kwargs
+    ) -> Iterator[WykopResponse]:
+        member = self._acquire(self._is_read(method, None))
+        res = None
+        try:
+            # Last response is kept, so 429 ending iteration is registered
+            for res in member.connector.iter_pages(  # pylint: disable=R1737
+                method, endpoint, *args, **kwargs
+            ):
+                yield res
+        finally:
+            self._release(member, res)
+
+
+class AsyncConnectorPool(_BasePool[Any]):
+    """
+    Asyncio version of :class:`ConnectorPool` for
+    :class:`pywykop3.aio.AsyncWykopConnector` members.
+    """
+
+    async def connect(self) -> str:
+        return await self.member(self.writer).connect()
+
+    async def close(self) -> None:
+        for member in self._members.values():
+            await member.connector.close()
+
+    async def __aenter__(self) -> "AsyncConnectorPool":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def request(
+        self,
+        method: Methods,
+        endpoint: str,
+        data: Dict | None = None,
+        params: Dict | None = None,
+        timeout: int = 10,
+        files: Dict | None = None,
+    ) -> WykopResponse:
+        read = self._is_read(method, files)
+        tried: frozenset = frozenset()
+        while True:
+            member = self._acquire(read, tried)
+            res = None
+            try:
+                res = await member.connector.request(
+                    method, endpoint, data, params, timeout, files
+                )
+            finally:
+                retry = self._release(member, res)
+            if not (read and retry) or member.name in tried:
+                return res
+            tried |= {member.name}
+
+    async def request_with_pagination(
+        self, method: Methods, endpoint: str, *args, **kwargs
+    ) -> WykopResponse:
+        member = self._acquire(self._is_read(method, None))
+        res = None
+        try:
+            res = await member.connector.request_with_pagination(
+                method, endpoint, *args, **kwargs
+            )
+            return res
+        finally:
+            self._release(member, res)
+
+    async def iter_pages(
+        self, method: Methods, endpoint: str, *args, **kwargs
+    ) -> AsyncIterator[WykopResponse]:
+        member = self._acquire(self._is_read(method, None))
+        res = None
+        try:
+            async for res in member.connector.iter_pages(
+                method, endpoint, *args, **kwargs
+            ):
+                yield res
+        finally:
+            self._release(member, res)
@@ -0,0 +1,261 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict
+
+
+@dataclass
+class Budget:
+    """
+    Request budget of endpoint group.
+
+    Args:
+        rate (float): Requests per second.
+        burst (float, optional): Number of requests which can be sent at
+            once after idle period. Defaults to 1.
+    """
+
+    rate: float
+    burst: float = 1
+
+
+@dataclass
+class RateLimitStats:
+    """
+    Queueing metrics of endpoint group.
+
+    - requests - number of requests which passed the limiter
+    - delayed - number of requests which had to wait
+    - waiting - number of requests waiting right now
+    - wait_time - total time spent waiting, in seconds
+    - max_wait - longest single wait, in seconds
+    - throttled - number of 429 responses
+    - current_rate - rate after adaptive backoff, requests per second
+    """
+
+    requests: int = 0
+    delayed: int = 0
+    waiting: int = 0
+    wait_time: float = 0.0
+    max_wait: float = 0.0
+    throttled: int = 0
+    current_rate: float = 0.0
+
+
+class TokenBucket:
+    """
+    Thread safe token bucket. Tokens are reserved up front, so concurrent
+    callers are queued in order of :meth:`reserve` calls.
+    """
+
+    def __init__(self, rate: float, burst: float = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def reserve(self) -> float:
+        """
+        Take one token.
+
+        Returns:
+            float: Number of seconds caller has to wait before sending.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse Retry-After header, given in seconds or as HTTP date.
+
+    Returns:
+        float | None: Delay in seconds, None if header is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:  # pylint: disable=too-many-instance-attributes
+    """
+    Client side rate limiter used by :class:`WykopConnector`.
+
+    Endpoints are grouped by their first path segment (`tags`, `entries`,
+    `media`, `users`, ...). Every group listed in `budgets` has its own
+    token bucket, other endpoints share the `default` budget. Groups not
+    limited by any budget are not delayed.
+
+    When server responds with 429, the group is paused for `Retry-After`
+    seconds, or with exponential backoff if the header is missing, and its
+    rate is halved. Rate recovers slowly with every successful request.
+
+    Args:
+        budgets (Dict[str, Budget] | None, optional): Budgets per endpoint
+            group, e.g. {"media": Budget(0.2, burst=2)}. Defaults to None.
+        default (Budget | None, optional): Budget of other endpoints.
+            Defaults to None (not limited).
+        max_retries (int, optional): Number of retries after 429 response.
+            Defaults to 3.
+        backoff (float, optional): First backoff delay in seconds, used when
+            response has no `Retry-After` header. Defaults to 1.
+        max_backoff (float, optional): Maximal backoff delay in seconds.
+            Defaults to 60.
+    """
+
+    DEFAULT_GROUP = "default"
+
+    def __init__(
+        self,
+        budgets: Dict[str, Budget] | None = None,
+        default: Budget | None = None,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ) -> None:
+        self.budgets = dict(budgets or {})
+        if default:
+            self.budgets[self.DEFAULT_GROUP] = default
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._buckets = {
+            group: TokenBucket(budget.rate, budget.burst)
+            for group, budget in self.budgets.items()
+        }
+        self._paused_until: Dict[str, float] = {}
+        self._stats: Dict[str, RateLimitStats] = {}
+        self._lock = threading.Lock()
+
+    def group(self, endpoint: str) -> str:
+        group = endpoint.lstrip("/").split("/", 1)[0]
+        return group if group in self.budgets else self.DEFAULT_GROUP
+
+    def _group_stats(self, group: str) -> RateLimitStats:
+        if group not in self._stats:
+            self._stats[group] = RateLimitStats()
+        return self._stats[group]
+
+    def _reserve(self, group: str) -> float:
+        bucket = self._buckets.get(group)
+        delay = bucket.reserve() if bucket else 0.0
+        with self._lock:
+            paused = self._paused_until.get(group, 0.0) - time.monotonic()
+            delay = max(delay, paused)
+            stats = self._group_stats(group)
+            stats.requests += 1
+            if delay > 0:
+                stats.delayed += 1
+                stats.waiting += 1
+                stats.wait_time += delay
+                stats.max_wait = max(stats.max_wait, delay)
+        return delay
+
+    def _done_waiting(self, group: str) -> None:
+        with self._lock:
+            self._group_stats(group).waiting -= 1
+
+    def acquire(self, endpoint: str) -> None:
+        """
+        Block until request to `endpoint` fits in its budget.
+        """
+        group = self.group(endpoint)
+        delay = self._reserve(group)
+        if delay > 0:
+            try:
+                time.sleep(delay)
+            finally:
+                self._done_waiting(group)
+
+    async def acquire_async(self, endpoint: str) -> None:
+        """
+        Async version of :meth:`acquire`.
+        """
+        group = self.group(endpoint)
+        delay = self._reserve(group)
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self._done_waiting(group)
+
+    def throttled(
+        self, endpoint: str, retry_after: str | None, attempt: int
+    ) -> bool:
+        """
+        Register 429 response. Pauses group of `endpoint` and lowers its
+        rate.
+
+        Args:
+            endpoint (str): Endpoint of throttled request
+            retry_after (str | None): Value of `Retry-After` header
+            attempt (int): Number of retries done so far
+
+        Returns:
+            bool: True if request should be retried.
+        """
+        group = self.group(endpoint)
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = min(self.max_backoff, self.backoff * 2**attempt)
+        with self._lock:
+            self._group_stats(group).throttled += 1
+            self._paused_until[group] = max(
+                self._paused_until.get(group, 0.0), time.monotonic() + delay
+            )
+        bucket = self._buckets.get(group)
+        if bucket is not None:
+            bucket.rate = max(bucket.rate / 2, self.budgets[group].rate / 16)
+        return attempt < self.max_retries
+
+    def succeeded(self, endpoint: str) -> None:
+        """
+        Register successful response, rate slowly recovers after 429.
+        """
+        bucket = self._buckets.get(self.group(endpoint))
+        if bucket is None:
+            return
+        target = self.budgets[self.group(endpoint)].rate
+        if bucket.rate < target:
+            bucket.rate = min(target, bucket.rate + target / 20)
+
+    def stats(self) -> Dict[str, RateLimitStats]:
+        """
+        Queueing metrics per endpoint group.
+        """
+        with self._lock:
+            result = {}
+            for group, stats in self._stats.items():
+                bucket = self._buckets.get(group)
+                result[group] = RateLimitStats(
+                    **{
+                        **stats.__dict__,
+                        "current_rate": bucket.rate if bucket else 0.0,
+                    }
+                )
+            return result
@@ -0,0 +1,235 @@
+import math
+import statistics
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, tzinfo
+from typing import Any, Callable, Deque, Dict, Iterator, List, Tuple
+from zoneinfo import ZoneInfo
+
+from .utils import field_of
+from .watcher import DATE_FORMAT, TagPoll, TagWatcher
+
+# Time zone of `created_at` of Wykop API
+WYKOP_TIMEZONE = "Europe/Warsaw"
+
+
+@dataclass
+class TagSchedule:  # pylint: disable=too-many-instance-attributes
+    """
+    Polling state of a tag.
+
+    - rate - estimated new items per second
+    - cost - estimated requests per poll
+    - interval - current polling interval in seconds
+    - next_poll - time of the next poll
+    - polls, new_items - totals since start
+    - lags - recent detection lags in seconds: time between creation of
+      item and its detection
+    """
+
+    rate: float
+    cost: float = 1.0
+    interval: float = 0.0
+    next_poll: float = 0.0
+    last_poll: float | None = None
+    polls: int = 0
+    new_items: int = 0
+    lags: Deque[float] = field(default_factory=lambda: deque(maxlen=100))
+
+    @property
+    def median_lag(self) -> float | None:
+        return statistics.median(self.lags) if self.lags else None
+
+
+class TagScheduler:  # pylint: disable=too-many-instance-attributes
+    """
+    Adaptive polling of many tags with :class:`TagWatcher`, keeping
+    requests inside a global budget.
+
+    Arrival rate of every tag is learned from creation dates of the first
+    fetched page and from numbers of new items found by later polls
+    (exponentially weighted). Polling intervals are allocated to minimize
+    mean detection lag for the budget: interval of a tag is proportional
+    to sqrt(cost / rate), so hot tags are polled often and dead tags
+    rarely, bounded by `min_interval` and `max_interval`. Unused budget
+    accumulates up to `budget * min_interval` requests; tags due when it
+    is spent wait, most overdue are polled first.
+
+    Args:
+        watcher (TagWatcher): Watcher of polled tags.
+        budget (float, optional): Requests per second spent on polling.
+            Defaults to 1.
+        min_interval (float, optional): Shortest interval, in seconds.
+            Defaults to 30.
+        max_interval (float, optional): Longest interval, in seconds.
+            Defaults to 3600.
+        prior_rate (float, optional): Rate of tags without history, in
+            items per second. Defaults to one item per hour.
+        smoothing (float, optional): Weight of the last poll in rate
+            estimate. Defaults to 0.3.
+        clock (Callable[[], float], optional): Current UNIX time.
+            Defaults to :func:`time.time`.
+        timezone (tzinfo | None, optional): Time zone of `created_at`.
+            Defaults to Europe/Warsaw.
+
+    Raises:
+        ValueError: `budget` is not positive.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        watcher: TagWatcher,
+        budget: float = 1.0,
+        min_interval: float = 30.0,
+        max_interval: float = 3600.0,
+        prior_rate: float = 1 / 3600,
+        smoothing: float = 0.3,
+        clock: Callable[[], float] = time.time,
+        timezone: tzinfo | None = None,
+    ) -> None:
+        if budget <= 0:
+            raise ValueError(f"Budget has to be positive, got {budget}")
+        self.watcher = watcher
+        self.budget = budget
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.prior_rate = prior_rate
+        self.smoothing = smoothing
+        self.clock = clock
+        self.timezone = timezone or ZoneInfo(WYKOP_TIMEZONE)
+        self.schedules: Dict[str, TagSchedule] = {
+            tag: TagSchedule(prior_rate) for tag in watcher.tags
+        }
+        # Unused budget in requests, capped to budget of `min_interval`
+        self.burst = max(1.0, budget * min_interval)
+        self._credit = self.burst
+        self._updated = clock()
+
+    def _timestamp(self, created_at: str | None) -> float | None:
+        if not created_at:
+            return None
+        date = datetime.strptime(created_at, DATE_FORMAT)
+        return date.replace(tzinfo=self.timezone).timestamp()
+
+    def _learn(
+        self, schedule: TagSchedule, result: TagPoll, now: float
+    ) -> None:
+        if result.initial:
+            dates = [
+                self._timestamp(field_of(item, "created_at"))
+                for item in result.fetched
+            ]
+            dates = [date for date in dates if date is not None]
+            if len(dates) > 1 and max(dates) > min(dates):
+                schedule.rate = (len(dates) - 1) / (max(dates) - min(dates))
+        elif schedule.last_poll is not None:
+            elapsed = max(now - schedule.last_poll, 1e-3)
+            observed = len(result.items) / elapsed
+            schedule.rate += self.smoothing * (observed - schedule.rate)
+        schedule.cost += self.smoothing * (result.requests - schedule.cost)
+        for item in result.items:
+            created = self._timestamp(field_of(item, "created_at"))
+            if created is not None:
+                schedule.lags.append(max(0.0, now - created))
+        schedule.last_poll = now
+        schedule.polls += 1
+        schedule.new_items += len(result.items)
+
+    def _allocate(self) -> None:
+        """
+        Set intervals minimizing sum of rate * interval under the budget.
+        Tags which hit bounds are fixed and the rest of budget is split
+        between the others.
+        """
+        weights = {
+            tag: (
+                max(schedule.rate, 1e-9),
+                max(schedule.cost, 1.0),
+            )
+            for tag, schedule in self.schedules.items()
+        }
+        fixed: Dict[str, float] = {}
+        scale = math.inf
+        for _ in range(len(weights) + 1):
+            free = {tag: w for tag, w in weights.items() if tag not in fixed}
+            remaining = self.budget - sum(
+                weights[tag][1] / interval for tag, interval in fixed.items()
+            )
+            total = sum(math.sqrt(rate * cost) for rate, cost in free.values())
+            scale = total / remaining if remaining > 0 else math.inf
+            clamped = False
+            for tag, (rate, cost) in free.items():
+                interval = scale * math.sqrt(cost / rate)
+                if interval < self.min_interval:
+                    fixed[tag] = self.min_interval
+                    clamped = True
+                elif interval > self.max_interval:
+                    fixed[tag] = self.max_interval
+                    clamped = True
+            if not clamped:
+                break
+        for tag, (rate, cost) in weights.items():
+            interval = fixed.get(tag, scale * math.sqrt(cost / rate))
+            schedule = self.schedules[tag]
+            schedule.interval = min(
+                max(interval, self.min_interval), self.max_interval
+            )
+            if schedule.last_poll is not None:
+                schedule.next_poll = schedule.last_poll + schedule.interval
+
+    def run_once(self) -> List[Tuple[str, Any]]:
+        """
+        Poll due tags within the budget, most overdue first. Returns new
+        (tag, item) pairs.
+        """
+        now = self.clock()
+        self._credit = min(
+            self.burst,
+            self._credit + (now - self._updated) * self.budget,
+        )
+        self._updated = now
+        due = sorted(
+            (schedule.next_poll, tag)
+            for tag, schedule in self.schedules.items()
+            if schedule.next_poll <= now
+        )
+        found: List[Tuple[str, Any]] = []
+        for _, tag in due:
+            # Poll may overdraw credit, debt delays the next polls
+            if self._credit < 1:
+                break
+            schedule = self.schedules[tag]
+            result = self.watcher.check_tag(tag)
+            self._credit -= result.requests
+            self._learn(schedule, result, self.clock())
+            found.extend((tag, item) for item in result.items)
+        if due:
+            self._allocate()
+        return found
+
+    def next_wakeup(self) -> float:
+        """
+        Time of the next poll, delayed when the budget is spent.
+        """
+        next_poll = min(
+            schedule.next_poll for schedule in self.schedules.values()
+        )
+        refill = (1 - self._credit) / self.budget if self._credit < 1 else 0
+        return max(next_poll, self._updated + refill)
+
+    def watch(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Poll forever, yielding (tag, item) pairs.
+        """
+        while True:
+            yield from self.run_once()
+            time.sleep(max(0.0, self.next_wakeup() - self.clock()))
+
+    def lags(self) -> Dict[str, float | None]:
+        """
+        Median detection lag per tag, in seconds.
+        """
+        return {
+            tag: schedule.median_lag for tag, schedule in self.schedules.items()
+        }
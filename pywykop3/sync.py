@@ -0,0 +1,488 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .api import WykopAPI
+from .connector import PageIterator, WykopResponse
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    resource TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    author TEXT,
+    created_at TEXT,
+    votes_up INTEGER,
+    votes_down INTEGER,
+    comments_count INTEGER,
+    data TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (resource, id)
+);
+CREATE INDEX IF NOT EXISTS entries_author ON entries (author);
+CREATE INDEX IF NOT EXISTS entries_created_at ON entries (created_at);
+CREATE TABLE IF NOT EXISTS entry_tags (
+    tag TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    PRIMARY KEY (tag, resource, id)
+);
+CREATE TABLE IF NOT EXISTS comments (
+    id INTEGER PRIMARY KEY,
+    entry_id INTEGER NOT NULL,
+    author TEXT,
+    created_at TEXT,
+    votes_up INTEGER,
+    votes_down INTEGER,
+    data TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS comments_entry_id ON comments (entry_id);
+CREATE INDEX IF NOT EXISTS comments_author ON comments (author);
+CREATE INDEX IF NOT EXISTS comments_created_at ON comments (created_at);
+CREATE TABLE IF NOT EXISTS cursors (
+    source TEXT PRIMARY KEY,
+    page TEXT,
+    finished INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL,
+    mark TEXT,
+    top TEXT
+);
+"""
+
+# Columns added to `cursors` after its first version
+CURSOR_MIGRATIONS = {"mark": "TEXT", "top": "TEXT"}
+
+UPSERT_ENTRY = """
+INSERT INTO entries (resource, id, author, created_at, votes_up, votes_down,
+    comments_count, data, synced_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (resource, id) DO UPDATE SET
+    author = excluded.author,
+    created_at = excluded.created_at,
+    votes_up = excluded.votes_up,
+    votes_down = excluded.votes_down,
+    comments_count = excluded.comments_count,
+    data = excluded.data,
+    synced_at = excluded.synced_at
+"""
+
+UPSERT_COMMENT = """
+INSERT INTO comments (id, entry_id, author, created_at, votes_up, votes_down,
+    data, synced_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    author = excluded.author,
+    votes_up = excluded.votes_up,
+    votes_down = excluded.votes_down,
+    data = excluded.data,
+    synced_at = excluded.synced_at
+"""
+
+
+# Newest item of a stream: {"resource": ..., "id": ..., "created_at": ...}
+Mark = Dict[str, Any]
+
+
+def _mark(item: Dict) -> Mark:
+    return {
+        "resource": item.get("resource") or "entry",
+        "id": item["id"],
+        "created_at": item.get("created_at"),
+    }
+
+
+def _check_raw(items: List) -> None:
+    if any(not isinstance(item, dict) for item in items):
+        raise TypeError(
+            "SqliteStore stores raw dicts, not models. Use raw pages, e.g."
+            " PageIterator.pages()"
+        )
+
+
+def _author(item: Dict) -> str | None:
+    return (item.get("author") or {}).get("username")
+
+
+def _votes(item: Dict) -> Tuple[int, int]:
+    votes = item.get("votes") or {}
+    return votes.get("up", 0), votes.get("down", 0)
+
+
+class SqliteStore:
+    """
+    Local SQLite mirror of entries, links and comments. Raw items are kept
+    in `data` column as JSON, commonly queried fields in indexed columns.
+
+    Items of a page and pagination cursor of its source are written in a
+    single transaction, so after a crash sync resumes from the last
+    stored page.
+
+    Args:
+        path (str | Path): Database file, ":memory:" for in-memory one.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = path
+        self.connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.executescript(SCHEMA)
+            columns = {
+                row[1]
+                for row in self.connection.execute("PRAGMA table_info(cursors)")
+            }
+            for column, column_type in CURSOR_MIGRATIONS.items():
+                if column not in columns:
+                    self.connection.execute(
+                        f"ALTER TABLE cursors ADD COLUMN {column} {column_type}"
+                    )
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def get_cursor(self, source: str) -> Tuple[int | str | None, bool] | None:
+        """
+        Stored page and finished flag of `source`, None if source was
+        never synced.
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT page, finished FROM cursors WHERE source = ?",
+                (source,),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), bool(row[1])
+
+    def get_marks(self, source: str) -> Tuple[Mark | None, Mark | None]:
+        """
+        Marks of newest-first `source`: high-water mark (newest item of
+        the last finished pass) and newest item of the pass in progress.
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT mark, top FROM cursors WHERE source = ?", (source,)
+            ).fetchone()
+        if row is None:
+            return None, None
+        return (
+            json.loads(row[0]) if row[0] else None,
+            json.loads(row[1]) if row[1] else None,
+        )
+
+    def _set_cursor(  # pylint: disable=too-many-arguments
+        self,
+        source: str,
+        page: int | str | None,
+        finished: bool,
+        mark: Mark | None = None,
+        top: Mark | None = None,
+    ) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO cursors"
+            " (source, page, finished, updated_at, mark, top)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                source,
+                json.dumps(page),
+                int(finished),
+                time.time(),
+                json.dumps(mark) if mark else None,
+                json.dumps(top) if top else None,
+            ),
+        )
+
+    def set_cursor(  # pylint: disable=too-many-arguments
+        self,
+        source: str,
+        page: int | str | None,
+        finished: bool,
+        mark: Mark | None = None,
+        top: Mark | None = None,
+    ) -> None:
+        with self._lock, self.connection:
+            self._set_cursor(source, page, finished, mark, top)
+
+    def known_entries(self, keys: Iterable[Tuple[str, int]]) -> int:
+        """
+        Number of (resource, id) `keys` already stored.
+        """
+        keys = list(keys)
+        if not keys:
+            return 0
+        condition = " OR ".join(["(resource = ? AND id = ?)"] * len(keys))
+        with self._lock:
+            return self.connection.execute(
+                f"SELECT COUNT(*) FROM entries WHERE {condition}",
+                [value for key in keys for value in key],
+            ).fetchone()[0]
+
+    def store_entries(
+        self,
+        items: List[Dict],
+        tag: str | None = None,
+        cursor: Tuple | None = None,
+    ) -> None:
+        """
+        Upsert entries and links, given as raw dicts, optionally linking
+        them with `tag` and storing `cursor` (arguments of
+        :meth:`set_cursor`) in the same transaction.
+        """
+        _check_raw(items)
+        now = time.time()
+        rows = [
+            (
+                item.get("resource") or "entry",
+                item["id"],
+                _author(item),
+                item.get("created_at"),
+                *_votes(item),
+                (item.get("comments") or {}).get("count", 0),
+                json.dumps(item, ensure_ascii=False),
+                now,
+            )
+            for item in items
+        ]
+        with self._lock, self.connection:
+            self.connection.executemany(UPSERT_ENTRY, rows)
+            if tag is not None:
+                self.connection.executemany(
+                    "INSERT OR IGNORE INTO entry_tags VALUES (?, ?, ?)",
+                    [(tag, row[0], row[1]) for row in rows],
+                )
+            if cursor is not None:
+                self._set_cursor(*cursor)
+
+    def store_comments(
+        self,
+        entry_id: int,
+        items: List[Dict],
+        cursor: Tuple | None = None,
+    ) -> None:
+        """
+        Upsert comments of entry, given as raw dicts, optionally storing
+        `cursor` (arguments of :meth:`set_cursor`) in the same transaction.
+        """
+        _check_raw(items)
+        now = time.time()
+        rows = [
+            (
+                item["id"],
+                entry_id,
+                _author(item),
+                item.get("created_at"),
+                *_votes(item),
+                json.dumps(item, ensure_ascii=False),
+                now,
+            )
+            for item in items
+        ]
+        with self._lock, self.connection:
+            self.connection.executemany(UPSERT_COMMENT, rows)
+            if cursor is not None:
+                self._set_cursor(*cursor)
+
+    def comment_count(self, entry_id: int) -> int:
+        with self._lock:
+            return self.connection.execute(
+                "SELECT COUNT(*) FROM comments WHERE entry_id = ?",
+                (entry_id,),
+            ).fetchone()[0]
+
+    def query(self, sql: str, params: Tuple | Dict = ()) -> List[Tuple]:
+        """
+        Run read-only query, e.g. for local analytics.
+        """
+        with self._lock:
+            return self.connection.execute(sql, params).fetchall()
+
+
+class Mirror:
+    """
+    Resumable incremental sync of tags, entries and comments to
+    :class:`SqliteStore`.
+
+    Every source (`tag:<name>`, `entries:<sort>`, `comments:<entry id>`)
+    has stored pagination cursor. Interrupted sync resumes from the last
+    stored page. Once a newest-first stream (tag, entries) was fully
+    synced, its newest item is stored as high-water mark and next syncs
+    fetch pages from the top until the mark (or an older item) is
+    reached. Interrupted or limited catch-up resumes from its stored page,
+    and the mark moves only when the catch-up is finished, so no item
+    between the top and the mark is skipped. Comments are ordered oldest
+    first, so their sync resumes from the last page.
+
+    Raw pages are read, so API created with `use_models=True` can be used
+    as well.
+
+    Args:
+        api (WykopAPI): API used to fetch data.
+        store (SqliteStore): Local store.
+    """
+
+    def __init__(self, api: WykopAPI, store: SqliteStore) -> None:
+        self.api = api
+        self.store = store
+
+    def sync_tag(
+        self,
+        tag: str,
+        type_of_content: str = "all",
+        max_pages: int = -1,
+        with_comments: bool = False,
+    ) -> int:
+        """
+        Sync tag stream, returns number of stored items.
+
+        Args:
+            tag (str): Tag name.
+            type_of_content (str, optional): "all", "entry" or "link".
+                Defaults to "all".
+            max_pages (int, optional): Limit of pages fetched in this call,
+                -1 for no limit. Defaults to -1.
+            with_comments (bool, optional): Also sync comments of entries
+                with new comments. Defaults to False.
+        """
+
+        def stream(page: int | str | None) -> PageIterator:
+            return self.api.iter_tag_stream(
+                tag,
+                page=page,
+                sort="all",
+                type_of_content=type_of_content,
+                page_count=max_pages,
+            )
+
+        return self._sync_newest_first(f"tag:{tag}", stream, tag, with_comments)
+
+    def sync_entries(
+        self,
+        sort: str = "newest",
+        max_pages: int = -1,
+        with_comments: bool = False,
+    ) -> int:
+        """
+        Sync mikroblog entries, returns number of stored entries. See
+        :meth:`sync_tag` for arguments.
+        """
+
+        def stream(page: int | str | None) -> PageIterator:
+            return self.api.iter_entries(
+                sort=sort, page=page, page_count=max_pages
+            )
+
+        return self._sync_newest_first(
+            f"entries:{sort}", stream, None, with_comments
+        )
+
+    def sync_comments(self, entry_id: int, max_pages: int = -1) -> int:
+        """
+        Sync comments of entry, returns number of stored comments.
+        """
+        source = f"comments:{entry_id}"
+        stored = self.store.get_cursor(source)
+        stream = self.api.iter_entry_comments(
+            entry_id,
+            page=stored[0] if stored else 1,  # type: ignore
+            page_count=max_pages,
+        )
+        # New comments are appended to the last non-empty page
+        last_page = stored[0] if stored else 1
+        count = 0
+        for res in stream.pages():
+            self.store.store_comments(
+                entry_id, res.data, (source, res.next, False)  # type: ignore
+            )
+            count += len(res.data)
+            if res.data:
+                last_page = res.page
+            if self._is_last(res):
+                self.store.set_cursor(source, last_page, True)
+        return count
+
+    def _sync_newest_first(
+        self,
+        source: str,
+        stream: Any,
+        tag: str | None,
+        with_comments: bool,
+    ) -> int:
+        page, mark, top = self._start(source)
+        pages = stream(page)
+        count = 0
+        try:
+            for res in pages.pages():
+                items: List[Dict] = res.data  # type: ignore
+                if top is None and items:
+                    top = _mark(items[0])
+                reached = mark is not None and self._reached(items, mark)
+                if reached or self._is_last(res):
+                    cursor = (source, None, True, top or mark, None)
+                else:
+                    cursor = (source, res.next, False, mark, top)
+                self.store.store_entries(items, tag, cursor)
+                count += len(items)
+                if with_comments:
+                    for entry_id in self._changed_comments(items):
+                        self.sync_comments(entry_id)
+                if reached:
+                    return count
+        finally:
+            pages.close()
+        return count
+
+    def _start(
+        self, source: str
+    ) -> Tuple[int | str | None, Mark | None, Mark | None]:
+        """
+        Page, high-water mark and top of pass of newest-first `source`.
+        """
+        stored = self.store.get_cursor(source)
+        mark, top = self.store.get_marks(source)
+        if stored is None:
+            return None, None, None
+        if stored[1]:
+            # New pass from the top, up to the high-water mark
+            return None, mark, None
+        return stored[0], mark, top
+
+    @staticmethod
+    def _reached(items: List[Dict], mark: Mark) -> bool:
+        """
+        Page contains the mark or items older than it (mark was deleted).
+        """
+        for item in items:
+            if (item.get("resource") or "entry", item["id"]) == (
+                mark["resource"],
+                mark["id"],
+            ):
+                return True
+            created_at = item.get("created_at")
+            if (
+                created_at
+                and mark["created_at"]
+                and created_at < mark["created_at"]
+            ):
+                return True
+        return False
+
+    @staticmethod
+    def _is_last(res: WykopResponse) -> bool:
+        return not res.data or res.next == res.page
+
+    def _changed_comments(self, items: List[Dict]) -> List[int]:
+        """
+        IDs of entries among `items` with more comments than stored.
+        """
+        changed = []
+        for item in items:
+            if (item.get("resource") or "entry") != "entry":
+                continue
+            count = (item.get("comments") or {}).get("count", 0)
+            if count and self.store.comment_count(item["id"]) < count:
+                changed.append(item["id"])
+        return changed
@@ -0,0 +1,4 @@
+from .factories import make_api
+from .fake_wykop import FakeWykop
+from .mock_server import MockRequest, MockWykopServer
+from .payloads import make_comment, make_entry, make_user
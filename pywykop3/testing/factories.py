@@ -0,0 +1,26 @@
+from ..api import WykopAPI
+from ..connector import WykopConnector
+from ..media_cache import MediaCache
+from .mock_server import MockWykopServer
+
+
+def make_api(
+    server: MockWykopServer,
+    logged_in: bool = False,
+    use_models: bool = False,
+    media_cache: MediaCache | None = None,
+    **kwargs,
+) -> WykopAPI:
+    """
+    :class:`WykopAPI` of local `server`, authenticated with key and secret,
+    or with refresh token when `logged_in`. `kwargs` are passed to
+    :class:`WykopConnector`, e.g. `cache` or `transport`.
+    """
+    if logged_in:
+        credentials = {"refresh_token": "refresh"}
+    else:
+        credentials = {"key": "key", "secret": "secret"}
+    connector = WykopConnector(url=server.url, **{**credentials, **kwargs})
+    return WykopAPI(
+        connector=connector, use_models=use_models, media_cache=media_cache
+    )
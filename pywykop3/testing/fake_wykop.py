@@ -0,0 +1,318 @@
+import base64
+import threading
+from typing import Callable, Dict, List, Tuple
+
+from .mock_server import MockRequest, MockWykopServer
+from .payloads import make_comment, make_entry, make_user
+
+ANONYMOUS_TOKEN = "anon-token"
+USER_TOKEN = "user-token"
+
+NOT_FOUND = 404, {"error": {"code": 404, "message": "Not found"}}
+
+
+def _cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(f"offset:{offset}".encode()).decode()
+
+
+def _offset(cursor: str) -> int:
+    return int(base64.urlsafe_b64decode(cursor.encode()).decode()[7:])
+
+
+class FakeWykop:  # pylint: disable=too-many-instance-attributes
+    """
+    In-memory stand-in of Wykop API v3 implementing routes used by
+    :class:`pywykop3.api.WykopAPI`, to be served by
+    :class:`MockWykopServer`.
+
+    Sessions authenticated with key and secret get numeric pagination,
+    sessions authenticated with refresh token get hash cursors, as in
+    real API. Entries are generated on demand with realistic payloads.
+
+    Args:
+        entry_count (int, optional): Number of existing entries, with IDs
+            from 1. Defaults to 10000.
+        stream_size (int, optional): Number of items of every tag stream.
+            Defaults to 500.
+        per_page (int, optional): Items per page. Defaults to 25.
+    """
+
+    def __init__(
+        self,
+        entry_count: int = 10_000,
+        stream_size: int = 500,
+        per_page: int = 25,
+    ) -> None:
+        self.entry_count = entry_count
+        self.stream_size = stream_size
+        self.per_page = per_page
+        self.entries: Dict[int, Dict] = {}
+        self.deleted: set = set()
+        self.photos: Dict[str, Dict] = {}
+        self.uploaded_bytes = 0
+        self.uploads = 0
+        self._lock = threading.Lock()
+
+    def server(self, latency: float = 0.0) -> MockWykopServer:
+        return MockWykopServer(self.routes(), latency=latency)
+
+    def routes(self) -> Dict:
+        return {
+            ("POST", "auth"): self.auth,
+            ("POST", "refresh-token"): self.refresh_token,
+            ("GET", "users/autocomplete"): self.users_autocomplete,
+            ("GET", "tags/autocomplete"): self.tags_autocomplete,
+            ("GET", "tags/popular"): self.tags_popular,
+            ("GET", "tags/popular-user-tags"): self.tags_popular,
+            ("GET", "tags/{tag}"): self.tag,
+            ("PUT", "tags/{tag}"): self.no_content,
+            ("GET", "tags/{tag}/related"): self.tags_popular,
+            ("GET", "tags/{tag}/stream"): self.stream,
+            ("GET", "tags/{tag}/newer"): self.newer,
+            ("GET", "tags/{tag}/users"): self.users,
+            ("POST", "tags/{tag}/users/{username}"): self.no_content,
+            ("DELETE", "tags/{tag}/users/{username}"): self.no_content,
+            ("GET", "entries"): self.stream,
+            ("POST", "entries"): self.post_entry,
+            ("GET", "entries/{id}"): self.entry,
+            ("PUT", "entries/{id}"): self.put_entry,
+            ("DELETE", "entries/{id}"): self.delete_entry,
+            ("GET", "entries/{id}/votes"): self.votes,
+            ("POST", "entries/{id}/votes"): self.no_content,
+            ("DELETE", "entries/{id}/votes"): self.no_content,
+            ("GET", "entries/{id}/newer"): self.newer,
+            ("GET", "entries/{id}/comments"): self.comments,
+            ("POST", "entries/{id}/comments"): self.post_comment,
+            ("GET", "entries/{id}/comments/{comment_id}"): self.comment,
+            ("PUT", "entries/{id}/comments/{comment_id}"): self.comment,
+            ("DELETE", "entries/{id}/comments/{comment_id}"): self.no_content,
+            ("GET", "entries/{id}/comments/{comment_id}/votes"): self.votes,
+            ("POST", "entries/{id}/comments/{comment_id}/votes"): (
+                self.no_content
+            ),
+            ("DELETE", "entries/{id}/comments/{comment_id}/votes"): (
+                self.no_content
+            ),
+            ("POST", "media/photos/upload"): self.upload,
+            ("POST", "media/photos"): self.upload,
+            ("DELETE", "media/photos/{key}"): self.delete_photo,
+        }
+
+    # Auth
+
+    @staticmethod
+    def auth(_: MockRequest) -> Tuple[int, Dict]:
+        return 200, {"data": {"token": ANONYMOUS_TOKEN}}
+
+    @staticmethod
+    def refresh_token(_: MockRequest) -> Tuple[int, Dict]:
+        return 200, {
+            "data": {"token": USER_TOKEN, "refresh_token": "fake-refresh"}
+        }
+
+    @staticmethod
+    def no_content(_: MockRequest) -> Tuple[int, None]:
+        return 204, None
+
+    # Pagination
+
+    def _page(
+        self,
+        request: MockRequest,
+        total: int,
+        items: Callable[[int, int], List],
+    ) -> Tuple[int, Dict]:
+        """
+        Page of `total` items, numeric for anonymous sessions and hash
+        cursor for logged in ones. `items(start, stop)` generates only the
+        requested slice.
+        """
+        logged_in = USER_TOKEN in request.headers.get("Authorization", "")
+        page = request.query.get("page")
+        if not page:
+            offset = 0
+        elif page.isdigit():
+            # First page may be requested with a number in both modes
+            offset = (int(page) - 1) * self.per_page
+        else:
+            offset = _offset(page)
+        stop = min(offset + self.per_page, total)
+        data = items(offset, stop) if offset < stop else []
+        pagination: Dict = {"per_page": self.per_page}
+        if logged_in:
+            if stop < total:
+                pagination["next"] = _cursor(stop)
+            if offset:
+                pagination["prev"] = _cursor(offset - self.per_page)
+        else:
+            pagination["total"] = total
+        return 200, {"data": data, "pagination": pagination}
+
+    # Entries
+
+    def _get_entry(self, entry_id: int) -> Dict | None:
+        if entry_id in self.deleted:
+            return None
+        if entry_id in self.entries:
+            return self.entries[entry_id]
+        if 1 <= entry_id <= self.entry_count:
+            return make_entry(entry_id)
+        return None
+
+    def stream(self, request: MockRequest) -> Tuple[int, Dict]:
+        return self._page(
+            request,
+            self.stream_size,
+            lambda start, stop: [make_entry(i + 1) for i in range(start, stop)],
+        )
+
+    def entry(self, request: MockRequest) -> Tuple[int, Dict]:
+        entry = self._get_entry(int(request.path_params["id"]))
+        if entry is None:
+            return NOT_FOUND
+        return 200, {"data": entry}
+
+    def post_entry(self, request: MockRequest) -> Tuple[int, Dict]:
+        with self._lock:
+            entry_id = self.entry_count + len(self.entries) + 1
+            entry = make_entry(entry_id)
+            entry.update(request.json().get("data", {}))
+            self.entries[entry_id] = entry
+        return 200, {"data": entry}
+
+    def put_entry(self, request: MockRequest) -> Tuple[int, Dict]:
+        entry_id = int(request.path_params["id"])
+        entry = self._get_entry(entry_id)
+        if entry is None:
+            return NOT_FOUND
+        entry = {**entry, **request.json().get("data", {})}
+        self.entries[entry_id] = entry
+        return 200, {"data": entry}
+
+    def delete_entry(self, request: MockRequest) -> Tuple[int, None]:
+        entry_id = int(request.path_params["id"])
+        if self._get_entry(entry_id) is None:
+            return NOT_FOUND
+        self.deleted.add(entry_id)
+        return 204, None
+
+    def votes(self, request: MockRequest) -> Tuple[int, Dict]:
+        entry_id = int(request.path_params["id"])
+        if self._get_entry(entry_id) is None:
+            return NOT_FOUND
+        return 200, {"data": [make_user(i) for i in range(entry_id % 20)]}
+
+    def newer(self, _: MockRequest) -> Tuple[int, Dict]:
+        return 200, {"data": {"count": 3}}
+
+    # Comments
+
+    def comments(self, request: MockRequest) -> Tuple[int, Dict]:
+        entry_id = int(request.path_params["id"])
+        entry = self._get_entry(entry_id)
+        if entry is None:
+            return NOT_FOUND
+        return self._page(
+            request,
+            entry["comments"]["count"],
+            lambda start, stop: [
+                make_comment(entry_id, entry_id * 1000 + i)
+                for i in range(start, stop)
+            ],
+        )
+
+    def comment(self, request: MockRequest) -> Tuple[int, Dict]:
+        entry_id = int(request.path_params["id"])
+        if self._get_entry(entry_id) is None:
+            return NOT_FOUND
+        comment = make_comment(entry_id, int(request.path_params["comment_id"]))
+        comment.update(request.json().get("data", {}))
+        return 200, {"data": comment}
+
+    def post_comment(self, request: MockRequest) -> Tuple[int, Dict]:
+        entry_id = int(request.path_params["id"])
+        if self._get_entry(entry_id) is None:
+            return NOT_FOUND
+        comment = make_comment(entry_id, entry_id * 1000 + 999)
+        comment.update(request.json().get("data", {}))
+        return 200, {"data": comment}
+
+    # Tags and users
+
+    @staticmethod
+    def users_autocomplete(request: MockRequest) -> Tuple[int, Dict]:
+        query = request.query.get("query", "")
+        users = [make_user(i) for i in range(50)]
+        return 200, {
+            "data": [
+                user for user in users if user["username"].startswith(query)
+            ]
+        }
+
+    @staticmethod
+    def tags_autocomplete(request: MockRequest) -> Tuple[int, Dict]:
+        query = request.query.get("query", "")
+        return 200, {
+            "data": [
+                {"name": f"{query}{i}", "observed_qty": i * 10}
+                for i in range(10)
+            ]
+        }
+
+    @staticmethod
+    def tags_popular(_: MockRequest) -> Tuple[int, Dict]:
+        return 200, {
+            "data": [
+                {"name": f"tag{i}", "observed_qty": 1000 - i} for i in range(30)
+            ]
+        }
+
+    @staticmethod
+    def tag(request: MockRequest) -> Tuple[int, Dict]:
+        name = request.path_params["tag"]
+        return 200, {
+            "data": {
+                "name": name,
+                "created_at": "2010-01-01 00:00:00",
+                "personal": False,
+                "author": make_user(1),
+                "description": f"Tag {name}",
+                "media": {"photo": None},
+                "blacklist": False,
+                "editable": False,
+                "follow": False,
+                "followers": 1234,
+                "notifications": False,
+                "promoted": False,
+                "actions": {"report": True},
+            }
+        }
+
+    @staticmethod
+    def users(_: MockRequest) -> Tuple[int, Dict]:
+        return 200, {"data": [make_user(i) for i in range(10)]}
+
+    # Media
+
+    def upload(self, request: MockRequest) -> Tuple[int, Dict]:
+        with self._lock:
+            self.uploaded_bytes += len(request.body)
+            self.uploads += 1
+            key = f"photo{self.uploads}"
+            photo = {
+                "key": key,
+                "label": "",
+                "mime_type": "image/jpeg",
+                "url": f"https://wykop.pl/cdn/{key}.jpg",
+                "size": len(request.body),
+                "width": 1200,
+                "height": 800,
+            }
+            self.photos[key] = photo
+        return 200, {"data": photo}
+
+    def delete_photo(self, request: MockRequest) -> Tuple[int, None]:
+        with self._lock:
+            if self.photos.pop(request.path_params["key"], None) is None:
+                return NOT_FOUND
+        return 204, None
@@ -0,0 +1,187 @@
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from ..utils import match_template
+
+API_PREFIX = "/api/v3/"
+
+# Route returns (code, payload) or (code, payload, headers), bytes payload
+# is sent as is
+Route = Callable[["MockRequest"], Tuple]
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address) -> None:
+        # Clients closing pooled keep-alive connections are expected
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class MockRequest:
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        query: Dict,
+        body: bytes,
+        headers: Dict | None = None,
+    ):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.body = body
+        self.headers = headers or {}
+        # Values of `{name}` placeholders of matched route template
+        self.path_params: Dict[str, str] = {}
+
+    def json(self) -> Dict:
+        return json.loads(self.body) if self.body else {}
+
+
+def _auth(_: MockRequest) -> Tuple[int, Dict]:
+    return 200, {"data": {"token": "mock-token"}}
+
+
+def _refresh_token(_: MockRequest) -> Tuple[int, Dict]:
+    return 200, {
+        "data": {"token": "mock-token", "refresh_token": "mock-refresh"}
+    }
+
+
+def _connect(_: MockRequest) -> Tuple[int, Dict]:
+    return 200, {"data": {"connect_url": "https://wykop.pl/connect/mock"}}
+
+
+class MockWykopServer:  # pylint: disable=too-many-instance-attributes
+    """
+    Local stand-in of Wykop API v3, served over HTTP/1.1 with keep-alive.
+
+    Routes are keyed by (method, path), where path is relative to
+    `api/v3/`, e.g. ("GET", "tags/popular"). Path can be a template like
+    "entries/{id}", values of placeholders are in `request.path_params`. `latency` is added to every
+    response. Number of requests per route is counted in `hits`.
+    """
+
+    def __init__(
+        self,
+        routes: Dict[Tuple[str, str], Route] | None = None,
+        latency: float = 0.0,
+    ):
+        self.routes: Dict[Tuple[str, str], Route] = {
+            ("POST", "auth"): _auth,
+            ("POST", "refresh-token"): _refresh_token,
+            ("GET", "connect"): _connect,
+        }
+        self.routes.update(routes or {})
+        self.latency = latency
+        self.connections = 0
+        self.requests = 0
+        self.hits: Counter = Counter()
+        self._lock = threading.Lock()
+        self._server = _Server(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def handle(self, request: MockRequest) -> Tuple:
+        with self._lock:
+            self.requests += 1
+            self.hits[(request.method, request.path)] += 1
+        if self.latency:
+            time.sleep(self.latency)
+        route = self.routes.get((request.method, request.path))
+        if route is None:
+            route = self._match(request)
+        if route is None:
+            return 404, {"error": {"message": "Not found"}}
+        return route(request)
+
+    def _match(self, request: MockRequest) -> Route | None:
+        """
+        Find route keyed by template, e.g. ("GET", "entries/{id}").
+        """
+        templates = [
+            path
+            for method, path in self.routes
+            if method == request.method and "{" in path
+        ]
+        template = match_template(request.path, templates)
+        if template is None:
+            return None
+        for part, segment in zip(template.split("/"), request.path.split("/")):
+            if part.startswith("{"):
+                request.path_params[part.strip("{}")] = segment
+        return self.routes[(request.method, template)]
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self) -> None:
+                super().setup()
+                with server._lock:  # pylint: disable=protected-access
+                    server.connections += 1
+
+            def log_message(self, *args) -> None:  # pylint: disable=W0221
+                ...
+
+            def _dispatch(self) -> None:
+                parsed = urlparse(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                request = MockRequest(
+                    self.command,
+                    parsed.path.removeprefix(API_PREFIX).strip("/"),
+                    {k: v[-1] for k, v in parse_qs(parsed.query).items()},
+                    body,
+                    dict(self.headers),
+                )
+                code, payload, *headers = server.handle(request)
+                if isinstance(payload, bytes):
+                    raw = payload
+                else:
+                    raw = json.dumps(payload).encode() if payload else b""
+                self.send_response(code)
+                for name, value in (headers[0] if headers else {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            do_GET = _dispatch
+            do_POST = _dispatch
+            do_PUT = _dispatch
+            do_DELETE = _dispatch
+
+        return Handler
+
+    def start(self) -> "MockWykopServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockWykopServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
@@ -0,0 +1,85 @@
+from typing import Dict
+
+
+def make_user(user_id: int) -> Dict:
+    return {
+        "username": f"user{user_id}",
+        "gender": "m" if user_id % 2 else "f",
+        "company": False,
+        "avatar": f"https://wykop.pl/cdn/avatars/user{user_id}.jpg",
+        "note": False,
+        "online": bool(user_id % 3),
+        "status": "active",
+        "color": "orange",
+        "verified": False,
+        "rank": {"position": user_id * 7, "trend": 0},
+        "blacklist": False,
+        "follow": False,
+    }
+
+
+def make_comment(entry_id: int, comment_id: int) -> Dict:
+    return {
+        "id": comment_id,
+        "author": make_user(comment_id % 50),
+        "device": "",
+        "created_at": "2023-03-01 12:00:00",
+        "voted": 0,
+        "content": "Komentarz do wpisu, zażółć gęślą jaźń " * 3,
+        "media": {"photo": None, "embed": None, "survey": None},
+        "adult": False,
+        "favourite": False,
+        "votes": {"up": comment_id % 10, "down": 0, "users": []},
+        "parent": {"id": entry_id},
+        "editable": False,
+        "deletable": False,
+        "resource": "entry_comment",
+        "actions": {"update": False, "delete": False, "report": True},
+        "archive": False,
+        "deleted": None,
+    }
+
+
+def make_entry(entry_id: int) -> Dict:
+    """
+    Entry shaped like items of `tags/{tag}/stream` response.
+    """
+    photo = {
+        "key": f"photo{entry_id}",
+        "label": "",
+        "mime_type": "image/jpeg",
+        "url": f"https://wykop.pl/cdn/photos/{entry_id}.jpg",
+        "size": 123456,
+        "width": 1200,
+        "height": 800,
+    }
+    return {
+        "id": entry_id,
+        "slug": f"wpis-{entry_id}",
+        "author": make_user(entry_id % 50),
+        "device": "",
+        "created_at": "2023-03-01 12:00:00",
+        "voted": 0,
+        "content": "Treść wpisu z #python i #programowanie " * 8,
+        "media": {
+            "photo": photo if entry_id % 3 == 0 else None,
+            "embed": None,
+            "survey": None,
+        },
+        "adult": False,
+        "tags": ["python", "programowanie", "wykop"],
+        "favourite": False,
+        "votes": {"up": entry_id % 100, "down": 0, "users": []},
+        "comments": {
+            "items": [
+                make_comment(entry_id, entry_id * 10 + i) for i in range(2)
+            ],
+            "count": 12,
+        },
+        "resource": "entry",
+        "actions": {"update": False, "delete": False, "report": True},
+        "archive": False,
+        "editable": False,
+        "deletable": False,
+        "deleted": None,
+    }
@@ -0,0 +1,96 @@
+from dataclasses import dataclass, field
+from typing import Tuple
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .cassette import Cassette, RecordingAdapter, ReplayAdapter
+
+
+@dataclass
+class TransportConfig:  # pylint: disable=too-many-instance-attributes
+    """
+    Configuration of HTTP transport used by :class:`WykopConnector`.
+
+    Args:
+        pool_connections (int, optional): Number of per-host connection pools
+            to cache. Defaults to 10.
+        pool_maxsize (int, optional): Maximum number of connections kept
+            alive in a single host pool. Set it to the number of threads
+            sharing the connector. Defaults to 10.
+        pool_block (bool, optional): Block when pool is full instead of
+            opening an extra, non-reused connection. Defaults to False.
+        keep_alive (bool, optional): Reuse connections between requests.
+            Defaults to True.
+        max_retries (int, optional): Number of retries done by the adapter
+            on connection errors and on `status_forcelist` codes.
+            Defaults to 0.
+        backoff_factor (float, optional): Backoff factor between adapter
+            retries. Defaults to 0.3.
+        status_forcelist (Tuple[int, ...], optional): Response codes which
+            are retried by the adapter. Defaults to (502, 503, 504).
+        cassette (str | None, optional): Path of cassette file, see
+            :class:`pywykop3.cassette.Cassette`. Defaults to None.
+        cassette_mode (str, optional): `record` sends requests to network
+            and writes them to cassette, `replay` answers requests from
+            cassette without network. Defaults to "replay".
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    keep_alive: bool = True
+    max_retries: int = 0
+    backoff_factor: float = 0.3
+    status_forcelist: Tuple[int, ...] = field(default=(502, 503, 504))
+    cassette: str | None = None
+    cassette_mode: str = "replay"
+
+    def build_retry(self) -> Retry:
+        return Retry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=self.max_retries,
+            status=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.status_forcelist,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+
+
+def build_session(config: TransportConfig | None = None) -> requests.Session:
+    """
+    Create :class:`requests.Session` with pooled adapters mounted for http
+    and https.
+
+    Args:
+        config (TransportConfig | None, optional): Transport configuration.
+            Defaults to None.
+
+    Returns:
+        requests.Session: Configured session
+    """
+    config = config or TransportConfig()
+    session = requests.Session()
+    pool = {
+        "pool_connections": config.pool_connections,
+        "pool_maxsize": config.pool_maxsize,
+        "max_retries": config.build_retry(),
+        "pool_block": config.pool_block,
+    }
+    adapter: BaseAdapter
+    if config.cassette and config.cassette_mode == "replay":
+        adapter = ReplayAdapter(Cassette(config.cassette).load())
+    elif config.cassette and config.cassette_mode == "record":
+        adapter = RecordingAdapter(Cassette(config.cassette), **pool)
+    elif config.cassette:
+        raise ValueError(f"Unknown cassette mode {config.cassette_mode}")
+    else:
+        adapter = HTTPAdapter(**pool)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not config.keep_alive:
+        session.headers["Connection"] = "close"
+    return session
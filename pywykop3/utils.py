@@ -1,3 +1,9 @@
+import base64
+import binascii
+import json
+from typing import Any, Iterable
+
+
 class NotEmptyDict(dict):
     """
     Subclass of dictionary. None values are ignored.
@@ -6,3 +12,64 @@ class NotEmptyDict(dict):
     def __setitem__(self, key, value) -> None:
         if value is not None:
             super().__setitem__(key, value)
+
+
+def token_expiry(token: str) -> float | None:
+    """
+    Read expiration time (`exp` claim) of JWT token without verifying it.
+
+    Args:
+        token (str): JWT token
+
+    Returns:
+        float | None: Unix timestamp of expiration, or None if token has no
+            readable `exp` claim.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError, binascii.Error):
+        return None
+
+
+def match_template(endpoint: str, templates: Iterable[str]) -> str | None:
+    """
+    Find template of `endpoint`. In templates `{}` or named placeholder
+    like `{id}` matches any single path segment, e.g. `entries/{}/comments`.
+    When many templates match, the one with the most literal segments wins,
+    so `tags/popular` is preferred over `tags/{}`.
+
+    Args:
+        endpoint (str): Endpoint, e.g. `/entries/123`
+        templates (Iterable[str]): Endpoint templates
+
+    Returns:
+        str | None: Matching template, None if there is no match.
+    """
+    segments = endpoint.strip("/").split("/")
+    best, best_score = None, -1
+    for template in templates:
+        parts = template.strip("/").split("/")
+        if len(parts) != len(segments):
+            continue
+        score = 0
+        for part, segment in zip(parts, segments):
+            if part == segment:
+                score += 1
+            elif not (part.startswith("{") and part.endswith("}")):
+                break
+        else:
+            if score > best_score:
+                best, best_score = template, score
+    return best
+
+
+def field_of(item: Any, name: str) -> Any:
+    """
+    Field `name` of item given as raw dict or model, None if missing.
+    """
+    if isinstance(item, dict):
+        return item.get(name)
+    return getattr(item, name, None)
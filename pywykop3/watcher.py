@@ -0,0 +1,243 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from .api import WykopAPI
+from .utils import field_of
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@dataclass
+class TagCursor:
+    """
+    Position of watcher in tag stream.
+
+    - last_id - ID of the newest seen entry or link
+    - last_date - creation date of the newest seen entry or link
+    - seen - keys (`resource:id`) of recently seen items, newest last
+    """
+
+    last_id: int | None = None
+    last_date: str | None = None
+    seen: List[str] = field(default_factory=list)
+
+
+class CursorStore:
+    """
+    In-memory store of tag cursors used by :class:`TagWatcher`. Subclass
+    and override :meth:`save` to persist cursors elsewhere.
+    """
+
+    def __init__(self) -> None:
+        self._cursors: Dict[str, TagCursor] = {}
+        self._lock = threading.Lock()
+
+    def get(self, tag: str) -> TagCursor | None:
+        with self._lock:
+            return self._cursors.get(tag)
+
+    def set(self, tag: str, cursor: TagCursor) -> None:
+        with self._lock:
+            self._cursors[tag] = cursor
+            self.save(self._cursors)
+
+    def save(self, cursors: Dict[str, TagCursor]) -> None:
+        """
+        Called with all cursors after every change.
+        """
+
+
+class JsonCursorStore(CursorStore):
+    """
+    Cursor store persisted in JSON file. File is replaced atomically, so
+    it stays valid when process is killed during write.
+
+    Args:
+        path (str | Path): JSON file, created when missing.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        super().__init__()
+        self.path = Path(path)
+        if self.path.exists():
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self._cursors = {
+                tag: TagCursor(**cursor) for tag, cursor in data.items()
+            }
+
+    def save(self, cursors: Dict[str, TagCursor]) -> None:
+        data = {tag: asdict(cursor) for tag, cursor in cursors.items()}
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+@dataclass
+class TagPoll:
+    """
+    Result of single poll of a tag.
+
+    - items - new entries and links, oldest first
+    - fetched - items downloaded from stream, newest first
+    - requests - number of sent requests
+    - initial - first poll of the tag, cursor was created
+    """
+
+    tag: str
+    items: List = field(default_factory=list)
+    fetched: List = field(default_factory=list)
+    requests: int = 0
+    initial: bool = False
+
+
+def _key(item: Any) -> str:
+    return f"{field_of(item, 'resource') or 'entry'}:{field_of(item, 'id')}"
+
+
+class TagWatcher:  # pylint: disable=too-many-instance-attributes
+    """
+    Incremental watcher of tag streams. Every poll asks cheap
+    :meth:`WykopAPI.get_tag_newer` endpoint first and downloads stream
+    pages only for tags with new content, stopping as soon as already seen
+    item is reached. Items are deduplicated against recently seen keys, so
+    only new entries and links are emitted.
+
+    First poll of a tag only stores the cursor, unless `emit_initial` is
+    set, then items of the first page are emitted.
+
+    Args:
+        api (WykopAPI): API used to poll tags.
+        tags (Iterable[str]): Watched tags.
+        store (CursorStore | None, optional): Store of cursors, e.g.
+            :class:`JsonCursorStore`. Defaults to in-memory store.
+        type_of_content (str, optional): "all", "entry" or "link".
+            Defaults to "all".
+        max_pages (int, optional): Limit of stream pages per tag and poll.
+            Defaults to 10.
+        seen_size (int, optional): Number of remembered keys per tag.
+            Defaults to 1000.
+        emit_initial (bool, optional): Emit first page on first poll.
+            Defaults to False.
+        workers (int, optional): Number of tags polled at once.
+            Defaults to 4.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        api: WykopAPI,
+        tags: Iterable[str],
+        store: CursorStore | None = None,
+        type_of_content: str = "all",
+        max_pages: int = 10,
+        seen_size: int = 1000,
+        emit_initial: bool = False,
+        workers: int = 4,
+    ) -> None:
+        self.api = api
+        self.tags = list(tags)
+        self.store = store if store is not None else CursorStore()
+        self.type_of_content = type_of_content
+        self.max_pages = max_pages
+        self.seen_size = seen_size
+        self.emit_initial = emit_initial
+        self.workers = workers
+
+    def _newer(self, tag: str, cursor: TagCursor) -> int:
+        date = (
+            datetime.strptime(cursor.last_date, DATE_FORMAT)
+            if cursor.last_date
+            else None
+        )
+        return self.api.get_tag_newer(
+            tag,
+            type_of_content=self.type_of_content,
+            sort="all",
+            date=date,
+            obj_id=str(cursor.last_id) if cursor.last_id else None,
+        )
+
+    def _fetch(
+        self, tag: str, seen: set, count: int | None
+    ) -> Tuple[List, int]:
+        """
+        Newest items not in `seen`, newest first, and number of fetched
+        pages. Stops after `count` new items, on first seen item or after
+        `max_pages` pages.
+        """
+        items: List = []
+        stream = self.api.iter_tag_stream(
+            tag,
+            sort="all",
+            type_of_content=self.type_of_content,
+            page_count=self.max_pages if count is not None else 1,
+        )
+        try:
+            for item in stream:
+                if _key(item) in seen:
+                    break
+                items.append(item)
+                if count is not None and len(items) >= count:
+                    break
+        finally:
+            stream.close()
+        return items, stream.fetched_pages
+
+    def check_tag(self, tag: str) -> TagPoll:
+        """
+        Poll `tag`, returning new items along with fetched items and
+        number of requests.
+        """
+        cursor = self.store.get(tag)
+        if cursor is None:
+            items, requests = self._fetch(tag, set(), None)
+            emitted = items[::-1] if self.emit_initial else []
+            result = TagPoll(tag, emitted, items, requests, initial=True)
+        else:
+            count = self._newer(tag, cursor)
+            if not count:
+                return TagPoll(tag, requests=1)
+            items, requests = self._fetch(tag, set(cursor.seen), count)
+            result = TagPoll(tag, items[::-1], items, 1 + requests)
+        if items:
+            newest = items[0]
+            seen = cursor.seen if cursor is not None else []
+            seen = seen + [_key(item) for item in reversed(items)]
+            cursor = TagCursor(
+                field_of(newest, "id"),
+                field_of(newest, "created_at"),
+                seen[-self.seen_size :],
+            )
+        self.store.set(tag, cursor or TagCursor())
+        return result
+
+    def poll_tag(self, tag: str) -> List:
+        """
+        New entries and links of `tag`, oldest first.
+        """
+        return self.check_tag(tag).items
+
+    def poll(self) -> Dict[str, List]:
+        """
+        Poll all tags, returns new items per tag, oldest first.
+        """
+        with ThreadPoolExecutor(self.workers) as executor:
+            results = executor.map(self.poll_tag, self.tags)
+            return dict(zip(self.tags, results))
+
+    def watch(self, interval: float = 60.0) -> Iterator[Tuple[str, Any]]:
+        """
+        Poll every `interval` seconds forever, yielding (tag, item) pairs.
+        """
+        while True:
+            started = time.monotonic()
+            for tag, items in self.poll().items():
+                for item in items:
+                    yield tag, item
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
@@ -9,7 +9,7 @@ long_description = (this_directory / "README.md").read_text()
 
 setup(
     name="pywykop3",
-    packages=["pywykop3"],
+    packages=["pywykop3", "pywykop3.testing"],
     version=os.environ["TARGET_VERSION"],
     license="MIT",
     description="Wykop v2 REST API Client",
@@ -23,6 +23,11 @@ setup(
     install_requires=[
         "requests",
     ],
+    extras_require={
+        "async": ["aiohttp"],
+        "fast": ["orjson"],
+        "export": ["pyarrow", "zstandard"],
+    },
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -1,18 +1,55 @@
+import random
+
 import pytest
 
-from pywykop3 import WykopAPI
+from pywykop3 import TransportConfig, WykopAPI, WykopConnector
 from tests.helpers import EntryHelper, MediaHelper
 
 
 def pytest_addoption(parser):
     parser.addoption("--refresh-token", action="store", default="")
+    parser.addoption(
+        "--cassette",
+        action="store",
+        default="",
+        help="Replay requests from cassette file instead of wykop.pl",
+    )
+    parser.addoption(
+        "--record",
+        action="store_true",
+        help="Record requests sent to wykop.pl to --cassette file",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "network: test needs network besides Wykop API"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--cassette") or config.getoption("--record"):
+        return
+    skip = pytest.mark.skip(reason="Needs network, replaying cassette")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip)
 
 
 @pytest.fixture(scope="session")
 def wykop_api(request):
     token = request.config.getoption("--refresh-token")
-    api = WykopAPI(refresh_token=token)
-    return api
+    cassette = request.config.getoption("--cassette")
+    if not cassette:
+        return WykopAPI(refresh_token=token)
+    # Random contents have to be the same when recording and replaying
+    random.seed(0)
+    mode = "record" if request.config.getoption("--record") else "replay"
+    transport = TransportConfig(cassette=cassette, cassette_mode=mode)
+    connector = WykopConnector(
+        refresh_token=token or "replay", transport=transport
+    )
+    return WykopAPI(connector=connector)
 
 
 @pytest.fixture(scope="session")
@@ -1,2 +1,12 @@
+from pywykop3.testing import (
+    FakeWykop,
+    MockRequest,
+    MockWykopServer,
+    make_api,
+    make_comment,
+    make_entry,
+    make_user,
+)
+
 from .entry_helper import EntryHelper
 from .media_helper import MediaHelper
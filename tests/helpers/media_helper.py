@@ -12,10 +12,9 @@ class MediaHelper:
         self._created_photos: Dict[str, Photo] = {}
 
     def upload_photo(self) -> Photo:
-        photo = None
-        with open("tests/helpers/pictures/1.jpg", "rb") as f:
-            photo = f.read()
-        res = self.api.post_media_photo("content", photo, "1.jpg", "image/jpeg")
+        res = self.api.post_media_photo(
+            "content", "tests/helpers/pictures/1.jpg", "1.jpg", "image/jpeg"
+        )
         self._created_photos[res["key"]] = res
         return res
 
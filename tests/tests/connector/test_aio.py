@@ -0,0 +1,52 @@
+import asyncio
+import inspect
+
+import pytest
+
+from pywykop3 import ApiException, WykopAPI
+from pywykop3.aio import AsyncWykopAPI, AsyncWykopConnector
+from tests.helpers import MockWykopServer
+
+
+def public_methods(cls) -> set:
+    return {
+        name
+        for name, _ in inspect.getmembers(cls, inspect.isfunction)
+        if not name.startswith("_")
+    }
+
+
+def test_async_api_mirrors_api() -> None:
+    sync_methods = public_methods(WykopAPI) - {"raise_error_if_needed"}
+    missing = sync_methods - public_methods(AsyncWykopAPI)
+    assert not missing, f"Missing async methods: {missing}"
+    for name in sync_methods:
+        method = getattr(AsyncWykopAPI, name)
+        # Iterators are returned synchronously and consumed with async for
+        is_iterator = name.startswith("iter_")
+        assert inspect.iscoroutinefunction(method) != is_iterator, name
+        assert list(inspect.signature(method).parameters) == list(
+            inspect.signature(getattr(WykopAPI, name)).parameters
+        ), name
+
+
+def test_concurrent_requests() -> None:
+    routes = {
+        ("GET", "entries/1"): lambda _: (200, {"data": {"id": 1}}),
+        ("GET", "entries/2"): lambda _: (404, {"error": {"code": 404}}),
+    }
+
+    async def run(url: str) -> list:
+        connector = AsyncWykopConnector("key", "secret", url=url)
+        async with AsyncWykopAPI(connector=connector) as api:
+            entries = await asyncio.gather(
+                *[api.get_entry_by_id(1) for _ in range(50)]
+            )
+            with pytest.raises(ApiException) as exc:
+                await api.get_entry_by_id(2)
+            assert exc.value.code == 404
+            return entries
+
+    with MockWykopServer(routes) as server:
+        entries = asyncio.run(run(server.url))
+    assert entries == [{"id": 1}] * 50
@@ -0,0 +1,136 @@
+import asyncio
+import base64
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pywykop3 import WykopAPI, WykopConnector
+from pywykop3.aio import AsyncWykopAPI, AsyncWykopConnector
+from tests.helpers import MockWykopServer
+
+AUTH = ("POST", "auth")
+CONNECT = ("GET", "connect")
+TAGS_POPULAR = ("GET", "tags/popular")
+
+
+def make_token(expires_in: float) -> str:
+    def encode(value: dict) -> str:
+        raw = json.dumps(value).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    claims = {"exp": int(time.time() + expires_in)}
+    return f"{encode({'alg': 'HS256'})}.{encode(claims)}.signature"
+
+
+def tags_popular(_) -> tuple:
+    return 200, {"data": [{"name": "python"}]}
+
+
+def test_construction_is_lazy() -> None:
+    routes = {("GET", "tags/popular"): tags_popular}
+    with MockWykopServer(routes) as server:
+        api = WykopAPI(
+            connector=WykopConnector("key", "secret", url=server.url)
+        )
+        assert server.requests == 0
+        api.get_tags_popular()
+        api.get_tags_popular()
+        assert server.hits[AUTH] == 1
+        assert server.hits[CONNECT] == 0
+        assert api.connect() == "https://wykop.pl/connect/mock"
+        assert server.hits[CONNECT] == 1
+
+
+def test_valid_cached_token_is_reused() -> None:
+    routes = {("GET", "tags/popular"): tags_popular}
+    token = make_token(3600)
+    with MockWykopServer(routes) as server:
+        connector = WykopConnector("key", "secret", url=server.url, token=token)
+        WykopAPI(connector=connector).get_tags_popular()
+        assert server.hits[AUTH] == 0
+        assert connector.token == token
+
+
+def test_expired_cached_token_is_replaced() -> None:
+    routes = {("GET", "tags/popular"): tags_popular}
+    with MockWykopServer(routes) as server:
+        connector = WykopConnector(
+            "key", "secret", url=server.url, token=make_token(-10)
+        )
+        WykopAPI(connector=connector).get_tags_popular()
+        assert server.hits[AUTH] == 1
+        assert connector.token == "mock-token"
+
+
+class ExpiringTokens:
+    """
+    Issues tokens 't1', 't2', ... and accepts only the newest one.
+    """
+
+    def __init__(self) -> None:
+        self.issued = 0
+
+    def expire(self) -> None:
+        self.issued += 1
+
+    def auth(self, _) -> tuple:
+        time.sleep(0.05)
+        return 200, {"data": {"token": f"t{self.issued}"}}
+
+    def tags_popular(self, request) -> tuple:
+        if request.headers.get("Authorization") != f"Bearer t{self.issued}":
+            return 401, {"error": {"message": "Unauthorized"}}
+        return tags_popular(request)
+
+
+@pytest.mark.parametrize("coalesce", [False, True])
+def test_single_refresh_on_concurrent_401(coalesce: bool) -> None:
+    tokens = ExpiringTokens()
+    routes = {AUTH: tokens.auth, TAGS_POPULAR: tokens.tags_popular}
+    with MockWykopServer(routes) as server:
+        connector = WykopConnector(
+            "key", "secret", url=server.url, coalesce=coalesce
+        )
+        api = WykopAPI(connector=connector)
+        api.get_tags_popular()
+        tokens.expire()
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(
+                executor.map(lambda _: api.get_tags_popular(), range(10))
+            )
+        assert results == [[{"name": "python"}]] * 10
+        assert server.hits[AUTH] == 2
+        if coalesce:
+            # Requests waiting for the refreshing one share its response
+            assert connector.single_flight.stats.shared > 0
+        else:
+            # Every request is rejected once and replayed with new token
+            assert server.hits[TAGS_POPULAR] == 1 + 2 * 10
+
+
+@pytest.mark.parametrize("coalesce", [False, True])
+def test_async_single_refresh_on_concurrent_401(coalesce: bool) -> None:
+    tokens = ExpiringTokens()
+    routes = {AUTH: tokens.auth, TAGS_POPULAR: tokens.tags_popular}
+
+    async def run(url: str) -> list:
+        connector = AsyncWykopConnector(
+            "key", "secret", url=url, coalesce=coalesce
+        )
+        async with AsyncWykopAPI(connector=connector) as api:
+            await api.get_tags_popular()
+            tokens.expire()
+            results = await asyncio.gather(
+                *[api.get_tags_popular() for _ in range(10)]
+            )
+        if coalesce:
+            assert connector.single_flight.stats.shared == 9
+        return results
+
+    with MockWykopServer(routes) as server:
+        assert asyncio.run(run(server.url)) == [[{"name": "python"}]] * 10
+        assert server.hits[AUTH] == 2
+        if not coalesce:
+            assert server.hits[TAGS_POPULAR] == 1 + 2 * 10
@@ -0,0 +1,137 @@
+import asyncio
+import functools
+import time
+
+import pytest
+
+from pywykop3 import WykopAPI, WykopConnector, get_decoder
+from pywykop3.aio import AsyncWykopAPI, AsyncWykopConnector
+from tests.helpers import MockWykopServer, make_api
+
+ENTRY_IDS = [5, 3, 404, 1, 500, 2]
+
+
+def entry(request) -> tuple:
+    entry_id = int(request.path.split("/")[-1])
+    if entry_id == 404:
+        return 404, {"error": {"code": 404}}
+    if entry_id == 500:
+        return 500, {"error": {"code": 500}}
+    return 200, {"data": {"id": entry_id}}
+
+
+ROUTES = {("GET", f"entries/{entry_id}"): entry for entry_id in ENTRY_IDS}
+
+
+def check(results) -> None:
+    assert [result.entry_id for result in results] == ENTRY_IDS
+    for result in results:
+        if result.entry_id == 404:
+            assert result.not_found
+        elif result.entry_id == 500:
+            assert not result.ok and not result.not_found
+            assert result.error.code == 500
+        else:
+            assert result.ok
+            assert result.entry == {"id": result.entry_id}
+
+
+def test_get_entries_by_ids() -> None:
+    with MockWykopServer(ROUTES, latency=0.1) as server:
+        connector = WykopConnector("key", "secret", url=server.url)
+        api = WykopAPI(connector=connector)
+        start = time.perf_counter()
+        results = api.get_entries_by_ids(ENTRY_IDS, workers=6)
+        # All requests are in flight at once
+        assert time.perf_counter() - start < 0.4
+    check(results)
+
+
+def test_iter_entries_by_ids() -> None:
+    with MockWykopServer(ROUTES) as server:
+        connector = WykopConnector("key", "secret", url=server.url)
+        api = WykopAPI(connector=connector)
+        results = list(api.iter_entries_by_ids(ENTRY_IDS + [1], workers=2))
+    assert sorted(result.entry_id for result in results) == sorted(ENTRY_IDS)
+
+
+def test_async_get_entries_by_ids() -> None:
+    async def run(url: str) -> list:
+        connector = AsyncWykopConnector("key", "secret", url=url)
+        async with AsyncWykopAPI(connector=connector) as api:
+            return await api.get_entries_by_ids(ENTRY_IDS, workers=3)
+
+    with MockWykopServer(ROUTES) as server:
+        check(asyncio.run(run(server.url)))
+
+
+def test_async_iter_entries_by_ids_timeout() -> None:
+    def slow(request) -> tuple:
+        time.sleep(1)
+        return entry(request)
+
+    async def run(url: str) -> list:
+        connector = AsyncWykopConnector("key", "secret", url=url)
+        connector.request = functools.partial(connector.request, timeout=0.3)
+        async with AsyncWykopAPI(connector=connector) as api:
+            return await api.get_entries_by_ids(ENTRY_IDS, workers=3)
+
+    routes = {**ROUTES, ("GET", "entries/3"): slow}
+    with MockWykopServer(routes) as server:
+        results = asyncio.run(run(server.url))
+    # Slow ID fails alone, other results are returned
+    assert [result.entry_id for result in results] == ENTRY_IDS
+    assert isinstance(results[1].error, asyncio.TimeoutError)
+    assert [result.ok for result in results] == [
+        True,
+        False,
+        False,
+        True,
+        False,
+        True,
+    ]
+
+
+MALFORMED = b'{"data": {"id": 1'
+MALFORMED_ROUTES = {
+    ("GET", "entries/{id}"): lambda _: (200, MALFORMED),
+    ("GET", "entries/{id}/comments"): lambda _: (200, MALFORMED),
+    ("POST", "media/photos/upload"): lambda _: (200, MALFORMED),
+}
+
+
+@pytest.mark.parametrize("decoder", ["json", "orjson", "msgspec"])
+def test_malformed_body_fails_single_result(decoder: str) -> None:
+    if decoder != "json":
+        pytest.importorskip(decoder)
+    with MockWykopServer(MALFORMED_ROUTES) as server:
+        api = make_api(server, decoder=get_decoder(decoder))
+        results = api.get_entries_by_ids([1, 2], workers=2)
+        trees = list(api.iter_comment_trees([1, 2], workers=2))
+        uploads = api.post_media_photos("comments", [b"a", b"b"], workers=2)
+    for result in [*results, *trees, *uploads]:
+        assert isinstance(result.error, ValueError)
+
+
+@pytest.mark.parametrize("decoder", ["json", "orjson", "msgspec"])
+def test_async_malformed_body_fails_single_result(decoder: str) -> None:
+    if decoder != "json":
+        pytest.importorskip(decoder)
+
+    async def run(url: str) -> list:
+        connector = AsyncWykopConnector(
+            "key", "secret", url=url, decoder=get_decoder(decoder)
+        )
+        async with AsyncWykopAPI(connector=connector) as api:
+            results = await api.get_entries_by_ids([1, 2], workers=2)
+            trees = [
+                tree async for tree in api.iter_comment_trees([1, 2], workers=2)
+            ]
+            uploads = await api.post_media_photos(
+                "comments", [b"a", b"b"], workers=2
+            )
+        return [*results, *trees, *uploads]
+
+    with MockWykopServer(MALFORMED_ROUTES) as server:
+        for result in asyncio.run(run(server.url)):
+            assert isinstance(result.error, ValueError)
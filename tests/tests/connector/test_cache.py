@@ -0,0 +1,100 @@
+import asyncio
+import time
+
+from pywykop3 import ResponseCache, WykopConnector
+from pywykop3.aio import AsyncWykopAPI, AsyncWykopConnector
+from tests.helpers import MockWykopServer, make_api
+
+ENTRY = ("GET", "entries/1")
+
+
+def entry(_) -> tuple:
+    return 200, {"data": {"id": 1, "content": "content"}}
+
+
+def missing(_) -> tuple:
+    return 404, {"error": {"code": 404}}
+
+
+def ok(_) -> tuple:
+    return 200, {"data": {"id": 1}}
+
+
+ROUTES = {
+    ENTRY: entry,
+    ("GET", "entries/2"): missing,
+    ("PUT", "entries/1"): ok,
+    ("GET", "tags/popular"): lambda _: (200, {"data": [{"name": "a"}]}),
+}
+
+
+def test_cache_hits_and_ttl() -> None:
+    cache = ResponseCache({"entries/{}": 0.2})
+    with MockWykopServer(ROUTES) as server:
+        api = make_api(server, cache=cache)
+        for _ in range(5):
+            assert api.get_entry_by_id(1)["id"] == 1
+        assert server.hits[ENTRY] == 1
+        # Endpoint without ttl is not cached
+        api.get_tags_popular()
+        api.get_tags_popular()
+        assert server.hits[("GET", "tags/popular")] == 2
+        time.sleep(0.25)
+        api.get_entry_by_id(1)
+        assert server.hits[ENTRY] == 2
+    stats = cache.stats()["entries/{}"]
+    assert (stats.hits, stats.misses) == (4, 2)
+
+
+def test_errors_are_not_cached() -> None:
+    cache = ResponseCache()
+    with MockWykopServer(ROUTES) as server:
+        connector = WykopConnector("key", "secret", url=server.url, cache=cache)
+        for _ in range(2):
+            assert connector.request("GET", "entries/2").code == 404
+        assert server.hits[("GET", "entries/2")] == 2
+    assert len(cache) == 0
+
+
+def test_identity() -> None:
+    cache = ResponseCache()
+    with MockWykopServer(ROUTES) as server:
+        make_api(server, cache=cache).get_entry_by_id(1)
+        make_api(server, cache=cache).get_entry_by_id(1)
+        make_api(server, logged_in=True, cache=cache).get_entry_by_id(1)
+        assert server.hits[ENTRY] == 2
+
+
+def test_mutation_invalidates() -> None:
+    cache = ResponseCache()
+    with MockWykopServer(ROUTES) as server:
+        api = make_api(server, cache=cache)
+        api.get_entry_by_id(1)
+        api.put_entry(1, "new content")
+        api.get_entry_by_id(1)
+        assert server.hits[ENTRY] == 2
+    assert cache.stats()["entries/{}"].invalidations == 1
+
+
+def test_lru_budget() -> None:
+    cache = ResponseCache({"entries/{}": 60}, max_bytes=1000)
+    for entry_id in range(10):
+        cache.store("GET", f"entries/{entry_id}", None, "id", 200, b"x" * 100)
+    assert cache.size <= 1000
+    assert cache.get("GET", "entries/0", None, "id") is None
+    assert cache.get("GET", "entries/9", None, "id") == (200, b"x" * 100)
+    assert cache.stats()["entries/{}"].evictions > 0
+
+
+def test_async_cache() -> None:
+    cache = ResponseCache()
+
+    async def run(url: str) -> None:
+        connector = AsyncWykopConnector("key", "secret", url=url, cache=cache)
+        async with AsyncWykopAPI(connector=connector) as api:
+            for _ in range(3):
+                await api.get_entry_by_id(1)
+
+    with MockWykopServer(ROUTES) as server:
+        asyncio.run(run(server.url))
+        assert server.hits[ENTRY] == 1
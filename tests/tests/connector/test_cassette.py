@@ -0,0 +1,99 @@
+import pytest
+
+from pywykop3 import Cassette, CassetteError, TransportConfig, WykopAPI
+from tests.helpers import FakeWykop, MockWykopServer, make_api
+
+
+def cassette(path: str, mode: str) -> TransportConfig:
+    return TransportConfig(cassette=path, cassette_mode=mode)
+
+
+def scenario(api: WykopAPI) -> list:
+    entry = api.post_entry("content")
+    return [
+        api.get_tag_stream("python", page_count=-1),
+        api.get_entry_by_id(entry["id"]),
+        api.put_entry(entry["id"], "changed"),
+        api.get_entry_by_id(entry["id"]),
+        api.post_media_photo("comments", b"\xff\xd8", "1.jpg", "image/jpeg"),
+    ]
+
+
+@pytest.mark.parametrize("name", ["cassette.jsonl", "cassette.jsonl.gz"])
+def test_record_and_replay(tmp_path, name: str) -> None:
+    path = str(tmp_path / name)
+    fake = FakeWykop(stream_size=60)
+    with fake.server() as server:
+        api = make_api(
+            server, logged_in=True, transport=cassette(path, "record")
+        )
+        recorded = scenario(api)
+        api.connector.close()
+        requests_sent = server.requests
+    assert len(Cassette(path).load()) == requests_sent
+
+    # Server is stopped, everything is answered from cassette
+    api = make_api(server, logged_in=True, transport=cassette(path, "replay"))
+    assert scenario(api) == recorded
+    assert recorded[1]["content"] == "content"
+    assert recorded[3]["content"] == "changed"
+    with pytest.raises(CassetteError):
+        api.get_entry_by_id(123456)
+
+
+def test_recorded_credentials_are_redacted(tmp_path) -> None:
+    path = tmp_path / "cassette.jsonl"
+    fake = FakeWykop()
+    with fake.server() as server:
+        for kwargs in (
+            {"key": "app-key", "secret": "app-secret"},
+            {"logged_in": True, "refresh_token": "user-refresh"},
+        ):
+            api = make_api(
+                server, transport=cassette(str(path), "record"), **kwargs
+            )
+            api.get_entry_by_id(1)
+            api.connector.close()
+            recorded = path.read_text(encoding="utf-8")
+            secrets = (
+                "app-",
+                "user-refresh",
+                "anon-token",
+                "user-token",
+                "fake-refresh",
+            )
+            for secret in secrets:
+                assert secret not in recorded
+            assert "<redacted>" in recorded
+
+    # Replayed connector uses placeholder token
+    api = make_api(
+        server, logged_in=True, transport=cassette(str(path), "replay")
+    )
+    assert api.get_entry_by_id(1)["id"] == 1
+
+
+def test_rotated_refresh_token_is_redacted(tmp_path) -> None:
+    path = tmp_path / "cassette.jsonl"
+    routes = {
+        ("POST", "refresh-token"): lambda _: (
+            200,
+            {
+                "data": {
+                    "token": "rotated-access-7f3a",
+                    "refresh-token": "rotated-refresh-9c1e",
+                }
+            },
+        )
+    }
+    with MockWykopServer(routes) as server:
+        api = make_api(
+            server, logged_in=True, transport=cassette(str(path), "record")
+        )
+        api.connector._get_new_refresh_token()  # pylint: disable=protected-access
+        api.connector.close()
+    assert api.connector.refresh_token == "rotated-refresh-9c1e"
+    recorded = path.read_text(encoding="utf-8")
+    assert "rotated-access-7f3a" not in recorded
+    assert "rotated-refresh-9c1e" not in recorded
+    assert "<redacted>" in recorded
@@ -0,0 +1,128 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pywykop3 import SingleFlight, WykopAPI, WykopConnector
+from pywykop3.aio import AsyncWykopAPI, AsyncWykopConnector
+from tests.helpers import MockWykopServer
+
+ENTRY = ("GET", "entries/1")
+
+
+def slow_entry(_) -> tuple:
+    time.sleep(0.2)
+    return 200, {"data": {"id": 1, "content": "content"}}
+
+
+ROUTES = {
+    ENTRY: slow_entry,
+    ("GET", "entries/2"): lambda _: (200, {"data": {"id": 2}}),
+    ("PUT", "entries/1"): lambda _: (200, {"data": {"id": 1}}),
+}
+
+
+def test_concurrent_gets_are_coalesced() -> None:
+    with MockWykopServer(ROUTES) as server:
+        connector = WykopConnector(
+            "key", "secret", url=server.url, coalesce=True
+        )
+        api = WykopAPI(connector=connector)
+        with ThreadPoolExecutor(8) as executor:
+            entries = list(
+                executor.map(lambda _: api.get_entry_by_id(1), range(8))
+            )
+        assert server.hits[ENTRY] == 1
+        assert [entry["id"] for entry in entries] == [1] * 8
+        # Every caller gets its own copy of response
+        assert len({id(entry) for entry in entries}) == 8
+        assert connector.single_flight.stats.shared == 7
+        # Finished request is not reused
+        api.get_entry_by_id(1)
+        assert server.hits[ENTRY] == 2
+
+
+def test_only_identical_gets_are_coalesced() -> None:
+    with MockWykopServer(ROUTES) as server:
+        connector = WykopConnector(
+            "key", "secret", url=server.url, coalesce=True
+        )
+        with ThreadPoolExecutor(4) as executor:
+            calls = [
+                ("GET", "entries/1", None),
+                ("GET", "entries/1", {"page": 2}),
+                ("PUT", "entries/1", None),
+                ("PUT", "entries/1", None),
+            ]
+            list(
+                executor.map(
+                    lambda call: connector.request(
+                        call[0], call[1], {}, call[2]
+                    ),
+                    calls,
+                )
+            )
+        assert server.hits[ENTRY] == 2
+        assert server.hits[("PUT", "entries/1")] == 2
+
+
+def test_coalescing_is_opt_in() -> None:
+    with MockWykopServer(ROUTES) as server:
+        api = WykopAPI(
+            connector=WykopConnector("key", "secret", url=server.url)
+        )
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(lambda _: api.get_entry_by_id(1), range(4)))
+        assert server.hits[ENTRY] == 4
+
+
+def test_errors_are_shared_with_waiters() -> None:
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def fail() -> None:
+        started.set()
+        time.sleep(0.1)
+        raise ConnectionError("down")
+
+    def call() -> str:
+        try:
+            flight.do("key", fail)
+        except ConnectionError as exc:
+            return str(exc)
+        return "ok"
+
+    with ThreadPoolExecutor(4) as executor:
+        leader = executor.submit(call)
+        started.wait()
+        waiters = [executor.submit(call) for _ in range(3)]
+        results = [leader.result()] + [waiter.result() for waiter in waiters]
+    assert results == ["down"] * 4
+    assert (flight.stats.sent, flight.stats.shared) == (1, 3)
+    assert len(flight) == 0
+    with pytest.raises(ConnectionError):
+        flight.do("key", fail)
+
+
+def test_async_concurrent_gets_are_coalesced() -> None:
+    async def run(url: str) -> list:
+        async with AsyncWykopConnector(
+            "key", "secret", url=url, coalesce=True
+        ) as connector:
+            api = AsyncWykopAPI(connector=connector)
+            first = asyncio.ensure_future(api.get_entry_by_id(1))
+            await asyncio.sleep(0.05)
+            # Cancelled waiter does not cancel request of others
+            first.cancel()
+            entries = await asyncio.gather(
+                *(api.get_entry_by_id(1) for _ in range(5))
+            )
+            assert connector.single_flight.stats.shared == 5
+            return entries
+
+    with MockWykopServer(ROUTES) as server:
+        entries = asyncio.run(run(server.url))
+        assert server.hits[ENTRY] == 1
+    assert [entry["id"] for entry in entries] == [1] * 5
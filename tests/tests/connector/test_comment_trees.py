@@ -0,0 +1,97 @@
+import asyncio
+import itertools
+import time
+
+from pywykop3 import WykopAPI, WykopConnector
+from pywykop3.aio import AsyncWykopAPI, AsyncWykopConnector
+from tests.helpers import FakeWykop, MockWykopServer
+
+ENTRY_IDS = [3, 10, 99999, 7, 1, 42]
+
+
+def check(trees: list) -> None:
+    assert sorted(tree.entry_id for tree in trees) == sorted(ENTRY_IDS)
+    for tree in trees:
+        if tree.entry_id == 99999:
+            assert tree.error.code == 404
+            continue
+        assert tree.ok
+        assert tree.entry["id"] == tree.entry_id
+        assert len(tree.comments) == 12
+        # Comments without votes are skipped
+        assert len(tree.votes) == 10
+        assert all(
+            len(voters) == tree.entry_id % 20 for voters in tree.votes.values()
+        )
+
+
+def test_iter_comment_trees() -> None:
+    fake = FakeWykop()
+    with fake.server(latency=0.02) as server:
+        connector = WykopConnector("key", "secret", url=server.url)
+        api = WykopAPI(connector=connector)
+        start = time.perf_counter()
+        trees = list(api.iter_comment_trees(ENTRY_IDS, with_votes=True))
+        # 70 requests, 8 in flight
+        assert time.perf_counter() - start < 70 * 0.02 / 2
+    check(trees)
+
+
+def test_iter_comment_trees_consumes_ids_lazily() -> None:
+    fake = FakeWykop()
+    with fake.server() as server:
+        connector = WykopConnector("key", "secret", url=server.url)
+        api = WykopAPI(connector=connector, use_models=True)
+        ids = itertools.count(1)
+        trees = api.iter_comment_trees(ids, workers=2)
+        assert [next(trees).ok for _ in range(5)] == [True] * 5
+        trees.close()
+        # No more than queued trees were requested
+        assert next(ids) <= 5 + 2 * 2 + 1
+
+
+def test_async_iter_comment_trees() -> None:
+    async def run(url: str) -> list:
+        connector = AsyncWykopConnector("key", "secret", url=url)
+        async with AsyncWykopAPI(connector=connector) as api:
+            return [
+                tree
+                async for tree in api.iter_comment_trees(
+                    ENTRY_IDS, with_votes=True
+                )
+            ]
+
+    fake = FakeWykop()
+    with fake.server() as server:
+        check(asyncio.run(run(server.url)))
+
+
+def test_async_iter_comment_trees_timeout() -> None:
+    fake = FakeWykop()
+
+    def slow(request) -> tuple:
+        time.sleep(1)
+        request.path_params["id"] = "7"
+        return fake.entry(request)
+
+    async def run(url: str) -> list:
+        connector = AsyncWykopConnector("key", "secret", url=url)
+        request = connector.request
+
+        # Paginated requests pass timeout positionally
+        async def short_timeout(
+            method, endpoint, data=None, params=None, _timeout=10, files=None
+        ):
+            return await request(method, endpoint, data, params, 0.3, files)
+
+        connector.request = short_timeout
+        async with AsyncWykopAPI(connector=connector) as api:
+            return [tree async for tree in api.iter_comment_trees(ENTRY_IDS)]
+
+    routes = {**fake.routes(), ("GET", "entries/7"): slow}
+    with MockWykopServer(routes) as server:
+        trees = {tree.entry_id: tree for tree in asyncio.run(run(server.url))}
+    # Slow entry fails alone, other trees are returned
+    assert sorted(trees) == sorted(ENTRY_IDS)
+    assert isinstance(trees[7].error, asyncio.TimeoutError)
+    assert all(trees[entry_id].ok for entry_id in [3, 10, 1, 42])
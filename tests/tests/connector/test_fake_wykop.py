@@ -0,0 +1,57 @@
+import pytest
+
+from pywykop3 import ApiException
+from tests.helpers import FakeWykop, make_api
+
+
+@pytest.fixture(name="fake")
+def fixture_fake() -> FakeWykop:
+    return FakeWykop(entry_count=100, stream_size=60, per_page=25)
+
+
+def test_numeric_pagination(fake: FakeWykop) -> None:
+    with fake.server() as server:
+        api = make_api(server)
+        items = api.get_tag_stream("python", page_count=-1)
+        assert [item["id"] for item in items] == list(range(1, 61))
+        iterator = api.iter_tag_stream("python")
+        assert len(list(iterator)) == 60
+        assert iterator.cursor == 4
+
+
+def test_hash_pagination(fake: FakeWykop) -> None:
+    with fake.server() as server:
+        api = make_api(server, logged_in=True)
+        items = api.get_tag_stream("python", page_count=-1)
+        assert [item["id"] for item in items] == list(range(1, 61))
+        assert server.hits[("GET", "tags/python/stream")] == 3
+
+
+def test_entries(fake: FakeWykop) -> None:
+    with fake.server() as server:
+        api = make_api(server)
+        assert api.get_entry_by_id(5)["id"] == 5
+        entry = api.post_entry("new entry")
+        assert api.get_entry_by_id(entry["id"])["content"] == "new entry"
+        api.put_entry(5, "changed")
+        assert api.get_entry_by_id(5)["content"] == "changed"
+        api.delete_entry_by_id(5)
+        with pytest.raises(ApiException):
+            api.get_entry_by_id(5)
+        assert len(api.get_entry_comments(1, page_count=-1)) == 12
+        assert api.get_entry_votes(3)
+        assert api.post_entry_comment(1, "comment")["content"] == "comment"
+
+
+def test_tags_users_and_media(fake: FakeWykop) -> None:
+    with fake.server() as server:
+        api = make_api(server)
+        assert api.get_tag("python")["name"] == "python"
+        assert len(api.get_tags_popular()) == 30
+        assert api.get_users_autocomplete("user1")
+        photo = api.post_media_photo(
+            "comments", b"x" * 1000, "photo.jpg", "image/jpeg"
+        )
+        assert fake.uploaded_bytes > 1000
+        api.delete_media_photo(photo["key"])
+        assert not fake.photos
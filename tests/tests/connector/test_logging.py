@@ -0,0 +1,48 @@
+import logging
+
+from pywykop3 import WykopAPI, WykopConnector
+from pywykop3.connector import LOG_PREVIEW_LENGTH, LogPreview
+from tests.helpers import MockWykopServer, make_entry
+
+LOGGER = "pywykop3.connector"
+
+
+def stream(request) -> tuple:
+    page = int(request.query.get("page", 1))
+    data = [make_entry(page * 10 + i) for i in range(5)] if page < 3 else []
+    return 200, {"data": data, "pagination": {}}
+
+
+ROUTES = {("GET", "tags/python/stream"): stream}
+
+
+def test_log_preview() -> None:
+    assert str(LogPreview(b"short")) == "short"
+    assert str(LogPreview(None)) == "None"
+    preview = str(LogPreview(b"x" * 10_000))
+    assert preview.startswith("x" * LOG_PREVIEW_LENGTH + "...")
+    assert preview.endswith("(10000 total)")
+
+
+def test_nothing_logged_above_debug(caplog, capsys) -> None:
+    caplog.set_level(logging.INFO, logger=LOGGER)
+    with MockWykopServer(ROUTES) as server:
+        connector = WykopConnector("key", "secret", url=server.url)
+        api = WykopAPI(connector=connector)
+        assert len(api.get_tag_stream("python", page_count=-1)) == 10
+    assert not caplog.records
+    assert capsys.readouterr().out == ""
+
+
+def test_debug_logs_truncated_bodies(caplog) -> None:
+    caplog.set_level(logging.DEBUG, logger=LOGGER)
+    with MockWykopServer(ROUTES) as server:
+        connector = WykopConnector("key", "secret", url=server.url)
+        WykopAPI(connector=connector).get_tag_stream("python")
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(message.startswith("Executing GET") for message in messages)
+    responses = [
+        record for record in caplog.records if hasattr(record, "status")
+    ]
+    assert responses[0].status == 200
+    assert len(responses[0].getMessage()) < LOG_PREVIEW_LENGTH + 100
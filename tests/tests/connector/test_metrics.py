@@ -0,0 +1,104 @@
+import asyncio
+
+from pywykop3 import Metrics, RateLimiter, WykopAPI, WykopConnector
+from pywykop3.aio import AsyncWykopAPI, AsyncWykopConnector
+from tests.helpers import MockWykopServer
+
+
+def entry(request) -> tuple:
+    if request.path.endswith("/404"):
+        return 404, {"error": {"code": 404}}
+    return 200, {"data": {"id": 1}}
+
+
+def stream(request) -> tuple:
+    page = int(request.query.get("page", 1))
+    return 200, {"data": [{"id": page}] if page < 4 else [], "pagination": {}}
+
+
+class Throttling:
+    def __init__(self) -> None:
+        self.throttled = False
+
+    def comments(self, _) -> tuple:
+        if not self.throttled:
+            self.throttled = True
+            return 429, {}, {"Retry-After": "0"}
+        return 200, {"data": {"id": 2}}
+
+
+def make_routes() -> dict:
+    return {
+        ("GET", "entries/1"): entry,
+        ("GET", "entries/404"): entry,
+        ("GET", "tags/python/stream"): stream,
+        ("POST", "entries/1/comments"): Throttling().comments,
+    }
+
+
+def test_connector_metrics() -> None:
+    calls = []
+    metrics = Metrics(
+        before_request=lambda info: calls.append(("before", info.template)),
+        after_response=lambda info, res: calls.append(("after", res.status)),
+    )
+    with MockWykopServer(make_routes()) as server:
+        connector = WykopConnector(
+            "key",
+            "secret",
+            url=server.url,
+            metrics=metrics,
+            rate_limiter=RateLimiter(),
+        )
+        api = WykopAPI(connector=connector)
+        api.get_entry_by_id(1)
+        api.get_entry_by_id(1)
+        connector.request("GET", "entries/404")
+        api.post_entry_comment(1, "content")
+        assert len(api.get_tag_stream("python", page_count=-1)) == 3
+    snapshot = metrics.snapshot()
+    entries = snapshot["entries/{id}"]
+    assert entries.responses == {("GET", 200): 2, ("GET", 404): 1}
+    assert entries.requests == 3
+    assert entries.response_bytes > 0
+    assert entries.latency.count == 3
+    assert 0 < entries.percentiles()["p99"] < 1
+    comments = snapshot["entries/{id}/comments"]
+    assert comments.retries == 1
+    assert comments.request_bytes > 0
+    stream_metrics = snapshot["tags/{tag}/stream"]
+    assert stream_metrics.requests == 4
+    assert stream_metrics.pagination_depth.count == 1
+    assert stream_metrics.pagination_depth.sum == 4
+    assert calls[:2] == [("before", "entries/{id}"), ("after", 200)]
+
+    text = metrics.to_prometheus()
+    assert (
+        'wykop_requests_total{endpoint="entries/{id}",method="GET",'
+        'status="404"} 1' in text
+    )
+    assert (
+        'wykop_request_duration_seconds_count{endpoint="entries/{id}"} 3'
+        in text
+    )
+    assert 'wykop_retries_total{endpoint="entries/{id}/comments"} 1' in text
+    assert "# TYPE wykop_pagination_depth histogram" in text
+
+
+def test_async_connector_metrics() -> None:
+    metrics = Metrics()
+
+    async def run(url: str) -> None:
+        connector = AsyncWykopConnector(
+            "key", "secret", url=url, metrics=metrics
+        )
+        async with AsyncWykopAPI(connector=connector) as api:
+            await api.get_entry_by_id(1)
+            async for _ in api.iter_tag_stream("python"):
+                pass
+
+    with MockWykopServer(make_routes()) as server:
+        asyncio.run(run(server.url))
+    snapshot = metrics.snapshot()
+    assert snapshot["entries/{id}"].requests == 1
+    assert snapshot["tags/{tag}/stream"].pagination_depth.sum == 4
@@ -0,0 +1,182 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pywykop3 import WykopAPI, WykopConnector
+from pywykop3.aio import AsyncWykopAPI, AsyncWykopConnector
+from pywykop3.models import Entry
+from tests.helpers import MockWykopServer, make_entry
+
+PAGES = 6
+PER_PAGE = 2
+LATENCY = 0.05
+
+
+def numeric_stream(request) -> tuple:
+    time.sleep(LATENCY)
+    page = int(request.query.get("page", 1))
+    if page > PAGES:
+        return 200, {"data": [], "pagination": {"per_page": PER_PAGE}}
+    items = [{"id": page * 100 + i} for i in range(PER_PAGE)]
+    return 200, {"data": items, "pagination": {"per_page": PER_PAGE}}
+
+
+def hash_stream(request) -> tuple:
+    cursor = request.query.get("page", "h0")
+    page = int(cursor[1:])
+    pagination = {"next": f"h{page + 1}"} if page + 1 < PAGES else {}
+    return 200, {"data": [{"id": page}], "pagination": pagination}
+
+
+EXPECTED = [
+    {"id": page * 100 + i}
+    for page in range(1, PAGES + 1)
+    for i in range(PER_PAGE)
+]
+
+
+@pytest.fixture(name="server")
+def fixture_server():
+    routes = {
+        ("GET", "tags/python/stream"): numeric_stream,
+        ("GET", "tags/hashed/stream"): hash_stream,
+    }
+    with MockWykopServer(routes) as server:
+        yield server
+
+
+@pytest.mark.parametrize("prefetch", [1, 4])
+def test_all_pages_in_order(server, prefetch) -> None:
+    connector = WykopConnector(
+        "key", "secret", url=server.url, prefetch_pages=prefetch
+    )
+    api = WykopAPI(connector=connector)
+    assert api.get_tag_stream("python", page_count=-1) == EXPECTED
+    # Over-fetched pages are bounded by prefetch window
+    assert server.hits[("GET", "tags/python/stream")] <= PAGES + prefetch
+
+
+class InFlight:
+    """
+    Route wrapper counting requests in flight at once.
+    """
+
+    def __init__(self, route) -> None:
+        self.route = route
+        self.current = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, request) -> tuple:
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        try:
+            return self.route(request)
+        finally:
+            with self.lock:
+                self.current -= 1
+
+
+@pytest.mark.parametrize("prefetch,overlap", [(1, False), (PAGES, True)])
+def test_prefetch_requests_overlap(prefetch, overlap) -> None:
+    stream = InFlight(numeric_stream)
+    with MockWykopServer({("GET", "tags/python/stream"): stream}) as server:
+        connector = WykopConnector(
+            "key", "secret", url=server.url, prefetch_pages=prefetch
+        )
+        res = connector.request_with_pagination(
+            "GET", "tags/python/stream", page_count=PAGES
+        )
+    assert res.data == EXPECTED
+    assert (stream.peak > 1) == overlap
+
+
+def test_page_count_limit(server) -> None:
+    connector = WykopConnector(
+        "key", "secret", url=server.url, prefetch_pages=4
+    )
+    res = connector.request_with_pagination(
+        "GET", "tags/python/stream", page_count=3
+    )
+    assert res.data == EXPECTED[: 3 * PER_PAGE]
+    assert res.next == 4
+
+
+def test_hash_cursor_is_sequential(server) -> None:
+    connector = WykopConnector(
+        "key", "secret", url=server.url, prefetch_pages=4
+    )
+    res = connector.request_with_pagination(
+        "GET", "tags/hashed/stream", page_count=-1
+    )
+    assert res.data == [{"id": page} for page in range(PAGES)]
+
+
+def test_async_prefetch(server) -> None:
+    async def run() -> list:
+        connector = AsyncWykopConnector(
+            "key", "secret", url=server.url, prefetch_pages=4
+        )
+        async with AsyncWykopAPI(connector=connector) as api:
+            return await api.get_tag_stream("python", page_count=-1)
+
+    assert asyncio.run(run()) == EXPECTED
+
+
+def test_iterator_resume(server) -> None:
+    connector = WykopConnector("key", "secret", url=server.url)
+    api = WykopAPI(connector=connector)
+    iterator = api.iter_tag_stream("python")
+    consumed = []
+    for item in iterator:
+        consumed.append(item)
+        if len(consumed) == 3:
+            break
+    # Second page is partially consumed
+    assert iterator.cursor == 2
+    assert not iterator.finished
+    resumed = api.iter_tag_stream("python", page=iterator.cursor)
+    rest = list(resumed)
+    assert resumed.finished
+    assert consumed[:PER_PAGE] + rest == EXPECTED
+
+
+def test_iterator_pages(server) -> None:
+    connector = WykopConnector(
+        "key", "secret", url=server.url, prefetch_pages=3
+    )
+    iterator = WykopAPI(connector=connector).iter_tag_stream("python")
+    cursors = []
+    for res in iterator.pages():
+        cursors.append(iterator.cursor)
+        # Iteration stops at first empty page
+        assert len(res.data) == (PER_PAGE if res.page != PAGES + 1 else 0)
+    assert cursors == [None] + list(range(2, PAGES + 2))
+
+
+def test_async_iterator(server) -> None:
+    async def run() -> list:
+        connector = AsyncWykopConnector("key", "secret", url=server.url)
+        async with AsyncWykopAPI(connector=connector) as api:
+            return [item async for item in api.iter_tag_stream("python")]
+
+    assert asyncio.run(run()) == EXPECTED
+
+
+def test_iterator_models() -> None:
+    def stream(request) -> tuple:
+        page = int(request.query.get("page", 1))
+        data = [make_entry(page * 10 + i) for i in range(2)] if page < 3 else []
+        return 200, {"data": data, "pagination": {}}
+
+    routes = {("GET", "tags/python/stream"): stream}
+    with MockWykopServer(routes) as server:
+        connector = WykopConnector("key", "secret", url=server.url)
+        api = WykopAPI(connector=connector, use_models=True)
+        entries = list(api.iter_tag_stream("python"))
+        assert [entry.id for entry in entries] == [10, 11, 20, 21]
+        assert all(isinstance(entry, Entry) for entry in entries)
+        assert isinstance(api.get_tag_stream("python")[0], Entry)
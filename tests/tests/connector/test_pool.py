@@ -0,0 +1,122 @@
+import asyncio
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from pywykop3 import (
+    AsyncConnectorPool,
+    ConnectorPool,
+    WykopAPI,
+    WykopConnector,
+)
+from pywykop3.aio import AsyncWykopAPI, AsyncWykopConnector
+from tests.helpers import MockWykopServer
+
+NAMES = ["alice", "bob", "carol"]
+
+
+class Accounts:
+    """
+    Server with token per key, remembering identity of every request.
+    """
+
+    def __init__(self, throttled: str | None = None) -> None:
+        self.throttled = throttled
+        self.identities: Counter = Counter()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def auth(request) -> tuple:
+        return 200, {"data": {"token": request.json()["data"]["key"]}}
+
+    def _identity(self, request) -> str:
+        identity = request.headers["Authorization"].split()[-1]
+        with self._lock:
+            self.identities[(request.method, identity)] += 1
+        return identity
+
+    def entry(self, request) -> tuple:
+        time.sleep(0.05)
+        if self._identity(request) == self.throttled:
+            return 429, {"error": {"code": 429}}
+        return 200, {"data": {"id": int(request.path_params["id"])}}
+
+    def vote(self, request) -> tuple:
+        self._identity(request)
+        return 204, None
+
+    def routes(self) -> dict:
+        return {
+            ("POST", "auth"): self.auth,
+            ("GET", "entries/{id}"): self.entry,
+            ("POST", "entries/{id}/votes"): self.vote,
+        }
+
+
+def make_pool(server: MockWykopServer, **kwargs) -> ConnectorPool:
+    return ConnectorPool(
+        {
+            name: WykopConnector(name, "secret", url=server.url)
+            for name in NAMES
+        },
+        **kwargs,
+    )
+
+
+def test_reads_are_spread_and_writes_pinned() -> None:
+    accounts = Accounts()
+    with MockWykopServer(accounts.routes()) as server:
+        pool = make_pool(server, writer="bob")
+        api = WykopAPI(connector=pool)
+        with ThreadPoolExecutor(6) as executor:
+            entries = list(executor.map(api.get_entry_by_id, range(1, 13)))
+        assert [entry["id"] for entry in entries] == list(range(1, 13))
+        for name in NAMES:
+            assert accounts.identities[("GET", name)] >= 2
+        api.post_entry_vote(1)
+        api.post_entry_vote(2)
+        assert accounts.identities[("POST", "bob")] == 2
+        pool.set_writer("carol")
+        api.post_entry_vote(3)
+        assert accounts.identities[("POST", "carol")] == 1
+    stats = pool.stats()
+    assert sum(member.requests for member in stats.values()) == 15
+    assert all(member.in_flight == 0 for member in stats.values())
+
+
+def test_throttled_member_is_skipped() -> None:
+    accounts = Accounts(throttled="alice")
+    with MockWykopServer(accounts.routes()) as server:
+        pool = make_pool(server)
+        api = WykopAPI(connector=pool)
+        for entry_id in range(1, 7):
+            assert api.get_entry_by_id(entry_id)["id"] == entry_id
+    assert accounts.identities[("GET", "alice")] == 1
+    stats = pool.stats()
+    assert stats["alice"].throttled == 1
+    assert stats["alice"].cooldown > 0
+
+
+def test_async_pool() -> None:
+    accounts = Accounts()
+
+    async def run(url: str) -> list:
+        async with AsyncConnectorPool(
+            {
+                name: AsyncWykopConnector(name, "secret", url=url)
+                for name in NAMES
+            }
+        ) as pool:
+            api = AsyncWykopAPI(connector=pool)
+            entries = await asyncio.gather(
+                *(api.get_entry_by_id(entry_id) for entry_id in range(1, 7))
+            )
+            await api.post_entry_vote(1)
+            return entries
+
+    with MockWykopServer(accounts.routes()) as server:
+        entries = asyncio.run(run(server.url))
+    assert [entry["id"] for entry in entries] == list(range(1, 7))
+    assert {accounts.identities[("GET", name)] for name in NAMES} == {2}
+    assert accounts.identities[("POST", "alice")] == 1
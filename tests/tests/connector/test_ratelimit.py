@@ -0,0 +1,158 @@
+import asyncio
+import time
+
+import pytest
+
+from pywykop3 import ApiException, WykopAPI, WykopConnector
+from pywykop3.aio import AsyncWykopAPI, AsyncWykopConnector
+from pywykop3.ratelimit import (
+    Budget,
+    RateLimiter,
+    TokenBucket,
+    parse_retry_after,
+)
+from tests.helpers import MockWykopServer
+
+
+def test_token_bucket() -> None:
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after("3") == 3
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+def test_groups_have_separate_budgets() -> None:
+    limiter = RateLimiter(
+        {"media": Budget(1, burst=1)}, default=Budget(100, 100)
+    )
+    assert limiter.group("/media/photos/upload") == "media"
+    assert limiter.group("entries/1") == "default"
+    start = time.perf_counter()
+    limiter.acquire("media/photos")
+    for _ in range(50):
+        limiter.acquire("entries/1")
+    assert time.perf_counter() - start < 0.5
+    stats = limiter.stats()
+    assert stats["media"].requests == 1
+    assert stats["default"].requests == 50
+    assert stats["default"].delayed == 0
+
+
+class Throttling:
+    def __init__(self, times: int) -> None:
+        self.times = times
+
+    def upload(self, _) -> tuple:
+        if self.times:
+            self.times -= 1
+            return 429, {"error": {"code": 429}}, {"Retry-After": "0.2"}
+        return 200, {"data": {"key": "photo"}}
+
+
+def test_retry_after_is_honoured() -> None:
+    throttling = Throttling(times=2)
+    routes = {("POST", "media/photos"): throttling.upload}
+    limiter = RateLimiter(max_retries=3)
+    with MockWykopServer(routes) as server:
+        connector = WykopConnector(
+            "key", "secret", url=server.url, rate_limiter=limiter
+        )
+        api = WykopAPI(connector=connector)
+        start = time.perf_counter()
+        assert api.post_media_photo_by_url("comments", "url") == {
+            "key": "photo"
+        }
+        assert time.perf_counter() - start >= 0.4
+    stats = limiter.stats()["default"]
+    assert stats.throttled == 2
+    assert stats.delayed == 2
+
+
+def test_retries_are_limited() -> None:
+    routes = {("POST", "media/photos"): Throttling(times=10).upload}
+    limiter = RateLimiter(max_retries=1)
+    with MockWykopServer(routes) as server:
+        connector = WykopConnector(
+            "key", "secret", url=server.url, rate_limiter=limiter
+        )
+        with pytest.raises(ApiException) as exc:
+            WykopAPI(connector=connector).post_media_photo_by_url("c", "url")
+        assert exc.value.code == 429
+        assert server.hits[("POST", "media/photos")] == 2
+
+
+def test_async_retry_after_is_honoured() -> None:
+    routes = {("POST", "media/photos"): Throttling(times=1).upload}
+    limiter = RateLimiter()
+
+    async def run(url: str) -> dict:
+        connector = AsyncWykopConnector(
+            "key", "secret", url=url, rate_limiter=limiter
+        )
+        async with AsyncWykopAPI(connector=connector) as api:
+            return await api.post_media_photo_by_url("comments", "url")
+
+    with MockWykopServer(routes) as server:
+        start = time.perf_counter()
+        assert asyncio.run(run(server.url)) == {"key": "photo"}
+        assert time.perf_counter() - start >= 0.2
+    stats = limiter.stats()["default"]
+    assert stats.throttled == 1
+    assert stats.delayed == 1
+    assert stats.wait_time == pytest.approx(0.2, abs=0.05)
+
+
+class Unauthorized:
+    def __init__(self) -> None:
+        self.rejected = False
+
+    def upload(self, _) -> tuple:
+        if not self.rejected:
+            self.rejected = True
+            return 401, {"error": {"code": 401}}
+        return 200, {"data": {"key": "photo"}}
+
+
+def test_unauthorized_replay_is_rate_limited() -> None:
+    routes = {("POST", "media/photos"): Unauthorized().upload}
+    limiter = RateLimiter({"media": Budget(5, burst=1)})
+    with MockWykopServer(routes) as server:
+        connector = WykopConnector(
+            "key", "secret", url=server.url, rate_limiter=limiter
+        )
+        api = WykopAPI(connector=connector)
+        start = time.perf_counter()
+        assert api.post_media_photo_by_url("comments", "url") == {
+            "key": "photo"
+        }
+        # Replay waits for a token of the bucket
+        assert time.perf_counter() - start >= 0.15
+    stats = limiter.stats()["media"]
+    assert (stats.requests, stats.delayed) == (2, 1)
+
+
+def test_async_unauthorized_replay_is_rate_limited() -> None:
+    routes = {("POST", "media/photos"): Unauthorized().upload}
+    limiter = RateLimiter({"media": Budget(5, burst=1)})
+
+    async def run(url: str) -> dict:
+        connector = AsyncWykopConnector(
+            "key", "secret", url=url, rate_limiter=limiter
+        )
+        async with AsyncWykopAPI(connector=connector) as api:
+            return await api.post_media_photo_by_url("comments", "url")
+
+    with MockWykopServer(routes) as server:
+        start = time.perf_counter()
+        assert asyncio.run(run(server.url)) == {"key": "photo"}
+        assert time.perf_counter() - start >= 0.15
+    stats = limiter.stats()["media"]
+    assert (stats.requests, stats.delayed) == (2, 1)
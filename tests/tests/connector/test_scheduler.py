@@ -0,0 +1,101 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from pywykop3 import TagScheduler, TagWatcher, WykopAPI, WykopConnector
+from tests.helpers import MockWykopServer, make_entry
+
+WARSAW = ZoneInfo("Europe/Warsaw")
+START = 1_700_000_000.0
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = START
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Tag:
+    """
+    Tag with a new entry every `period` seconds of `clock`.
+    """
+
+    def __init__(self, clock: Clock, period: float | None) -> None:
+        self.clock = clock
+        self.period = period
+
+    def entries(self) -> list:
+        if self.period is None:
+            return [make_entry(1)]
+        count = int((self.clock.now - START + 3600) // self.period)
+        return [self.entry(entry_id) for entry_id in range(count, 0, -1)]
+
+    def entry(self, entry_id: int) -> dict:
+        created = START - 3600 + entry_id * self.period
+        entry = make_entry(entry_id)
+        entry["created_at"] = datetime.fromtimestamp(created, WARSAW).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+        return entry
+
+    def stream(self, request) -> tuple:
+        page = int(request.query.get("page", 1))
+        data = self.entries()[(page - 1) * 25 : page * 25]
+        return 200, {"data": data, "pagination": {"per_page": 25}}
+
+    def newer(self, request) -> tuple:
+        last_id = int(request.query.get("id", 0))
+        newer = [entry for entry in self.entries() if entry["id"] > last_id]
+        return 200, {"data": {"count": len(newer)}}
+
+
+def test_scheduler_adapts_intervals_within_budget() -> None:
+    clock = Clock()
+    tags = {"hot": Tag(clock, 20.0), "warm": Tag(clock, 600.0)}
+    tags.update({f"dead{i}": Tag(clock, None) for i in range(8)})
+    routes = {}
+    for name, tag in tags.items():
+        routes[("GET", f"tags/{name}/stream")] = tag.stream
+        routes[("GET", f"tags/{name}/newer")] = tag.newer
+    with MockWykopServer(routes) as server:
+        api = WykopAPI(
+            connector=WykopConnector("key", "secret", url=server.url)
+        )
+        scheduler = TagScheduler(
+            TagWatcher(api, tags),
+            budget=0.05,
+            min_interval=10,
+            max_interval=1800,
+            clock=clock,
+        )
+        found = []
+        while clock.now < START + 2 * 3600:
+            found += scheduler.run_once()
+            clock.now = max(scheduler.next_wakeup(), clock.now + 1)
+        requests = server.requests
+
+    # Last poll may overdraw the budget by its cost
+    assert requests <= 0.05 * 2 * 3600 + scheduler.burst + 11
+    schedules = scheduler.schedules
+    assert (
+        schedules["hot"].interval
+        < schedules["warm"].interval
+        < schedules["dead0"].interval
+    )
+    assert schedules["dead0"].interval > 10 * schedules["hot"].interval
+    # Every entry of hot tag is found once
+    hot = [item["id"] for tag, item in found if tag == "hot"]
+    assert len(hot) == len(set(hot)) == schedules["hot"].new_items
+    lags = scheduler.lags()
+    assert lags["dead0"] is None
+    assert lags["hot"] < schedules["hot"].interval
+
+
+@pytest.mark.parametrize("budget", [0, -1.0])
+def test_budget_has_to_be_positive(budget: float) -> None:
+    api = WykopAPI(connector=WykopConnector("key", "secret"))
+    with pytest.raises(ValueError):
+        TagScheduler(TagWatcher(api, ["python"]), budget=budget)
@@ -0,0 +1,49 @@
+import json
+
+from requests.adapters import HTTPAdapter
+
+from pywykop3 import TransportConfig, WykopAPI, WykopConnector
+from tests.helpers import MockWykopServer
+
+
+def test_session_is_pooled() -> None:
+    transport = TransportConfig(pool_maxsize=32, max_retries=2)
+    with MockWykopServer() as server:
+        connector = WykopConnector(
+            "key", "secret", url=server.url, transport=transport
+        )
+    adapter = connector.session.get_adapter("https://wykop.pl/api/v3/")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_maxsize == 32  # pylint: disable=protected-access
+    assert adapter.max_retries.total == 2
+
+
+def test_connection_is_reused() -> None:
+    routes = {
+        ("GET", "tags/python/newer"): lambda _: (200, {"data": {"count": 1}})
+    }
+    with MockWykopServer(routes) as server:
+        with WykopConnector("key", "secret", url=server.url) as connector:
+            api = WykopAPI(connector=connector)
+            for _ in range(20):
+                assert api.get_tag_newer("python") == 1
+    assert server.connections == 1
+
+
+def test_custom_decoder() -> None:
+    calls = []
+
+    def decoder(raw: bytes):
+        calls.append(raw)
+        return json.loads(raw)
+
+    routes = {
+        ("GET", "tags/popular"): lambda _: (200, {"data": [{"name": "python"}]})
+    }
+    with MockWykopServer(routes) as server:
+        connector = WykopConnector(
+            "key", "secret", url=server.url, decoder=decoder
+        )
+        res = connector.request("GET", "tags/popular")
+    assert res.data == [{"name": "python"}]
+    assert calls == [b'{"data": [{"name": "python"}]}']
@@ -0,0 +1,86 @@
+from pywykop3 import JsonCursorStore, TagWatcher, WykopAPI, WykopConnector
+from tests.helpers import MockWykopServer, make_entry
+
+PER_PAGE = 5
+
+
+class Tag:
+    """
+    Tag stream with newest entries first and numeric pagination.
+    """
+
+    def __init__(self, count: int) -> None:
+        self.last_id = count
+
+    def add(self, count: int) -> None:
+        self.last_id += count
+
+    def stream(self, request) -> tuple:
+        page = int(request.query.get("page", 1))
+        stop = self.last_id - (page - 1) * PER_PAGE
+        ids = range(stop, max(stop - PER_PAGE, 0), -1)
+        return 200, {
+            "data": [make_entry(entry_id) for entry_id in ids],
+            "pagination": {"per_page": PER_PAGE, "total": self.last_id},
+        }
+
+    def newer(self, request) -> tuple:
+        last_id = int(request.query.get("id", 0))
+        return 200, {"data": {"count": max(self.last_id - last_id, 0)}}
+
+
+def make_server(tags: dict) -> MockWykopServer:
+    routes = {}
+    for name, tag in tags.items():
+        routes[("GET", f"tags/{name}/stream")] = tag.stream
+        # Looked up on every request, so tests can replace it
+        routes[("GET", f"tags/{name}/newer")] = (
+            lambda request, tag=tag: tag.newer(request)
+        )
+    return MockWykopServer(routes)
+
+
+def item_ids(items: list) -> list:
+    return [item["id"] for item in items]
+
+
+def test_watcher_emits_only_new_items(tmp_path) -> None:
+    tags = {"python": Tag(20), "rust": Tag(3)}
+    path = tmp_path / "cursors.json"
+    with make_server(tags) as server:
+        api = WykopAPI(
+            connector=WykopConnector("key", "secret", url=server.url)
+        )
+        watcher = TagWatcher(api, tags, store=JsonCursorStore(path))
+        assert watcher.poll() == {"python": [], "rust": []}
+
+        # Nothing changed, only newer counts are requested
+        requests = server.requests
+        assert watcher.poll() == {"python": [], "rust": []}
+        assert server.requests == requests + 2
+
+        tags["python"].add(7)
+        result = watcher.poll()
+        assert item_ids(result["python"]) == list(range(21, 28))
+        assert result["rust"] == []
+        assert server.hits[("GET", "tags/python/stream")] == 3
+
+        # Cursor is restored from file by new watcher
+        tags["rust"].add(1)
+        watcher = TagWatcher(api, ["rust"], store=JsonCursorStore(path))
+        assert item_ids(watcher.poll()["rust"]) == [4]
+
+
+def test_watcher_stops_on_seen_item() -> None:
+    tag = Tag(10)
+    with make_server({"python": tag}) as server:
+        api = WykopAPI(
+            connector=WykopConnector("key", "secret", url=server.url)
+        )
+        watcher = TagWatcher(api, ["python"], emit_initial=True)
+        assert item_ids(watcher.poll_tag("python")) == list(range(6, 11))
+        tag.add(2)
+        # Newer count is overestimated, seen items are not emitted again
+        tag.newer = lambda _: (200, {"data": {"count": 10}})
+        assert item_ids(watcher.poll_tag("python")) == [11, 12]
+        assert watcher.poll_tag("python") == []
@@ -8,6 +8,7 @@ from pywykop3 import ApiException
 from tests.helpers.utils import run_function_with_retry
 
 
+@pytest.mark.network
 def test_upload_foto(media_helper) -> None:
     photo = media_helper.upload_photo()
     response = requests.get(photo["url"], timeout=30)
@@ -16,6 +17,7 @@ def test_upload_foto(media_helper) -> None:
     ), f"Response status code is {response.status_code}"
 
 
+@pytest.mark.network
 @pytest.mark.parametrize(
     "url", ["https://upload.wikimedia.org/wikipedia/commons/3/3a/Cat03.jpg"]
 )
@@ -27,6 +29,7 @@ def test_upload_foto_with_url(media_helper, url) -> None:
     ), f"Response status code is {response.status_code}"
 
 
+@pytest.mark.network
 def test_delete_foto(media_helper) -> None:
     photo = media_helper.get_or_upload_photo()
     try:
@@ -0,0 +1,132 @@
+import asyncio
+import io
+import threading
+
+from pywykop3 import MediaCache
+from pywykop3.aio import AsyncWykopAPI, AsyncWykopConnector
+from pywykop3.media_cache import content_digest, normalize_url
+from tests.helpers import FakeWykop, make_api
+
+UPLOAD = ("POST", "media/photos/upload")
+UPLOAD_BY_URL = ("POST", "media/photos")
+
+
+def test_content_digest_is_the_same_for_all_sources(tmp_path) -> None:
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(b"x" * 200_000)
+    file = io.BytesIO(b"head" + b"x" * 200_000)
+    file.seek(4)
+    digest = content_digest(b"x" * 200_000)
+    assert content_digest(path) == content_digest(str(path)) == digest
+    assert content_digest(file) == digest
+    assert file.tell() == 4
+
+
+def test_normalize_url() -> None:
+    assert (
+        normalize_url("HTTPS://Example.com:443/a.jpg?b=2&a=1#top")
+        == "https://example.com/a.jpg?a=1&b=2"
+    )
+    assert (
+        normalize_url("http://example.com:8080") == "http://example.com:8080/"
+    )
+
+
+def test_uploads_are_reused_until_deleted(tmp_path) -> None:
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(b"\xff\xd8" + b"x" * 1000)
+    fake = FakeWykop()
+    db = tmp_path / "media.db"
+    with fake.server() as server:
+        api = make_api(server, logged_in=True, media_cache=MediaCache(db))
+        photo = api.post_media_photo("comments", path)
+        assert api.post_media_photo("comments", path.read_bytes()) == photo
+        # Other media type is uploaded separately
+        assert api.post_media_photo("content", path)["key"] != photo["key"]
+        assert server.hits[UPLOAD] == 2
+
+        url = "https://example.com/cat.jpg?b=1&a=2"
+        by_url = api.post_media_photo_by_url("comments", url)
+        assert (
+            api.post_media_photo_by_url(
+                "comments", "https://EXAMPLE.com/cat.jpg?a=2&b=1"
+            )
+            == by_url
+        )
+        assert server.hits[UPLOAD_BY_URL] == 1
+
+        # Cache is persistent
+        api = make_api(server, logged_in=True, media_cache=MediaCache(db))
+        assert api.post_media_photo("comments", path) == photo
+        assert api.media_cache.stats.hits == 1
+
+        api.delete_media_photo(photo["key"])
+        assert api.post_media_photo("comments", path)["key"] != photo["key"]
+        assert server.hits[UPLOAD] == 3
+
+
+def test_expired_uploads_are_not_reused() -> None:
+    fake = FakeWykop()
+    with fake.server() as server:
+        api = make_api(server, logged_in=True, media_cache=MediaCache(ttl=0))
+        api.post_media_photo("comments", b"abc", "a.jpg")
+        api.post_media_photo("comments", b"abc", "a.jpg")
+        assert server.hits[UPLOAD] == 2
+
+
+def test_async_uploads_are_reused() -> None:
+    async def run(url: str) -> list:
+        connector = AsyncWykopConnector(refresh_token="refresh", url=url)
+        api = AsyncWykopAPI(connector=connector, media_cache=MediaCache())
+        async with api:
+            first = await api.post_media_photo("comments", b"abc", "a.jpg")
+            second = await api.post_media_photo("comments", b"abc", "a.jpg")
+            await api.delete_media_photo(first["key"])
+            third = await api.post_media_photo("comments", b"abc", "a.jpg")
+            return [first, second, third]
+
+    fake = FakeWykop()
+    with fake.server() as server:
+        first, second, third = asyncio.run(run(server.url))
+        assert first == second != third
+        assert server.hits[UPLOAD] == 2
+
+
+class ThreadRecordingCache(MediaCache):
+    """
+    Media cache recording threads it is used from.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.threads: set = set()
+
+    def get(self, source, media_type):
+        self.threads.add(threading.get_ident())
+        return super().get(source, media_type)
+
+    def store(self, source, media_type, photo):
+        self.threads.add(threading.get_ident())
+        super().store(source, media_type, photo)
+
+    def invalidate(self, photo_key):
+        self.threads.add(threading.get_ident())
+        super().invalidate(photo_key)
+
+
+def test_async_cache_is_not_used_in_event_loop() -> None:
+    cache = ThreadRecordingCache()
+
+    async def run(url: str) -> None:
+        connector = AsyncWykopConnector(refresh_token="refresh", url=url)
+        async with AsyncWykopAPI(connector=connector, media_cache=cache) as api:
+            photo = await api.post_media_photo("comments", b"abc", "a.jpg")
+            await api.post_media_photo("comments", b"abc", "a.jpg")
+            await api.post_media_photo_by_url("comments", "https://a.pl/b.png")
+            await api.delete_media_photo(photo["key"])
+
+    fake = FakeWykop()
+    with fake.server() as server:
+        asyncio.run(run(server.url))
+    assert cache.threads
+    assert threading.get_ident() not in cache.threads
@@ -0,0 +1,162 @@
+import asyncio
+import email
+import io
+import tracemalloc
+
+import pytest
+
+from pywykop3 import MultipartBody
+from pywykop3.aio import AsyncWykopAPI, AsyncWykopConnector
+from tests.helpers import MockWykopServer, make_api
+
+UPLOAD = ("POST", "media/photos/upload")
+
+
+class Uploads:
+    """
+    Upload route parsing multipart body, optionally answering with 401
+    to the first request.
+    """
+
+    def __init__(self, unauthorized: bool = False) -> None:
+        self.unauthorized = unauthorized
+
+    def upload(self, request) -> tuple:
+        if self.unauthorized:
+            self.unauthorized = False
+            return 401, {"error": {"message": "Unauthorized"}}
+        assert int(request.headers["Content-Length"]) == len(request.body)
+        message = email.message_from_bytes(
+            b"Content-Type: "
+            + request.headers["Content-Type"].encode()
+            + b"\r\n\r\n"
+            + request.body
+        )
+        (part,) = message.get_payload()
+        content = part.get_payload(decode=True)
+        return 200, {
+            "data": {
+                "key": part.get_filename(),
+                "mime_type": part.get_content_type(),
+                "size": len(content),
+                "head": content[:4].decode("latin-1"),
+            }
+        }
+
+
+def test_multipart_body_matches_content() -> None:
+    files = {"file": ("a.jpg", io.BytesIO(b"x" * 100_000), "image/jpeg")}
+    body = MultipartBody(files)
+    data = body.read()
+    assert len(data) == len(body)
+    assert data.count(b"x") == 100_000
+    body.seek(0)
+    assert b"".join(iter(lambda: body.read(777), b"")) == data
+
+
+def test_upload_path_and_file_object(tmp_path) -> None:
+    path = tmp_path / "photo.png"
+    path.write_bytes(b"\x89PNG" + b"x" * 1000)
+    with MockWykopServer({UPLOAD: Uploads().upload}) as server:
+        api = make_api(server)
+        photo = api.post_media_photo("comments", path)
+        assert photo == {
+            "key": "photo.png",
+            "mime_type": "image/png",
+            "size": 1004,
+            "head": "\x89PNG",
+        }
+        with open(path, "rb") as file:
+            file.seek(4)
+            photo = api.post_media_photo("comments", file, "a.jpg")
+        assert photo["size"] == 1000
+        assert photo["mime_type"] == "image/jpeg"
+
+
+@pytest.mark.parametrize(
+    "content, name, mime_type",
+    [
+        (b"\xff\xd8\xff\xe0", "photo.jpg", "image/jpeg"),
+        (b"\x89PNG\r\n", "photo.png", "image/png"),
+        (b"GIF89a", "photo.gif", "image/gif"),
+        (b"abcd", "photo", "application/octet-stream"),
+    ],
+)
+def test_upload_type_of_unnamed_photo(
+    content: bytes, name: str, mime_type: str
+) -> None:
+    with MockWykopServer({UPLOAD: Uploads().upload}) as server:
+        api = make_api(server)
+        for source in (content, io.BytesIO(content)):
+            photo = api.post_media_photo("comments", source)
+            assert photo["key"] == name
+            assert photo["mime_type"] == mime_type
+            assert photo["size"] == len(content)
+
+
+def test_upload_is_replayed_after_401(tmp_path) -> None:
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(b"x" * 300_000)
+    routes = {UPLOAD: Uploads(unauthorized=True).upload}
+    with MockWykopServer(routes) as server:
+        photo = make_api(server).post_media_photo("comments", path)
+        assert photo["size"] == 300_000
+        assert server.hits[UPLOAD] == 2
+
+
+def test_upload_does_not_read_whole_file(tmp_path) -> None:
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(b"x" * 20 * 2**20)
+    with MockWykopServer({UPLOAD: Uploads().upload}) as server:
+        api = make_api(server)
+        tracemalloc.start()
+        try:
+            api.post_media_photo("comments", path)
+            # Server thread keeps its copy of the body, measure client only
+            peak = max(
+                stat.size
+                for stat in tracemalloc.take_snapshot()
+                .filter_traces([tracemalloc.Filter(False, "*mock_server*")])
+                .statistics("lineno")
+            )
+        finally:
+            tracemalloc.stop()
+    assert peak < 2**20
+
+
+def test_bulk_upload(tmp_path) -> None:
+    paths = []
+    for index in range(5):
+        paths.append(tmp_path / f"{index}.jpg")
+        paths[-1].write_bytes(b"x" * index)
+    paths.insert(2, tmp_path / "missing.jpg")
+    with MockWykopServer({UPLOAD: Uploads().upload}, latency=0.1) as server:
+        results = make_api(server).post_media_photos(
+            "comments", paths, workers=3
+        )
+    assert [result.source for result in results] == paths
+    assert not results[2].ok
+    assert isinstance(results[2].error, FileNotFoundError)
+    sizes = [result.photo["size"] for result in results if result.ok]
+    assert sizes == [0, 1, 2, 3, 4]
+
+
+def test_async_upload(tmp_path) -> None:
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(b"x" * 100_000)
+
+    async def run(url: str) -> list:
+        connector = AsyncWykopConnector("key", "secret", url=url)
+        async with AsyncWykopAPI(connector=connector) as api:
+            photo = await api.post_media_photo("comments", path)
+            results = await api.post_media_photos(
+                "comments", [path, tmp_path / "missing.jpg", b"abc"]
+            )
+            return [photo] + results
+
+    routes = {UPLOAD: Uploads(unauthorized=True).upload}
+    with MockWykopServer(routes) as server:
+        photo, *results = asyncio.run(run(server.url))
+    assert photo["size"] == 100_000
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[2].photo["key"] == "photo"
@@ -0,0 +1,121 @@
+import gzip
+import json
+from pathlib import Path
+
+from pywykop3.crawler import (
+    Crawler,
+    CrawlTask,
+    checkpoint_path,
+    crawl_task,
+    load_checkpoint,
+    main,
+    make_tasks,
+    month_range,
+    output_path,
+)
+from tests.helpers import FakeWykop
+
+
+def read_ids(path: Path) -> list:
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        return [json.loads(line)["id"] for line in file]
+
+
+def test_make_tasks_splits_months() -> None:
+    assert month_range("2023-11", "2024-02") == [
+        (2023, 11),
+        (2023, 12),
+        (2024, 1),
+        (2024, 2),
+    ]
+    tasks = make_tasks(["a", "b"], "2023-12", "2024-01")
+    assert [task.name for task in tasks] == [
+        "a-2023-12",
+        "a-2024-01",
+        "b-2023-12",
+        "b-2024-01",
+    ]
+    assert make_tasks(["a"]) == [CrawlTask("a")]
+
+
+def test_killed_crawl_resumes_from_checkpoint(tmp_path: Path) -> None:
+    fake = FakeWykop(stream_size=200, per_page=10)
+    task = CrawlTask("python")
+    with fake.server() as server:
+        kwargs = {"key": "key", "secret": "secret", "url": server.url}
+        result = crawl_task(
+            task, tmp_path, kwargs, checkpoint_pages=3, max_pages=7
+        )
+        assert (result.items, result.finished) == (70, False)
+        checkpoint = load_checkpoint(tmp_path, task)
+        assert (checkpoint.page, checkpoint.items) == (8, 70)
+        # Worker killed while writing pages after the checkpoint
+        with open(output_path(tmp_path, task), "ab") as file:
+            file.write(gzip.compress(b'{"id": 71}\n')[:-5])
+        result = crawl_task(task, tmp_path, kwargs, checkpoint_pages=3)
+        assert (result.items, result.finished) == (130, True)
+        hits = server.hits[("GET", "tags/python/stream")]
+        # Finished task is skipped
+        crawl_task(task, tmp_path, kwargs)
+        assert server.hits[("GET", "tags/python/stream")] == hits
+    assert read_ids(output_path(tmp_path, task)) == list(range(1, 201))
+    assert load_checkpoint(tmp_path, task).items == 200
+
+
+def test_crawler_shards_tasks_across_processes(tmp_path: Path) -> None:
+    fake = FakeWykop(stream_size=60)
+    with fake.server() as server:
+        report = Crawler(
+            make_tasks(["python", "java"], "2023-12", "2024-01"),
+            tmp_path,
+            {"key": "key", "secret": "secret", "url": server.url},
+            processes=2,
+        ).run()
+    assert report.items == 4 * 60
+    assert len(report.results) == 4
+    assert all(result.finished for result in report.results)
+    assert report.items_per_second > 0
+    assert 1 <= len(report.per_worker()) <= 2
+    for name in ["python-2023-12", "java-2024-01"]:
+        assert read_ids(tmp_path / f"{name}.jsonl.gz") == list(range(1, 61))
+
+
+def test_failed_task_is_reported(tmp_path: Path) -> None:
+    fake = FakeWykop(stream_size=30)
+    tasks = make_tasks(["python", "java", "rust"])
+    checkpoint_path(tmp_path, tasks[1]).write_text("{", encoding="utf-8")
+    with fake.server() as server:
+        report = Crawler(
+            tasks,
+            tmp_path,
+            {"key": "key", "secret": "secret", "url": server.url},
+            processes=2,
+        ).run()
+    # Other tasks are crawled
+    assert len(report.results) == 3
+    assert report.items == 2 * 30
+    assert [result.task for result in report.failed] == [tasks[1]]
+    assert isinstance(report.failed[0].error, ValueError)
+    assert all(result.finished for result in report.results if result.ok)
+
+
+def test_main(tmp_path: Path) -> None:
+    fake = FakeWykop(stream_size=30)
+    # Broken checkpoint fails second tag
+    checkpoint_path(tmp_path, CrawlTask("java")).write_text("{", "utf-8")
+    with fake.server() as server:
+        args = [
+            "--out",
+            str(tmp_path),
+            "--processes",
+            "1",
+            "--key",
+            "key",
+            "--secret",
+            "secret",
+            "--url",
+            server.url,
+        ]
+        assert main(["python", *args]) == 0
+        assert main(["python", "java", *args]) == 1
+    assert read_ids(tmp_path / "python.jsonl.gz") == list(range(1, 31))
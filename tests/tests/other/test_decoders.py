@@ -0,0 +1,23 @@
+import importlib.util
+import json
+
+import pytest
+
+from pywykop3.decoders import get_decoder, stdlib_decoder
+
+RAW = json.dumps({"data": [{"content": "zażółć"}]}).encode()
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_decoders(name: str) -> None:
+    if name != "json" and importlib.util.find_spec(name) is None:
+        with pytest.raises(ValueError):
+            get_decoder(name)
+        return
+    assert get_decoder(name)(RAW) == {"data": [{"content": "zażółć"}]}
+
+
+def test_default_decoder() -> None:
+    assert get_decoder()(RAW) == stdlib_decoder(RAW)
+    with pytest.raises(ValueError):
+        get_decoder("yaml")
@@ -0,0 +1,116 @@
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from pywykop3.export import JsonlWriter, ParquetWriter, export, flatten_item
+from pywykop3.models import Entry
+from tests.helpers import FakeWykop, make_api, make_comment, make_entry
+
+
+def read_lines(path: Path) -> list:
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
+
+
+def test_tag_stream_exported_to_gzip(tmp_path: Path) -> None:
+    fake = FakeWykop(stream_size=120)
+    path = tmp_path / "python.jsonl.gz"
+    with fake.server() as server:
+        api = make_api(server)
+        written = export(
+            api.iter_tag_stream("python", sort="all"),
+            JsonlWriter(path, batch_size=50),
+        )
+    assert written == 120
+    assert [item["id"] for item in read_lines(path)] == list(range(1, 121))
+
+
+def test_items_are_written_in_batches(tmp_path: Path) -> None:
+    path = tmp_path / "items.jsonl"
+    writer = JsonlWriter(path, batch_size=10)
+    for item_id in range(25):
+        writer.write({"id": item_id})
+    assert writer.items == 20
+    assert len(read_lines(path)) == 20
+    writer.close()
+    assert len(read_lines(path)) == 25
+
+
+def test_interrupted_export_is_flushed(tmp_path: Path) -> None:
+    path = tmp_path / "items.jsonl.gz"
+
+    def items():
+        for item_id in range(15):
+            yield {"id": item_id}
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        export(items(), JsonlWriter(path, batch_size=10))
+    # Gzip trailer was written, so file is complete
+    assert len(read_lines(path)) == 15
+
+
+def test_models_are_exported(tmp_path: Path) -> None:
+    fake = FakeWykop(stream_size=30)
+    path = tmp_path / "comments.jsonl"
+    with fake.server() as server:
+        api = make_api(server, use_models=True)
+        export(api.iter_entry_comments(1), JsonlWriter(path))
+    lines = read_lines(path)
+    assert lines
+    assert set(lines[0]) >= {"id", "author", "content", "votes_up"}
+
+
+def test_zstd(tmp_path: Path) -> None:
+    zstandard = pytest.importorskip("zstandard")
+    path = tmp_path / "items.jsonl.zst"
+    export(({"id": item_id} for item_id in range(5)), JsonlWriter(path))
+    raw = zstandard.ZstdDecompressor().stream_reader(path.read_bytes()).read()
+    assert [json.loads(line)["id"] for line in raw.splitlines()] == [
+        0,
+        1,
+        2,
+        3,
+        4,
+    ]
+
+
+def test_parquet(tmp_path: Path) -> None:
+    parquet = pytest.importorskip("pyarrow.parquet")
+    fake = FakeWykop(stream_size=60)
+    path = tmp_path / "python.parquet"
+    with fake.server() as server:
+        api = make_api(server)
+        export(
+            api.iter_tag_stream("python", sort="all"),
+            ParquetWriter(path, batch_size=25),
+        )
+    file = parquet.ParquetFile(path)
+    assert file.metadata.num_rows == 60
+    assert file.metadata.num_row_groups == 3
+    table = file.read(columns=["id", "author", "tags"])
+    assert table.column("id").to_pylist() == list(range(1, 61))
+    assert table.column("tags").to_pylist()[0] == [
+        "python",
+        "programowanie",
+        "wykop",
+    ]
+
+
+def test_flatten_item() -> None:
+    row = flatten_item(make_entry(3))
+    assert row == flatten_item(Entry.from_dict(make_entry(3))) | {
+        "data": row["data"]
+    }
+    assert (row["id"], row["comments_count"], row["votes_up"]) == (3, 12, 3)
+    assert json.loads(row["data"])["slug"] == "wpis-3"
+    comment = flatten_item(make_comment(5, 51), keep_data=False)
+    assert (comment["parent_id"], comment["data"]) == (5, None)
+
+
+def test_unknown_compression(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        JsonlWriter(tmp_path / "items.jsonl", compression="lzma")
@@ -0,0 +1,30 @@
+import pytest
+
+from pywykop3.metrics import Histogram, Metrics
+
+
+def test_histogram_quantiles() -> None:
+    histogram = Histogram((1.0, 2.0, 4.0))
+    for value in [0.5] * 50 + [1.5] * 45 + [3.0] * 5:
+        histogram.observe(value)
+    assert histogram.quantile(0.5) == pytest.approx(1.0)
+    assert 1.0 < histogram.quantile(0.95) <= 2.0
+    assert 2.0 < histogram.quantile(0.99) <= 4.0
+    assert list(histogram.cumulative()) == [
+        ("1", 50),
+        ("2", 95),
+        ("4", 100),
+        ("+Inf", 100),
+    ]
+    assert Histogram().quantile(0.5) == 0
+
+
+def test_templates() -> None:
+    metrics = Metrics()
+    assert metrics.template("/entries/123") == "entries/{id}"
+    assert metrics.template("entries/1/comments/2") == (
+        "entries/{id}/comments/{comment_id}"
+    )
+    assert metrics.template("tags/popular") == "tags/popular"
+    assert metrics.template("tags/python/stream") == "tags/{tag}/stream"
+    assert metrics.template("links/1/comments") == "links/{other}"
@@ -0,0 +1,38 @@
+import pytest
+
+from pywykop3.models import Comment, Entry, Model, Photo, User, convert
+from tests.helpers import make_entry, make_user
+
+
+def test_entry_from_dict() -> None:
+    entry = Entry.from_dict(make_entry(3))
+    assert entry.id == 3
+    assert entry.author == User.from_dict(make_user(3))
+    assert entry.author.rank == 21
+    assert entry.tags == ("python", "programowanie", "wykop")
+    assert (entry.votes_up, entry.comments_count) == (3, 12)
+    assert [comment.id for comment in entry.comments] == [30, 31]
+    assert isinstance(entry.comments[0], Comment)
+    assert isinstance(entry.photo, Photo)
+    assert entry.photo.key == "photo3"
+    assert Entry.from_dict(make_entry(1)).photo is None
+
+
+def test_models_have_slots() -> None:
+    entry = Entry.from_dict(make_entry(1))
+    assert not hasattr(entry, "__dict__")
+    assert not hasattr(entry.author, "__dict__")
+
+
+def test_model_requires_from_dict() -> None:
+    class Incomplete(Model):  # pylint: disable=abstract-method
+        __slots__ = ()
+
+    with pytest.raises(TypeError):
+        Incomplete()  # pylint: disable=abstract-class-instantiated
+
+
+def test_convert() -> None:
+    entries = convert([make_entry(1), make_entry(2)], Entry)
+    assert entries == [Entry.from_dict(make_entry(i)) for i in (1, 2)]
+    assert convert(5, Entry) == 5
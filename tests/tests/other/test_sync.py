@@ -0,0 +1,164 @@
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from pywykop3 import Mirror, SqliteStore, WykopAPI, WykopConnector
+from pywykop3.models import Entry
+from tests.helpers import FakeWykop, MockWykopServer, make_entry
+
+STREAM = ("GET", "tags/python/stream")
+
+
+def make_mirror(url: str, path, **kwargs) -> Mirror:
+    connector = WykopConnector("key", "secret", url=url)
+    return Mirror(WykopAPI(connector=connector, **kwargs), SqliteStore(path))
+
+
+class Stream:
+    """
+    Tag stream, newest first, to which new entries can be added.
+    """
+
+    def __init__(self, count: int, per_page: int = 5) -> None:
+        self.per_page = per_page
+        self.entries: list = []
+        self.last_id = 0
+        self.add(count)
+
+    def add(self, count: int) -> None:
+        start = datetime(2023, 3, 1)
+        for _ in range(count):
+            self.last_id += 1
+            entry_id = self.last_id
+            entry = make_entry(entry_id)
+            created = start + timedelta(minutes=entry_id)
+            entry["created_at"] = created.strftime("%Y-%m-%d %H:%M:%S")
+            self.entries.insert(0, entry)
+
+    def page(self, request) -> tuple:
+        page = int(request.query.get("page", 1))
+        start = (page - 1) * self.per_page
+        data = self.entries[start : start + self.per_page]
+        return 200, {"data": data, "pagination": {"total": len(self.entries)}}
+
+
+def synced_ids(mirror: Mirror) -> list:
+    rows = mirror.store.query("SELECT id FROM entries ORDER BY id")
+    return [row[0] for row in rows]
+
+
+def test_sync_resumes_and_continues_incrementally(tmp_path) -> None:
+    path = tmp_path / "wykop.db"
+    fake = FakeWykop(stream_size=60, per_page=10)
+    with fake.server() as server:
+        mirror = make_mirror(server.url, path)
+        assert mirror.sync_tag("python", max_pages=2) == 20
+        assert mirror.store.get_cursor("tag:python") == (3, False)
+        mirror.store.close()
+
+        # Interrupted sync resumes from stored page
+        mirror = make_mirror(server.url, path)
+        assert mirror.sync_tag("python") == 40
+        assert server.hits[STREAM] == 7
+        assert mirror.store.get_cursor("tag:python") == (None, True)
+
+        # Only the first page is fetched when nothing changed
+        assert mirror.sync_tag("python") == 10
+        assert server.hits[STREAM] == 8
+
+    rows = mirror.store.query(
+        "SELECT COUNT(*) FROM entries JOIN entry_tags USING (resource, id)"
+        " WHERE tag = ?",
+        ("python",),
+    )
+    assert rows == [(60,)]
+
+
+def test_sync_comments(tmp_path) -> None:
+    fake = FakeWykop(stream_size=60, per_page=10)
+    with fake.server() as server:
+        mirror = make_mirror(server.url, tmp_path / "wykop.db")
+        mirror.sync_tag("python", max_pages=1, with_comments=True)
+        store = mirror.store
+        assert store.query("SELECT COUNT(*) FROM comments") == [(120,)]
+        assert store.get_cursor("comments:1") == (2, True)
+
+        # Other tag with the same entries, comments are not fetched again
+        requests = server.requests
+        mirror.sync_tag("rust", with_comments=True, max_pages=1)
+        assert server.requests == requests + 1
+
+        # Comments sync resumes from the last page
+        assert mirror.sync_comments(1) == 2
+
+    authors = store.query(
+        "SELECT author, COUNT(*) FROM comments GROUP BY author"
+    )
+    assert sum(count for _, count in authors) == 120
+
+
+def test_limited_catch_up_resumes_until_mark(tmp_path) -> None:
+    stream = Stream(10)
+    with MockWykopServer({STREAM: stream.page}) as server:
+        mirror = make_mirror(server.url, tmp_path / "wykop.db")
+        assert mirror.sync_tag("python") == 10
+        stream.add(20)
+        # Catch-up limited to one page stores its cursor, mark stays
+        assert mirror.sync_tag("python", max_pages=1) == 5
+        assert mirror.store.get_cursor("tag:python") == (2, False)
+        assert mirror.store.get_marks("tag:python")[0]["id"] == 10
+        mirror.sync_tag("python", max_pages=2)
+        assert mirror.sync_tag("python") == 10
+        assert synced_ids(mirror) == list(range(1, 31))
+        assert mirror.store.get_cursor("tag:python") == (None, True)
+        assert mirror.store.get_marks("tag:python") == (
+            {
+                "resource": "entry",
+                "id": 30,
+                "created_at": stream.entries[0]["created_at"],
+            },
+            None,
+        )
+
+
+def test_catch_up_stops_after_deleted_mark(tmp_path) -> None:
+    stream = Stream(10)
+    with MockWykopServer({STREAM: stream.page}) as server:
+        mirror = make_mirror(server.url, tmp_path / "wykop.db")
+        mirror.sync_tag("python")
+        del stream.entries[0]
+        stream.add(3)
+        requests = server.hits[STREAM]
+        assert mirror.sync_tag("python") == 5
+        assert server.hits[STREAM] == requests + 1
+    assert synced_ids(mirror) == list(range(1, 14))
+    assert mirror.store.get_marks("tag:python")[0]["id"] == 13
+
+
+def test_sync_with_models_api(tmp_path) -> None:
+    fake = FakeWykop(stream_size=30, per_page=10)
+    with fake.server() as server:
+        mirror = make_mirror(server.url, tmp_path / "wykop.db", use_models=True)
+        assert mirror.sync_tag("python", with_comments=True) == 30
+        assert mirror.sync_entries(max_pages=1) == 10
+    assert mirror.store.query("SELECT COUNT(*) FROM comments") == [(360,)]
+    with pytest.raises(TypeError):
+        mirror.store.store_entries([Entry.from_dict(make_entry(1))])
+
+
+def test_old_cursors_table_is_migrated(tmp_path) -> None:
+    path = tmp_path / "wykop.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute(
+            "CREATE TABLE cursors (source TEXT PRIMARY KEY, page TEXT,"
+            " finished INTEGER NOT NULL DEFAULT 0, updated_at REAL NOT NULL)"
+        )
+        connection.execute(
+            "INSERT INTO cursors VALUES ('tag:python', 'null', 1, 0)"
+        )
+    connection.close()
+    store = SqliteStore(path)
+    assert store.get_cursor("tag:python") == (None, True)
+    assert store.get_marks("tag:python") == (None, None)
+    store.close()
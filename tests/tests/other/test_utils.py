@@ -1,4 +1,5 @@
-from pywykop3.utils import NotEmptyDict
+from pywykop3.models import Entry
+from pywykop3.utils import NotEmptyDict, field_of, match_template
 
 
 def test_not_empty_dict() -> None:
@@ -7,3 +8,22 @@ def test_not_empty_dict() -> None:
     for key, value in base.items():
         not_empty[key] = value
     assert not_empty == {"1": "1", "2": 2, "3": 3, "6": 6}
+
+
+def test_match_template() -> None:
+    templates = ["tags/{}", "tags/popular", "entries/{}/comments"]
+    assert match_template("tags/python", templates) == "tags/{}"
+    assert match_template("tags/popular", templates) == "tags/popular"
+    assert match_template("/entries/1/comments", templates) == (
+        "entries/{}/comments"
+    )
+    assert match_template("entries/1", templates) is None
+    assert match_template("entries/1", ["entries/{id}"]) == "entries/{id}"
+
+
+def test_field_of() -> None:
+    item = {"id": 1, "created_at": "2023-03-01 12:00:00"}
+    assert field_of(item, "id") == 1
+    assert field_of(Entry.from_dict(item), "created_at") == item["created_at"]
+    assert field_of(item, "missing") is None
+    assert field_of(Entry.from_dict(item), "missing") is None